@@ -0,0 +1,29 @@
+"""add_content_sha256_to_documents
+
+Revision ID: b3f5c8d2e1a7
+Revises: a496b2854b78
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f5c8d2e1a7"
+down_revision: Union[str, Sequence[str], None] = "a496b2854b78"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add content_sha256 column to documents table."""
+    op.add_column("documents", sa.Column("content_sha256", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove content_sha256 column from documents table."""
+    op.drop_column("documents", "content_sha256")
@@ -10,6 +10,7 @@ from sqlalchemy.orm import selectinload
 
 from app.database import get_db
 from app.models.conversation import Conversation
+from app.models.document import Document
 from app.models.message import Message
 from app.models.user import User
 from app.schemas.conversation import (
@@ -18,6 +19,7 @@ from app.schemas.conversation import (
     ConversationUpdate,
     ConversationWithMessages,
 )
+from app.services.ocr_service import forget_cached_text
 from app.users import current_active_user
 
 router = APIRouter()
@@ -196,6 +198,12 @@ async def delete_conversation(
             detail="Not authorized to delete this conversation",
         )
 
+    # Documents are deleted by cascade; remove their cached OCR text (personal data) as well
+    content_sha256s = await db.scalars(
+        select(Document.content_sha256).where(Document.conversation_id == conversation_id)
+    )
+    await forget_cached_text(content_sha256s.all())
+
     await db.delete(conversation)
     await db.commit()
 
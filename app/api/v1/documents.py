@@ -1,5 +1,6 @@
 """Documents API - Upload, retrieve, and delete documents"""
 
+import asyncio
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
@@ -10,6 +11,7 @@ from app.database import get_db
 from app.models.document import Document, OCRStatus, UploadStatus
 from app.models.user import User
 from app.schemas.document import DocumentListResponse, DocumentResponse, DocumentUpdate
+from app.services.ocr_service import forget_cached_text
 from app.services.storage_service import StorageService, get_storage_service
 from app.users import current_active_user
 
@@ -115,16 +117,20 @@ async def upload_document(
 
         # Run OCR if requested
         if run_ocr:
-            from app.services.ocr_service import get_ocr_service
+            from app.services.ocr_service import content_digest, get_ocr_service
 
             ocr_service = get_ocr_service()
             document.ocr_status = OCRStatus.PROCESSING
+            # Recorded so deleting the document also removes its cached OCR text
+            document.content_sha256 = await asyncio.to_thread(content_digest, file_content)
 
             try:
                 ocr_text = await ocr_service.extract_text_from_bytes(
                     file_content=file_content,
                     file_type=file_type,
                     filename=document.filename,
+                    document_url=s3_url,
+                    content_sha256=document.content_sha256,
                 )
                 document.ocr_text = ocr_text
                 document.ocr_status = OCRStatus.COMPLETED
@@ -254,6 +260,9 @@ async def delete_document(
         # Log error but continue with database deletion
         print(f"Warning: Failed to delete S3 object {document.s3_key}: {e}")
 
+    # Delete cached OCR text (personal data) of the document
+    await forget_cached_text([document.content_sha256])
+
     # Delete from database
     await db.delete(document)
     await db.commit()
@@ -6,6 +6,7 @@ This module provides endpoints for:
 - Getting PDF download URLs (GET /api/v1/summaries/{id}/pdf)
 """
 
+import asyncio
 import logging
 from typing import Annotated
 from uuid import UUID
@@ -156,26 +157,32 @@ async def create_summary(
         from app.services.pdf_service import PDFService
 
         pdf_service = PDFService()
-        # Use template_to_pdf for structured professional output
-        pdf_bytes = pdf_service.template_to_pdf(case_data, reference_number)
 
-        # Upload markdown to S3
+        async def render_and_upload_pdf() -> tuple[str, str]:
+            # WeasyPrint renders in a worker process, boto3 uploads block - keep both off the event loop
+            # Use the template renderer for structured professional output
+            pdf_bytes = await pdf_service.template_to_pdf_async(case_data, reference_number)
+            return await asyncio.to_thread(
+                storage_service.upload_summary,
+                file_content=pdf_bytes,
+                reference_number=reference_number,
+                file_extension="pdf",
+                content_type="application/pdf",
+            )
+
+        # Upload markdown to S3 while the PDF is rendered and uploaded
         markdown_bytes = markdown_content.encode("utf-8")
-        markdown_s3_key, _ = storage_service.upload_summary(
-            file_content=markdown_bytes,
-            reference_number=reference_number,
-            file_extension="md",
-            content_type="text/markdown",
+        (markdown_s3_key, _), (pdf_s3_key, pdf_url) = await asyncio.gather(
+            asyncio.to_thread(
+                storage_service.upload_summary,
+                file_content=markdown_bytes,
+                reference_number=reference_number,
+                file_extension="md",
+                content_type="text/markdown",
+            ),
+            render_and_upload_pdf(),
         )
         summary.markdown_s3_key = markdown_s3_key
-
-        # Upload PDF to S3
-        pdf_s3_key, pdf_url = storage_service.upload_summary(
-            file_content=pdf_bytes,
-            reference_number=reference_number,
-            file_extension="pdf",
-            content_type="application/pdf",
-        )
         summary.pdf_s3_key = pdf_s3_key
         summary.pdf_url = pdf_url
 
@@ -637,7 +644,7 @@ async def regenerate_summary(
         from app.services.pdf_service import PDFService
 
         pdf_service = PDFService()
-        pdf_bytes = pdf_service.template_to_pdf(case_data, summary.reference_number)
+        pdf_bytes = await pdf_service.template_to_pdf_async(case_data, summary.reference_number)
 
         # Upload markdown to storage
         markdown_bytes = markdown_content.encode("utf-8")
@@ -17,7 +17,7 @@ from app.models import LawyerConnection, Notification, User
 from app.models.lawyer_connection import ConnectionStatus
 from app.models.notification import NotificationType
 from app.schemas.webhook import LawyerResponseWebhookRequest, LawyerResponseWebhookResponse
-from app.services.email_service import EmailService
+from app.services.email_service import get_email_service
 
 logger = logging.getLogger(__name__)
 
@@ -160,10 +160,10 @@ async def lawyer_response_webhook(
 
     logger.info(f"Created notification {notification.id} for user {webhook_data.user_id}")
 
-    # Send email to user (non-blocking, log errors but don't fail webhook)
+    # Send email to user (queued in the background, log errors but don't fail webhook)
     email_sent = False
     try:
-        email_service = EmailService()
+        email_service = get_email_service()
         # Generate case summary URL (frontend URL to view the conversation/summary)
         case_summary_url = f"{settings.FRONTEND_URL}/conversations/{webhook_data.conversation_id}"
         await email_service.send_lawyer_response_email(
@@ -172,7 +172,7 @@ async def lawyer_response_webhook(
             case_summary_url=case_summary_url,
         )
         email_sent = True
-        logger.info(f"Sent lawyer response email to {user.email}")
+        logger.info(f"Queued lawyer response email to {user.email}")
     except Exception as e:
         logger.error(f"Failed to send email to {user.email}: {e}", exc_info=True)
         # Don't fail the webhook if email fails
@@ -4,11 +4,13 @@ This endpoint handles real-time chat between users and AI agents.
 It uses Mistral's Conversations API with agent handoffs.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 from mistralai import (
     AgentHandoffDoneEvent,
@@ -26,12 +28,18 @@ from app.config import settings
 from app.database import get_db
 from app.models import Conversation, Document, Message, MessageRole, User
 from app.services.agents import MistralAgentsService, get_mistral_agents_service
+from app.services.agents.router import route_new_conversation
+from app.services.agents.wrapup import classify_wrapup_reply
+from app.utils.partial_json import StreamingStringField
 from app.utils.security import verify_token_ws
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# current_agent of a conversation after a handoff to the "Wrap-Up Agent"
+_WRAPUP_AGENT_NAME = "wrap-up_agent"
+
 
 async def _process_single_event(
     event, websocket: WebSocket, full_response_parts: list, current_agent_name: str, conversation=None
@@ -155,6 +163,28 @@ async def _process_single_event(
             return None
 
 
+async def _forward_summary_markdown(
+    websocket: WebSocket, markdown_field: StreamingStringField, arguments: str, conversation: Conversation
+) -> None:
+    """Send markdown_content of a streaming generate_summary call as it arrives
+
+    Args:
+        websocket: WebSocket connection
+        markdown_field: Extractor tracking the markdown_content argument
+        arguments: Newly received argument fragment
+        conversation: Current conversation model
+    """
+    text = markdown_field.feed(arguments)
+    if text:
+        await websocket.send_json(
+            {
+                "type": "summary_chunk",
+                "content": text,
+                "conversation_id": str(conversation.id),
+            }
+        )
+
+
 async def process_with_agents(
     websocket: WebSocket,
     conversation: Conversation,
@@ -180,7 +210,7 @@ async def process_with_agents(
         # Initialize Mistral client
         client = Mistral(api_key=settings.MISTRAL_API_KEY)
 
-        # Always start with Router Agent (agent-driven routing)
+        # Router Agent is the default entry point (agent-driven routing)
         router_id = agents_service.get_agent_id("router")
 
         if not router_id:
@@ -193,8 +223,32 @@ async def process_with_agents(
             )
             return
 
+        # Check if we have an existing Mistral conversation to continue
+        existing_conv_id = conversation.mistral_conversation_id
+
         # Track current agent for database updates
         current_agent_name = "router"
+        start_agent_id = router_id
+        if not existing_conv_id:
+            # Openers the router would hand straight to intake start on the Intake Agent,
+            # saving the router's LLM round trip
+            if route_new_conversation(bool(conversation.summary_generated), user_message_content) == "intake":
+                intake_id = agents_service.get_agent_id("intake")
+                if intake_id:
+                    start_agent_id = intake_id
+                    current_agent_name = "intake_agent"  # Name a router handoff would report
+        elif conversation.current_agent == _WRAPUP_AGENT_NAME:
+            # The Wrap-Up Agent still decides the handoff, but a clear confirmation lets
+            # the client show summary progress before the agents' round trips finish
+            if classify_wrapup_reply(user_message_content) == "confirmation":
+                await websocket.send_json(
+                    {
+                        "type": "wrapup_confirmed",
+                        "conversation_id": str(conversation.id),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    }
+                )
+
         full_response_parts: list[str] = []
 
         # Prepend language instruction to ensure LLM responds in user's language
@@ -210,9 +264,6 @@ async def process_with_agents(
         }
         await websocket.send_json(agent_start_payload)
 
-        # Check if we have an existing Mistral conversation to continue
-        existing_conv_id = conversation.mistral_conversation_id
-
         # Use correct API pattern from Mistral cookbooks:
         # - start_stream() for first message
         # - append_stream() for subsequent messages
@@ -225,7 +276,7 @@ async def process_with_agents(
         else:
             # Start new conversation
             response = client.beta.conversations.start_stream(
-                agent_id=router_id,
+                agent_id=start_agent_id,
                 inputs=user_message_content,
             )
 
@@ -234,6 +285,8 @@ async def process_with_agents(
         pending_tool_call_id: str | None = None
         pending_function_name: str = ""
         pending_arguments: str = ""
+        # Stream the summary markdown to the client while the rest of the arguments trail
+        summary_markdown = StreamingStringField("markdown_content")
 
         with response as event_stream:
             # Capture conversation_id from first event (cookbook pattern line 138)
@@ -250,6 +303,8 @@ async def process_with_agents(
                 pending_tool_call_id = first_result[1]
                 pending_function_name = first_result[2]
                 pending_arguments += first_result[3] or ""
+                if pending_function_name == "generate_summary":
+                    await _forward_summary_markdown(websocket, summary_markdown, first_result[3] or "", conversation)
 
             # Process remaining events
             for event in event_stream:
@@ -269,6 +324,8 @@ async def process_with_agents(
                     pending_tool_call_id = result[1]
                     pending_function_name = result[2]
                     pending_arguments += result[3] or ""
+                    if pending_function_name == "generate_summary":
+                        await _forward_summary_markdown(websocket, summary_markdown, result[3] or "", conversation)
 
         # Handle pending function call AFTER stream completes (cookbook pattern lines 182-186)
         # Track if summary generation should be triggered
@@ -291,10 +348,10 @@ async def process_with_agents(
 
                 # Parse structured case data from function arguments
                 try:
-                    summary_case_data = json.loads(pending_arguments) if pending_arguments else {}
+                    summary_case_data = orjson.loads(pending_arguments) if pending_arguments else {}
                     trigger_summary_generation = True
                     logger.info(f"Summary data keys: {list(summary_case_data.keys())}")
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"Failed to parse summary arguments: {e}")
 
             # Create function result (our functions are data collectors, return success)
@@ -391,22 +448,28 @@ async def process_with_agents(
 
                     # Prepare structured data for PDF
                     structured_data = summary_case_data.get("structured_case_data", summary_case_data)
-                    pdf_content = pdf_service.template_to_pdf(structured_data, str(summary_id))
 
-                    # Upload PDF to S3
-                    pdf_s3_key, pdf_url = storage_service.upload_summary(
-                        file_content=pdf_content,
-                        reference_number=reference_number,
-                        file_extension="pdf",
-                        content_type="application/pdf",
-                    )
+                    async def render_and_upload_pdf() -> tuple[str, str]:
+                        # WeasyPrint renders in a worker process, boto3 blocks - run it in a worker thread
+                        pdf_content = await pdf_service.template_to_pdf_async(structured_data, str(summary_id))
+                        return await asyncio.to_thread(
+                            storage_service.upload_summary,
+                            file_content=pdf_content,
+                            reference_number=reference_number,
+                            file_extension="pdf",
+                            content_type="application/pdf",
+                        )
 
-                    # Upload markdown to S3
-                    markdown_s3_key, _ = storage_service.upload_summary(
-                        file_content=markdown_content.encode("utf-8"),
-                        reference_number=reference_number,
-                        file_extension="md",
-                        content_type="text/markdown",
+                    # Upload markdown to S3 while the PDF is rendered and uploaded
+                    (pdf_s3_key, pdf_url), (markdown_s3_key, _) = await asyncio.gather(
+                        render_and_upload_pdf(),
+                        asyncio.to_thread(
+                            storage_service.upload_summary,
+                            file_content=markdown_content.encode("utf-8"),
+                            reference_number=reference_number,
+                            file_extension="md",
+                            content_type="text/markdown",
+                        ),
                     )
 
                     # Create Summary record
@@ -533,6 +596,13 @@ async def websocket_chat(
         "code": "error_code",
         "timestamp": "2025-01-25T10:05:10Z"
     }
+
+    7. Wrap-Up Confirmed (user plainly confirmed the wrap-up; summary generation follows):
+    {
+        "type": "wrapup_confirmed",
+        "conversation_id": "uuid",
+        "timestamp": "2025-01-25T10:06:00Z"
+    }
     """
     # Verify JWT token (fastapi-users format: sub contains user ID UUID)
     try:
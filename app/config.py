@@ -16,6 +16,12 @@ class Settings(BaseSettings):
     MISTRAL_API_KEY: str
     MISTRAL_ORG_ID: str  # Required for library sharing with agents
     MISTRAL_LIBRARY_ID: str  # Document library with interviewing skills, real-world examples, and summary templates
+    AGENT_ID_CACHE_PATH: str | None = None  # Optional JSON file remembering agent IDs across restarts
+    OCR_MAX_CONCURRENCY: int = 4  # Max OCR requests to Mistral in flight
+    OCR_REQUESTS_PER_SECOND: float = 5.0  # Max OCR requests started per second (keep within Mistral's limit)
+    OCR_CACHE_DIR: str | None = None  # Optional directory caching extracted text by document SHA-256
+    OCR_CACHE_MAX_AGE_HOURS: float = 24.0  # Cached OCR text (personal data) is deleted after this age
+    OCR_VISION_MAX_PAGES: int = 8  # PDF pages sent to the vision model when the OCR endpoint fails
 
     # JWT Authentication
     SECRET_KEY: str = "development-secret-key"
@@ -41,14 +47,24 @@ class Settings(BaseSettings):
     S3_BUCKET: str = "sumii-pdfs-dev"
     S3_DOCUMENTS_BUCKET: str | None = None  # Separate bucket for documents
 
+    # PDF Generation
+    PDF_MAX_WORKERS: int | None = None  # Processes rendering PDFs concurrently (default: CPU count)
+
     # AWS SES Configuration
     SES_CONFIGURATION_SET: str | None = None  # Optional SES configuration set
+    SES_MAX_CONCURRENCY: int = 16  # Max SES requests in flight (keep within the account's send rate)
+    # SES template for bulk lawyer response emails (variables: lawyer_name, case_summary_url)
+    SES_LAWYER_RESPONSE_TEMPLATE: str | None = None
+    # SES template prefix for bulk verification emails ("<name>_de" / "<name>_en", variable: verify_url)
+    SES_VERIFICATION_TEMPLATE: str | None = None
 
     # sumii-anwalt Backend Integration
     ANWALT_API_BASE_URL: str = "http://localhost:8001"  # Default to local development
     ANWALT_API_KEY: str | None = (
         None  # API key for authenticating webhook requests from sumii-anwalt (set in production)
     )
+    ANWALT_MAX_CONNECTIONS: int = 200  # Connection pool size for requests to sumii-anwalt
+    ANWALT_MAX_KEEPALIVE: int = 100  # Idle connections kept open for reuse
 
     # Logging Configuration
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
@@ -3,6 +3,7 @@ Database Connection and Session Management
 Using SQLAlchemy 2.0 with async support
 """
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
@@ -11,12 +12,23 @@ from app.config import settings
 # Convert postgresql:// to postgresql+asyncpg://
 DATABASE_URL = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
+
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB column values with orjson
+
+    Non-string dict keys are converted to strings, as json.dumps does.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 # echo=False to disable SQLAlchemy's built-in logging (we use centralized logging instead)
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Disabled - use centralized logging config instead
     future=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Session factory
@@ -22,6 +22,10 @@ from app.api.v1 import (
     websocket,
 )
 from app.services.agents import get_mistral_agents_service
+from app.services.anwalt_service import close_anwalt_service, get_anwalt_service
+from app.services.email_service import wait_for_pending_emails
+from app.services.pdf_service import close_pdf_pool
+from app.services.push_service import close_push_service
 from app.utils.logging_config import setup_logging
 
 # Configure logging from environment variables (one-time setup)
@@ -41,10 +45,17 @@ async def lifespan(app: FastAPI):
         print(f"⚠️ Failed to initialize agents: {e}")
         # Continue anyway - agents will be initialized lazily on first request
 
+    # Pre-connect to sumii-anwalt so the first lawyer search skips DNS and handshakes
+    await get_anwalt_service().warm_up()
+
     yield
 
-    # Shutdown: cleanup if needed
+    # Shutdown: finish queued emails, close pooled HTTP connections and stop PDF workers
     print("👋 Shutting down Sumii Mobile API...")
+    await wait_for_pending_emails()
+    await close_anwalt_service()
+    await close_push_service()
+    await close_pdf_pool()
 
 
 app = FastAPI(
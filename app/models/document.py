@@ -51,6 +51,7 @@ class Document(Base):
         upload_status: S3 upload status (uploading/completed/failed)
         ocr_status: OCR processing status (pending/processing/completed/failed)
         ocr_text: Extracted text from OCR (null if not processed)
+        content_sha256: SHA-256 of the file content, key of its OCR cache entry (null if not processed)
         created_at: When document was uploaded
     """
 
@@ -82,6 +83,7 @@ class Document(Base):
     # OCR processing
     ocr_status = Column(Enum(OCRStatus), default=OCRStatus.PENDING, nullable=False, index=True)
     ocr_text = Column(Text, nullable=True)  # Extracted text from OCR (can be very long)
+    content_sha256 = Column(String(64), nullable=True)  # Removes the OCR cache entry when the document is deleted
 
     # Timestamp
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
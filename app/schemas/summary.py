@@ -1,9 +1,10 @@
 """Summary Schemas - Request/Response models for summary generation API"""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.conversation import CaseStrength, LegalArea, Urgency
 
@@ -45,3 +46,30 @@ class SummaryResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class SummaryFunctionArguments(BaseModel):
+    """Arguments of the Summary Agent's generate_summary function call
+
+    Mirrors SUMMARY_GENERATION_SCHEMA. Parsed straight from the raw JSON string
+    with model_validate_json (single pass, no intermediate dict). The nested
+    sections stay plain dicts because they are handed to the PDF template as-is.
+    """
+
+    markdown_content: str = ""
+    claimant: dict[str, Any] | None = Field(default_factory=dict)
+    respondent: dict[str, Any] | None = Field(default_factory=dict)
+    factual_narrative: dict[str, Any] | None = Field(default_factory=dict)
+    evidence: dict[str, Any] | None = Field(default_factory=dict)
+    financial_info: dict[str, Any] | None = Field(default_factory=dict)
+    metadata: dict[str, Any] | None = Field(default_factory=dict)
+
+    def structured_case_data(self) -> dict[str, Any]:
+        """Sections used by the PDF template (claimant, respondent, narrative, evidence, financials)"""
+        return {
+            "claimant": self.claimant,
+            "respondent": self.respondent,
+            "factual_narrative": self.factual_narrative,
+            "evidence": self.evidence,
+            "financial_info": self.financial_info,
+        }
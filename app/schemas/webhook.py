@@ -27,4 +27,4 @@ class LawyerResponseWebhookResponse(BaseModel):
     status: str = Field(default="success", description="Status of webhook processing")
     message: str = Field(..., description="Human-readable message")
     notification_id: UUID | None = Field(None, description="ID of created notification")
-    email_sent: bool = Field(default=False, description="Whether email was sent to user")
+    email_sent: bool = Field(default=False, description="Whether email was queued for sending to user")
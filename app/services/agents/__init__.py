@@ -17,12 +17,18 @@ Agent Flow:
 User → Router → Intake → Fact Completion → Wrap-Up → Summary → PDF Download
 """
 
+import asyncio
+import logging
+
 from app.services.agents.intake import create_intake_agent
 from app.services.agents.reasoning import create_reasoning_agent
 from app.services.agents.router import create_router_agent
 from app.services.agents.summary import create_summary_agent
+from app.services.agents.utils import forget_agent_ids, get_agent_factory
 from app.services.agents.wrapup import create_wrapup_agent
 
+logger = logging.getLogger(__name__)
+
 __all__ = [
     "create_router_agent",
     "create_intake_agent",
@@ -53,7 +59,9 @@ class MistralAgentsService:
                           (corrections) → Reasoning
 
         Handoffs are configured via client.beta.agents.update() to enable
-        proper agent orchestration with Mistral's Conversations API.
+        proper agent orchestration with Mistral's Conversations API. If this
+        fails, e.g. because a remembered agent was deleted in Mistral, remembered
+        agent IDs are dropped and the setup is retried once.
 
         Returns:
             dict[str, str]: Mapping of agent names to agent IDs
@@ -65,30 +73,53 @@ class MistralAgentsService:
         # Create Mistral client
         client = Mistral(api_key=settings.MISTRAL_API_KEY)
 
-        # Create all agents
-        intake_id = create_intake_agent()
-        reasoning_id = create_reasoning_agent()
-        wrapup_id = create_wrapup_agent()
-        summary_id = create_summary_agent()
-        router_id = create_router_agent()
+        try:
+            self.agents = await self._create_and_link_agents(client)
+        except Exception as e:
+            # A remembered agent ID may belong to an agent that no longer exists in Mistral;
+            # forget all remembered IDs and look the agents up (or create them) once more
+            logger.warning(f"Agent setup failed ({e}), retrying without remembered agent IDs")
+            forget_agent_ids()
+            get_agent_factory().invalidate()
+            self.agents = await self._create_and_link_agents(client)
 
-        # Configure handoffs via Mistral API
-        # Router can hand off to Intake
-        client.beta.agents.update(agent_id=router_id, handoffs=[intake_id])
+        return self.agents
 
-        # Intake can hand off to Reasoning
-        client.beta.agents.update(agent_id=intake_id, handoffs=[reasoning_id])
+    async def _create_and_link_agents(self, client) -> dict[str, str]:
+        """Create or reuse all 5 agents and configure their handoffs
 
-        # Reasoning can hand off to Wrap-Up (no longer directly to Summary)
-        client.beta.agents.update(agent_id=reasoning_id, handoffs=[wrapup_id])
+        Args:
+            client: Mistral client used for the handoff updates
 
-        # Wrap-Up can hand off to Summary (on confirmation) or back to Reasoning (on correction)
-        client.beta.agents.update(agent_id=wrapup_id, handoffs=[summary_id, reasoning_id])
+        Returns:
+            dict[str, str]: Mapping of agent names to agent IDs
+        """
+        # Create all agents concurrently - each one is an independent list/create/update
+        # round trip against the blocking SDK, so run them in worker threads
+        intake_id, reasoning_id, wrapup_id, summary_id, router_id = await asyncio.gather(
+            asyncio.to_thread(create_intake_agent),
+            asyncio.to_thread(create_reasoning_agent),
+            asyncio.to_thread(create_wrapup_agent),
+            asyncio.to_thread(create_summary_agent),
+            asyncio.to_thread(create_router_agent),
+        )
+
+        # Configure handoffs via Mistral API - the updates are independent of each
+        # other, so they run concurrently as well
+        await asyncio.gather(
+            # Router can hand off to Intake
+            asyncio.to_thread(client.beta.agents.update, agent_id=router_id, handoffs=[intake_id]),
+            # Intake can hand off to Reasoning
+            asyncio.to_thread(client.beta.agents.update, agent_id=intake_id, handoffs=[reasoning_id]),
+            # Reasoning can hand off to Wrap-Up (no longer directly to Summary)
+            asyncio.to_thread(client.beta.agents.update, agent_id=reasoning_id, handoffs=[wrapup_id]),
+            # Wrap-Up can hand off to Summary (on confirmation) or back to Reasoning (on correction)
+            asyncio.to_thread(client.beta.agents.update, agent_id=wrapup_id, handoffs=[summary_id, reasoning_id]),
+        )
 
         # Summary is final - no handoffs needed
 
-        # Store all agent IDs
-        self.agents = {
+        return {
             "router": router_id,
             "intake": intake_id,
             "reasoning": reasoning_id,
@@ -96,8 +127,6 @@ class MistralAgentsService:
             "summary": summary_id,
         }
 
-        return self.agents
-
     def get_agent_id(self, agent_name: str) -> str | None:
         """Get agent ID by name
 
@@ -16,16 +16,7 @@ from app.services.agents.utils import (
     get_agent_factory,
 )
 
-
-def create_intake_agent() -> str:
-    """Create Intake Agent for facts collection
-
-    Returns:
-        str: Agent ID
-    """
-    factory = get_agent_factory()
-
-    instructions = f"""You are Sumii's legal intake specialist.
+_INTAKE_INSTRUCTIONS = f"""You are Sumii's legal intake specialist.
 
 {SUMII_CORE_DOS_DONTS}
 
@@ -116,6 +107,15 @@ Only AFTER user confirms the summary is correct:
 - Say something like: "Perfekt, ich übergebe dich jetzt an unseren Spezialisten für weitere Details."
 """
 
+
+def create_intake_agent() -> str:
+    """Create Intake Agent for facts collection
+
+    Returns:
+        str: Agent ID
+    """
+    factory = get_agent_factory()
+
     return factory.create_agent(
         model="mistral-medium-2505",
         name="Legal Intake Agent",
@@ -125,6 +125,6 @@ Sample queries this agent handles:
 2. "Meine Heizung ist kaputt" -> ask about landlord, timeline, location
 3. "I need help with my rental contract" -> gather details systematically
 After collecting all facts, hand off to fact-completion-agent for additional details.""",
-        instructions=instructions,
+        instructions=_INTAKE_INSTRUCTIONS,
         tools=[LEGAL_FACTS_SCHEMA],
     )
@@ -0,0 +1,17 @@
+"""Prompt text resources for the Mistral agents"""
+
+from functools import cache
+from importlib.resources import files
+
+
+@cache
+def read_prompt_resource(name: str) -> str:
+    """Read a prompt text file shipped in this package (once per process)
+
+    Args:
+        name: File name relative to the prompts package
+
+    Returns:
+        str: File contents
+    """
+    return files(__package__).joinpath(name).read_text(encoding="utf-8")
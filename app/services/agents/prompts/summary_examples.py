@@ -0,0 +1,30 @@
+"""Few-shot examples for the Summary Agent
+
+Kept in one place so the example case (Berlin heating defect) is defined once
+and interpolated into the agent instructions at import time.
+"""
+
+from app.services.agents.prompts import read_prompt_resource
+
+# Beweisverzeichnis entries showing how OCR-extracted document data is listed
+EVIDENCE_OCR_EXAMPLE = """```markdown
+## Beweisverzeichnis
+
+1. **Anlage 1 - Mietvertrag vom 01.01.2023**
+   - Mietobjekt: Musterstraße 123, 10115 Berlin
+   - Vertragsparteien: Max Mustermann (Mieter), Hausverwaltung GmbH (Vermieter)
+   - Kaltmiete: 850 EUR/Monat
+
+2. **Anlage 2 - Führerschein**
+   - Inhaber: Max Mustermann
+   - Gültig bis: 20.01.2025
+   - Klasse: B
+
+3. **Anlage 3 - Aufenthaltstitel**
+   - Art: Niederlassungserlaubnis
+   - Ausgestellt: 15.03.2020
+   - Gültigkeit: Unbefristet
+```"""
+
+# Complete markdown_content example for a Mietrecht case, shipped as a package resource
+EXAMPLE_MARKDOWN = f"```markdown\n{read_prompt_resource('summary_example.md')}```"
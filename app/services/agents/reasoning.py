@@ -16,16 +16,8 @@ from app.services.agents.utils import (
     get_agent_factory,
 )
 
-
-def create_reasoning_agent() -> str:
-    """Create Fact Completion Agent for comprehensive fact-gathering
-
-    Returns:
-        str: Agent ID
-    """
-    factory = get_agent_factory()
-
-    instructions = f"""You are Sumii's fact completion specialist who ensures all relevant information is gathered.
+_REASONING_INSTRUCTIONS = f"""\
+You are Sumii's fact completion specialist who ensures all relevant information is gathered.
 
 {SUMII_CORE_DOS_DONTS}
 
@@ -95,6 +87,15 @@ Your job: Collect COMPLETE facts for lawyers
 NOT your job: Analyze those facts legally
 """
 
+
+def create_reasoning_agent() -> str:
+    """Create Fact Completion Agent for comprehensive fact-gathering
+
+    Returns:
+        str: Agent ID
+    """
+    factory = get_agent_factory()
+
     return factory.create_agent(
         model="mistral-medium-2505",
         name="Fact Completion Agent",
@@ -105,7 +106,7 @@ Sample scenarios:
 2. Initial employment facts provided -> gather details about employment history, witnesses, written records
 After fact collection is complete, hand off to summary-agent for professional documentation.
 This agent does NOT provide legal advice - only collects facts for lawyers.""",
-        instructions=instructions,
+        instructions=_REASONING_INSTRUCTIONS,
         tools=[
             LEGAL_FACTS_SCHEMA,
             get_document_library_tool(),  # For reference templates only
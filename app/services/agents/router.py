@@ -4,23 +4,17 @@ The Router Agent analyzes conversation state and routes users to specialized age
 - Initial contact → Intake Agent (collect facts)
 - Facts collected → Reasoning Agent (legal analysis)
 - Analysis complete → Summary Agent (generate document)
-"""
-
-from app.services.agents.utils import GERMAN_LANGUAGE_INSTRUCTIONS, SUMII_CORE_DOS_DONTS, get_agent_factory
 
+First messages that the router would always hand to the Intake Agent are
+recognized locally by route_new_conversation(), skipping the router's LLM call.
+"""
 
-def create_router_agent() -> str:
-    """Create Router Agent
-
-    Note: Handoffs are configured separately via AgentFactory.configure_handoffs()
-    after all agents are created.
+import re
+from functools import lru_cache
 
-    Returns:
-        str: Router Agent ID
-    """
-    factory = get_agent_factory()
+from app.services.agents.utils import GERMAN_LANGUAGE_INSTRUCTIONS, SUMII_CORE_DOS_DONTS, get_agent_factory
 
-    instructions = f"""You are Sumii's legal router agent.
+_ROUTER_INSTRUCTIONS = f"""You are Sumii's legal router agent.
 
 {SUMII_CORE_DOS_DONTS}
 
@@ -79,6 +73,80 @@ User: "Was kostet ein Anwalt?"
 Router: "Die Kosten variieren je nach Fall. Viele bieten Erstberatungen."
 """
 
+
+# Opening messages the router agent always hands off to the Intake Agent (routing rule 1:
+# new conversation / legal question). Compiled once; matching is case-insensitive.
+_INTAKE_INTENT_PATTERN = re.compile(
+    r"""
+    \b(?:hallo|hi|hey|moin|servus|hello|guten\s+(?:morgen|tag|abend))\b
+    | miet | vermiet | heizung | schimmel | kaution | nebenkosten | wohnung | m[äa]ngel
+    | k[üu]ndig | abmahn | arbeitgeber | arbeitsvertrag | gehalt | lohn | [üu]berstunden
+    | vertrag | rechnung | inkasso | mahnung | schaden
+    | \b(?:landlord|tenant|rent|deposit|heating|mou?ld|evict\w*|employer|salary|wages?|fired|contract|invoice)\b
+    | EXTRACTED\s+CONTENT\s+FROM
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+# Short openers repeat a lot across users ("Hallo", "Hi", "Meine Heizung ist kaputt");
+# only messages up to this length are normalized and cached
+_CACHEABLE_MESSAGE_LENGTH = 200
+
+
+@lru_cache(maxsize=512)
+def _classify_normalized(normalized_message: str) -> str | None:
+    """Classify a normalized opener (cached by exact normalized text)"""
+    if _INTAKE_INTENT_PATTERN.search(normalized_message):
+        return "intake"
+    return None
+
+
+def classify_first_message(message: str) -> str | None:
+    """Decide the entry agent for the first message of a conversation without an LLM call
+
+    Greetings, uploaded documents and messages naming a typical legal topic are
+    always routed to the Intake Agent by the router agent. Anything else (e.g. a
+    general question) returns None and goes through the router agent as before.
+
+    Args:
+        message: User message text (without the injected language instruction)
+
+    Returns:
+        str | None: Agent key ("intake") to start the conversation with, or None for the router
+    """
+    if len(message) > _CACHEABLE_MESSAGE_LENGTH:
+        return "intake" if _INTAKE_INTENT_PATTERN.search(message) else None
+    return _classify_normalized(" ".join(message.casefold().split()))
+
+
+def route_new_conversation(summary_generated: bool, message: str) -> str | None:
+    """Pick the agent a new Mistral conversation starts on, when the state makes it unambiguous
+
+    Args:
+        summary_generated: Whether a summary already exists for the Sumii conversation
+        message: First user message (without the injected language instruction)
+
+    Returns:
+        str | None: Agent key to start with, or None to start with the router agent
+    """
+    # Follow-ups after a summary are answered by the router (rule 3); openers are classified locally
+    if summary_generated:
+        return None
+    return classify_first_message(message)
+
+
+def create_router_agent() -> str:
+    """Create Router Agent
+
+    Note: Handoffs are configured separately via AgentFactory.configure_handoffs()
+    after all agents are created.
+
+    Returns:
+        str: Router Agent ID
+    """
+    factory = get_agent_factory()
+
     return factory.create_agent(
         model="mistral-medium-2505",
         name="Legal Router Agent",
@@ -88,5 +156,5 @@ Sample queries this agent receives:
 2. "My landlord won't fix the heating" -> route to intake-agent
 3. "I have a legal question about my rent" -> route to intake-agent
 Always route legal intake queries to the intake-agent for fact collection.""",
-        instructions=instructions,
+        instructions=_ROUTER_INSTRUCTIONS,
     )
@@ -7,6 +7,7 @@ The Summary Agent creates comprehensive factual documents:
 - OCR-extracted data from uploaded documents
 """
 
+from app.services.agents.prompts.summary_examples import EVIDENCE_OCR_EXAMPLE, EXAMPLE_MARKDOWN
 from app.services.agents.tools.function_schemas import SUMMARY_GENERATION_SCHEMA
 from app.services.agents.utils import (
     GERMAN_LANGUAGE_INSTRUCTIONS,
@@ -14,16 +15,10 @@ from app.services.agents.utils import (
     get_agent_factory,
 )
 
-
-def create_summary_agent() -> str:
-    """Create Summary Agent for document generation
-
-    Returns:
-        str: Agent ID
-    """
-    factory = get_agent_factory()
-
-    instructions = f"""You are Sumii's factual summary specialist.
+# Keep the instructions byte-identical across processes and deploys (no dates, ids or
+# other per-run values): the agent is only updated when this text changes, and an
+# unchanged prompt prefix is what lets the provider reuse its cached prefill.
+_SUMMARY_INSTRUCTIONS = f"""You are Sumii's factual summary specialist.
 
 {SUMII_CORE_DOS_DONTS}
 
@@ -64,24 +59,7 @@ Use professional legal German:
 
 When documents have OCR-extracted data, include key details:
 
-```markdown
-## Beweisverzeichnis
-
-1. **Anlage 1 - Mietvertrag vom 01.01.2023**
-   - Mietobjekt: Musterstraße 123, 10115 Berlin
-   - Vertragsparteien: Max Mustermann (Mieter), Hausverwaltung GmbH (Vermieter)
-   - Kaltmiete: 850 EUR/Monat
-
-2. **Anlage 2 - Führerschein**
-   - Inhaber: Max Mustermann
-   - Gültig bis: 20.01.2025
-   - Klasse: B
-
-3. **Anlage 3 - Aufenthaltstitel**
-   - Art: Niederlassungserlaubnis
-   - Ausgestellt: 15.03.2020
-   - Gültigkeit: Unbefristet
-```
+{EVIDENCE_OCR_EXAMPLE}
 
 <<<OUTPUT STRUCTURE - CALL generate_summary FUNCTION>>>
 
@@ -130,59 +108,7 @@ You MUST call the generate_summary function with this structure:
 
 <<<EXAMPLE MARKDOWN FORMAT>>>
 
-```markdown
-# Fallzusammenfassung
-**Referenz:** SUM-YYYYMMDD-XXXXX
-
-## Kurzzusammenfassung
-Der Mandant, ein Mieter in Berlin-Kreuzberg, begehrt die Reparatur einer
-seit drei Wochen defekten Heizung. Der Vermieter reagiert nicht auf die Mängelanzeige.
-
-## Mandant
-- **Name:** Max Mustermann
-- **Adresse:** Musterstraße 123, 10115 Berlin
-- **Kontakt:** max@example.com
-
-## Anspruchsteller
-- **Name:** Max Mustermann
-- **Rolle:** Mieter
-
-## Anspruchsgegner
-- **Name:** Hausverwaltung GmbH
-- **Rolle:** Vermieter
-- **Kontakt:** verwaltung@example.de
-
-## Ziel des Mandanten
-Der Mandant begehrt die unverzügliche Reparatur der defekten Heizungsanlage.
-
-## Verhältnis der Parteien
-Zwischen den Parteien besteht ein Mietverhältnis seit 01.01.2022. Die monatliche Kaltmiete beträgt 850 EUR.
-
-## Chronologischer Sachverhalt
-| Datum | Ereignis | Beleg |
-|-------|----------|-------|
-| 30.11.2025 | Heizungsdefekt festgestellt | Anlage 1 |
-| 01.12.2025 | Mängelanzeige per E-Mail an Vermieter | Anlage 2 |
-| 24.12.2025 | Keine Reaktion des Vermieters, Raumtemperatur 15°C | Anlage 3 |
-
-## Beweisverzeichnis
-
-1. **Anlage 1 - Foto Thermometer**
-   - Aufgenommen: 24.12.2025
-   - Temperatur: 15°C
-
-2. **Anlage 2 - E-Mail Mängelanzeige**
-   - Datum: 01.12.2025
-   - Empfänger: verwaltung@example.de
-
-3. **Anlage 3 - Mietvertrag vom 01.01.2022**
-   - Mietobjekt: Musterstraße 123, 10115 Berlin
-   - Kaltmiete: 850 EUR/Monat
-   - Vertragsdauer: Unbefristet
-
----
-**Hinweis:** Diese Zusammenfassung wurde KI-gestützt erstellt.
-```
+{EXAMPLE_MARKDOWN}
 
 {GERMAN_LANGUAGE_INSTRUCTIONS}
 
@@ -196,6 +122,15 @@ Zwischen den Parteien besteht ein Mietverhältnis seit 01.01.2022. Die monatlich
 - Always call the generate_summary function with structured data
 """
 
+
+def create_summary_agent() -> str:
+    """Create Summary Agent for document generation
+
+    Returns:
+        str: Agent ID
+    """
+    factory = get_agent_factory()
+
     return factory.create_agent(
         model="mistral-medium-2505",
         name="Legal Summary Agent",
@@ -203,7 +138,7 @@ Zwischen den Parteien besteht ein Mietverhältnis seit 01.01.2022. Die monatlich
 This agent receives cases AFTER fact collection is complete.
 It creates structured factual documentation for lawyer review.
 IMPORTANT: This agent documents FACTS ONLY - NO legal analysis.""",
-        instructions=instructions,
+        instructions=_SUMMARY_INSTRUCTIONS,
         tools=[
             SUMMARY_GENERATION_SCHEMA,
         ],
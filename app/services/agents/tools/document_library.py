@@ -4,14 +4,23 @@ This module provides the document library tool configuration for Mistral agents,
 enabling agents to access the Sumii legal knowledge base.
 """
 
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import Any
+
 from app.config import settings
 
 
-def get_document_library_tool() -> dict:
+@cache
+def get_document_library_tool() -> Mapping[str, Any]:
     """Get document library tool configuration from settings
 
+    The library ID is fixed for the lifetime of the process, so the tool is built
+    once and shared as a read-only mapping (thawed by AgentFactory before use).
+
     Returns:
-        dict: Document library tool configuration for Mistral agents
+        Mapping[str, Any]: Document library tool configuration for Mistral agents
 
     Example:
         >>> from app.services.agents.tools.document_library import get_document_library_tool
@@ -20,7 +29,9 @@ def get_document_library_tool() -> dict:
     Note:
         Mistral API expects 'library_ids' (plural, array) not 'library_id'
     """
-    return {
-        "type": "document_library",
-        "library_ids": [settings.MISTRAL_LIBRARY_ID],  # Array of library IDs
-    }
+    return MappingProxyType(
+        {
+            "type": "document_library",
+            "library_ids": (settings.MISTRAL_LIBRARY_ID,),  # Array of library IDs
+        }
+    )
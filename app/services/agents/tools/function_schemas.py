@@ -2,8 +2,104 @@
 
 This module defines the function calling schemas used by Mistral agents
 for structured data extraction during legal conversations.
+
+The schemas are shared module state referenced by every agent definition, so they
+are exposed as read-only views (MappingProxyType / tuple). Use thaw_schema() to get
+a plain dict copy, e.g. before handing a schema to the Mistral SDK, and schema_json()
+for the compact JSON encoding, which is computed once at import for these schemas.
+
+Enum values and required fields are indexed once at import as well (*_ENUMS and
+*_REQUIRED), so validators can check values without walking the schema tree.
 """
 
+from collections.abc import Mapping
+from importlib.resources import files
+from types import MappingProxyType
+from typing import Any
+
+import orjson
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into MappingProxyType and tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw_schema(value: Any) -> Any:
+    """Recursively copy a frozen schema back into plain dicts and lists
+
+    Args:
+        value: Frozen schema (or any nested part of it)
+
+    Returns:
+        Any: Mutable copy with the same content and key order
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw_schema(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_schema(item) for item in value]
+    return value
+
+
+def _dump_json(value: Any) -> bytes:
+    """Compact, key-order preserving JSON encoding (frozen mappings are encoded as objects)"""
+    return orjson.dumps(value, default=dict)
+
+
+def schema_json(schema: Mapping[str, Any]) -> bytes:
+    """Get the compact JSON encoding of a tool definition
+
+    The schemas defined in this module are encoded once at import; any other tool
+    (e.g. the document library tool) is encoded on demand.
+
+    Args:
+        schema: Tool definition mapping
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    encoded = _SCHEMA_JSON.get(id(schema))
+    if encoded is None:
+        encoded = _dump_json(schema)
+    return encoded
+
+
+def _index_constraints(
+    node: Any, name: str, enums: dict[str, frozenset[str]], required: dict[str, tuple[str, ...]]
+) -> None:
+    """Collect enum values and required field names, keyed by the property name they belong to
+
+    Array items are indexed under the array's name; the top-level parameters object
+    under "parameters".
+    """
+    if not isinstance(node, Mapping):
+        return
+    if "enum" in node:
+        enums[name] = frozenset(node["enum"])
+    if "required" in node:
+        required[name] = tuple(node["required"])
+    for key, child in node.items():
+        if key == "properties":
+            for property_name, property_schema in child.items():
+                _index_constraints(property_schema, property_name, enums, required)
+        elif key == "items":
+            _index_constraints(child, name, enums, required)
+        else:
+            _index_constraints(child, key, enums, required)
+
+
+def _schema_constraints(schema: Mapping[str, Any]) -> tuple[dict[str, frozenset[str]], dict[str, tuple[str, ...]]]:
+    """Index enum values and required fields of a schema (see _index_constraints)"""
+    enums: dict[str, frozenset[str]] = {}
+    required: dict[str, tuple[str, ...]] = {}
+    _index_constraints(schema, "", enums, required)
+    return enums, required
+
+
 # Legal facts extraction schema (Intake Agent)
 LEGAL_FACTS_SCHEMA = {
     "type": "function",
@@ -76,180 +172,27 @@ LEGAL_FACTS_SCHEMA = {
     },
 }
 
-# DEPRECATED: Legal reasoning schema - Sumii does not provide legal analysis
-# This schema is kept for backwards compatibility but should not be used
-# Legal analysis is done by lawyers, not by Sumii agents
-LEGAL_REASONING_SCHEMA = {
-    "type": "function",
-    "function": {
-        "name": "document_collected_facts",
-        "description": "Document the facts that have been collected from the user",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "facts_collected": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "category": {
-                                "type": "string",
-                                "description": "Category of fact (documentation, timeline, parties, financial)",
-                            },
-                            "description": {"type": "string", "description": "The fact that was collected"},
-                            "source": {
-                                "type": "string",
-                                "description": "How this was obtained (user statement, document, etc)",
-                            },
-                        },
-                    },
-                    "description": "Facts collected from the user",
-                },
-                "missing_information": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Information still needed for a lawyer to assess the case",
-                },
-                "documents_mentioned": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Documents the user mentioned having (contracts, emails, photos, etc)",
-                },
-            },
-            "required": ["facts_collected"],
-        },
-    },
-}
-
 # Summary generation schema (Summary Agent)
-# Structured data for PDF template + markdown for mobile app display
+# Structured data for PDF template + markdown for mobile app display:
+# - markdown_content: human-readable markdown for the mobile app bottom sheet
+# - client_profile: Mandant (client) information from the user profile
+# - claimant/respondent/factual_narrative/evidence/financial_info/metadata: PDF template data
 # Note: case_strength removed - lawyers assess case strength, not Sumii
-SUMMARY_GENERATION_SCHEMA = {
-    "type": "function",
-    "function": {
-        "name": "generate_summary",
-        "description": (
-            "Generate structured factual summary for lawyers with chronological timeline and evidence references"
-        ),
-        "parameters": {
-            "type": "object",
-            "properties": {
-                # Human-readable markdown for mobile app bottom sheet
-                "markdown_content": {
-                    "type": "string",
-                    "description": "Complete markdown summary with all structured sections for mobile display",
-                },
-                # Client profile information (Mandant)
-                "client_profile": {
-                    "type": "object",
-                    "description": "Mandant (client) information from user profile",
-                    "properties": {
-                        "name": {"type": "string", "description": "Full name of the client"},
-                        "address": {"type": "string", "description": "Client address if available"},
-                        "contact": {"type": "string", "description": "Email or phone contact"},
-                    },
-                },
-                # Structured data for PDF template
-                "claimant": {
-                    "type": "object",
-                    "description": "Anspruchsteller (claimant) information",
-                    "properties": {
-                        "name": {"type": "string", "description": "Full name of claimant"},
-                        "role": {
-                            "type": "string",
-                            "description": "Role in the matter (e.g., 'Mieter', 'Arbeitnehmer')",
-                        },
-                    },
-                },
-                "respondent": {
-                    "type": "object",
-                    "description": "Anspruchsgegner (respondent) information",
-                    "properties": {
-                        "name": {"type": "string", "description": "Name of respondent"},
-                        "role": {"type": "string", "description": "Role (e.g., 'Vermieter', 'Arbeitgeber')"},
-                        "address": {"type": "string", "description": "Address if known"},
-                        "contact": {"type": "string", "description": "Contact info if known"},
-                    },
-                },
-                "factual_narrative": {
-                    "type": "object",
-                    "description": "Sachverhaltsdarstellung - factual case narrative",
-                    "properties": {
-                        "claimant_goal": {
-                            "type": "string",
-                            "description": "What the claimant wants (factual, NOT legal assessment)",
-                        },
-                        "party_relationship": {
-                            "type": "string",
-                            "description": "Relationship between parties (contract type, duration, etc.)",
-                        },
-                        "chronological_timeline": {
-                            "type": "array",
-                            "description": "Events in chronological order with evidence references",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "date": {"type": "string", "description": "Date in DD.MM.YYYY or description"},
-                                    "event": {"type": "string", "description": "What happened"},
-                                    "evidence_ref": {
-                                        "type": "string",
-                                        "description": "Reference to evidence (e.g., 'Anlage 1' or document name)",
-                                    },
-                                },
-                            },
-                        },
-                    },
-                },
-                "evidence": {
-                    "type": "object",
-                    "description": "Beweisverzeichnis - evidence index with OCR-extracted data",
-                    "properties": {
-                        "evidence_items": {
-                            "type": "array",
-                            "description": "List of evidence items with OCR-extracted key data",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "anlage_number": {
-                                        "type": "string",
-                                        "description": "Anlage number (e.g., 'Anlage 1')",
-                                    },
-                                    "document_type": {
-                                        "type": "string",
-                                        "description": "Type of document (e.g., 'Mietvertrag', 'Führerschein')",
-                                    },
-                                    "document_date": {"type": "string", "description": "Date of document if available"},
-                                    "ocr_extracted_data": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                        "description": "Key OCR data (e.g., 'Kaltmiete: 850 EUR')",
-                                    },
-                                },
-                            },
-                        },
-                    },
-                },
-                "financial_info": {
-                    "type": "object",
-                    "description": "Financial details if applicable",
-                    "properties": {
-                        "claim_value_eur": {"type": "string", "description": "Estimated claim value in EUR"},
-                        "claim_description": {"type": "string", "description": "What the value represents"},
-                    },
-                },
-                "metadata": {
-                    "type": "object",
-                    "properties": {
-                        "legal_area": {"type": "string", "description": "Mietrecht/Arbeitsrecht/etc."},
-                        "urgency": {
-                            "type": "string",
-                            "enum": ["immediate", "weeks", "months"],
-                            "description": "Matter urgency",
-                        },
-                    },
-                },
-            },
-            "required": ["markdown_content", "claimant", "respondent", "factual_narrative", "metadata"],
-        },
-    },
+# Kept as JSON data next to this module (the largest schema; no dict literal to build at import)
+SUMMARY_GENERATION_SCHEMA = orjson.loads(files(__package__).joinpath("summary_generation_schema.json").read_bytes())
+
+LEGAL_FACTS_SCHEMA = _freeze(LEGAL_FACTS_SCHEMA)
+SUMMARY_GENERATION_SCHEMA = _freeze(SUMMARY_GENERATION_SCHEMA)
+
+# Allowed enum values by property name, e.g. LEGAL_FACTS_ENUMS["urgency"], and required
+# fields by object name, e.g. LEGAL_FACTS_REQUIRED["parameters"] (the 5W facts)
+LEGAL_FACTS_ENUMS, LEGAL_FACTS_REQUIRED = _schema_constraints(LEGAL_FACTS_SCHEMA)
+SUMMARY_GENERATION_ENUMS, SUMMARY_GENERATION_REQUIRED = _schema_constraints(SUMMARY_GENERATION_SCHEMA)
+
+# Encoded once; keyed by identity because the frozen schemas live for the whole process
+LEGAL_FACTS_SCHEMA_JSON = _dump_json(LEGAL_FACTS_SCHEMA)
+SUMMARY_GENERATION_SCHEMA_JSON = _dump_json(SUMMARY_GENERATION_SCHEMA)
+_SCHEMA_JSON: dict[int, bytes] = {
+    id(LEGAL_FACTS_SCHEMA): LEGAL_FACTS_SCHEMA_JSON,
+    id(SUMMARY_GENERATION_SCHEMA): SUMMARY_GENERATION_SCHEMA_JSON,
 }
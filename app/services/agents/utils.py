@@ -10,24 +10,264 @@ Following Mistral AI official prompting guidelines:
 - Chain-of-thought for legal reasoning
 """
 
-from mistralai import Mistral
+import hashlib
+import json
+import logging
+import threading
+import warnings
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from app.config import settings
+from app.services.agents.prompts import read_prompt_resource
+from app.services.agents.tools.function_schemas import schema_json, thaw_schema
+
+if TYPE_CHECKING:
+    from mistralai import Mistral
+
+# Upper bound for agent instructions. Prompts above it cost noticeably more prefill per
+# turn and should be trimmed rather than grown further.
+INSTRUCTIONS_TOKEN_BUDGET = 4096
+
+# Mistral's tokenizer averages well above 3 UTF-8 bytes per token for German and
+# English prose, so dividing by 3 over-estimates the token count
+_BYTES_PER_TOKEN = 3
+
+
+@lru_cache(maxsize=32)
+def _utf8_bytes(text: str) -> bytes:
+    """UTF-8 encoding of a prompt text, kept as one shared buffer per prompt
+
+    The agent instructions are module constants that are encoded for the token
+    estimate and both configuration hashes on every create_agent() call; the cache
+    encodes each of them once per process.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        bytes: UTF-8 encoded text
+    """
+    return text.encode("utf-8")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate (conservatively) how many tokens a prompt occupies
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        int: Estimated token count
+    """
+    return -(-len(_utf8_bytes(text)) // _BYTES_PER_TOKEN)
+
+
+@lru_cache(maxsize=32)
+def _instructions_digest(instructions: str) -> bytes:
+    """Digest of an instruction text, computed once per process per prompt"""
+    return hashlib.blake2b(_utf8_bytes(instructions), digest_size=16).digest()
+
+
+@lru_cache(maxsize=32)
+def _md5_after_instructions(instructions: str) -> "hashlib._Hash":
+    """md5 state after feeding an instruction text; callers continue on a copy()"""
+    return hashlib.md5(_utf8_bytes(instructions))
+
+
+# Agent IDs already created or verified by this process, keyed by configuration
+# fingerprint. Identical create_agent() calls skip the Mistral round trips entirely.
+_agent_ids_by_config: dict[str, str] = {}
+
+
+def _config_fingerprint(model: str, name: str, description: str, instructions: str, tools: list[Mapping]) -> str:
+    """Fingerprint the complete agent configuration passed to create_agent()"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, name, description):
+        digest.update(_utf8_bytes(part))
+        digest.update(b"\0")
+    digest.update(_instructions_digest(instructions))
+    for tool in tools:
+        digest.update(schema_json(tool))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# Optional on-disk copy of the map above (settings.AGENT_ID_CACHE_PATH), so warm restarts
+# with unchanged prompts skip Mistral entirely. Entries are grouped per Mistral workspace, so
+# deployments sharing the file never reuse each other's agents:
+# {"<workspace>": {"Agent Name": {"id": ..., "fingerprint": ...}}}
+_agent_id_file_lock = threading.Lock()
+
+
+def _workspace_key() -> str:
+    """Identify the Mistral organization and API key the agent IDs belong to"""
+    digest = hashlib.blake2b(digest_size=8)
+    for part in (settings.MISTRAL_ORG_ID, settings.MISTRAL_API_KEY):
+        digest.update(_utf8_bytes(part))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _read_agent_id_file() -> dict[str, dict[str, dict[str, str]]]:
+    """Read the whole agent ID file (empty if disabled, missing or unreadable)"""
+    if not settings.AGENT_ID_CACHE_PATH:
+        return {}
+    try:
+        entries = json.loads(Path(settings.AGENT_ID_CACHE_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_agent_id_file(path: Path, entries: dict[str, dict[str, dict[str, str]]]) -> None:
+    """Atomically replace the agent ID file"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_suffix(path.suffix + ".tmp")
+        temporary_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        temporary_path.replace(path)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Could not write agent ID cache {path}: {e}")
+
+
+def _read_persisted_agent_ids() -> dict[str, dict[str, str]]:
+    """Read the persisted agent IDs of the configured Mistral workspace"""
+    workspace_entries = _read_agent_id_file().get(_workspace_key())
+    return workspace_entries if isinstance(workspace_entries, dict) else {}
+
+
+def _persist_agent_id(name: str, agent_id: str, fingerprint: str) -> None:
+    """Record an agent ID and its configuration fingerprint in the agent ID file"""
+    if not settings.AGENT_ID_CACHE_PATH:
+        return
+    workspace = _workspace_key()
+    with _agent_id_file_lock:
+        entries = _read_agent_id_file()
+        workspace_entries = entries.get(workspace)
+        if not isinstance(workspace_entries, dict):
+            workspace_entries = {}
+        workspace_entries[name] = {"id": agent_id, "fingerprint": fingerprint}
+        entries[workspace] = workspace_entries
+        _write_agent_id_file(Path(settings.AGENT_ID_CACHE_PATH), entries)
+
+
+def forget_agent_ids() -> None:
+    """Drop all remembered agent IDs so the next create_agent() looks agents up in Mistral
+
+    Called when a remembered agent cannot be used, e.g. because it was deleted in Mistral.
+    """
+    _agent_ids_by_config.clear()
+    if not settings.AGENT_ID_CACHE_PATH:
+        return
+    with _agent_id_file_lock:
+        entries = _read_agent_id_file()
+        if entries.pop(_workspace_key(), None) is not None:
+            _write_agent_id_file(Path(settings.AGENT_ID_CACHE_PATH), entries)
 
 
 class AgentFactory:
     """Factory for creating and managing Mistral AI agents"""
 
     def __init__(self):
-        """Initialize Mistral client with API key from settings"""
-        self.client = Mistral(api_key=settings.MISTRAL_API_KEY)
+        """Initialize factory; the agent listing is fetched on first use"""
+        self._agents_by_name: dict[str, Any] | None = None
+        self._agents_lock = threading.Lock()
+
+    @cached_property
+    def client(self) -> "Mistral":
+        """Mistral client with API key from settings, created on first API call
+
+        The SDK is imported here so code that only needs the prompt constants does not
+        load it.
+        """
+        from mistralai import Mistral
+
+        return Mistral(api_key=settings.MISTRAL_API_KEY)
+
+    def _find_agent(self, name: str) -> Any | None:
+        """Find an existing agent by name using the cached agent listing
+
+        The listing is fetched once per factory. A miss on an older listing refetches
+        it once, in case the agent was created elsewhere in the meantime.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Agent object from the Mistral API, or None if no agent has this name
+        """
+        with self._agents_lock:
+            fetched = self._agents_by_name is None
+            if fetched:
+                self._agents_by_name = self._list_agents_by_name()
+            agent = self._agents_by_name.get(name)
+            if agent is None and not fetched:
+                self._agents_by_name = self._list_agents_by_name()
+                agent = self._agents_by_name.get(name)
+            return agent
+
+    def _list_agents_by_name(self) -> dict[str, Any]:
+        """Fetch all agents, keeping the first agent for duplicate names"""
+        agents_by_name: dict[str, Any] = {}
+        for agent in self.client.beta.agents.list():
+            agents_by_name.setdefault(agent.name, agent)
+        return agents_by_name
+
+    def _remember_agent(self, agent: Any) -> None:
+        """Store a created or updated agent in the cached listing"""
+        with self._agents_lock:
+            if self._agents_by_name is not None:
+                self._agents_by_name[agent.name] = agent
+
+    def invalidate(self) -> None:
+        """Drop the cached agent listing so the next lookup refetches it"""
+        with self._agents_lock:
+            self._agents_by_name = None
 
     def _compute_hash(self, instructions: str, description: str, tools: list | None) -> str:
-        """Compute hash of agent configuration to detect changes."""
-        import hashlib
+        """Compute hash of agent configuration to detect changes.
 
-        content = f"{instructions}|{description}|{str(tools or [])}"
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        Feeds the parts to the hasher one by one instead of first joining them into
+        a new multi-KB string; the digest equals md5 of the "|"-joined text. The
+        instructions are hashed once per process and the hasher state is reused.
+        """
+        digest = _md5_after_instructions(instructions).copy()
+        for part in ("|", description, "|"):
+            digest.update(_utf8_bytes(part))
+        digest.update(str(tools or []).encode())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _matches_remote(agent: Any, description: str, instructions: str, tools: list[dict]) -> bool:
+        """Compare an existing agent's configuration with the requested one field by field
+
+        Used when the hash embedded in the description does not match (e.g. an agent
+        created without it). Any difference, including one caused by how the SDK
+        represents tools, counts as a mismatch and leads to an update.
+
+        Args:
+            agent: Agent object from the Mistral API
+            description: Requested description (without hash prefix)
+            instructions: Requested instructions
+            tools: Requested tool definitions as plain dicts
+
+        Returns:
+            bool: True if description, instructions and tools are identical
+        """
+        remote_description = getattr(agent, "description", "") or ""
+        if remote_description.startswith("[") and "] " in remote_description:
+            remote_description = remote_description[remote_description.index("] ") + 2 :]
+        if remote_description != description or getattr(agent, "instructions", None) != instructions:
+            return False
+
+        remote_tools = [
+            tool.model_dump(exclude_none=True) if hasattr(tool, "model_dump") else tool
+            for tool in getattr(agent, "tools", None) or []
+        ]
+        return remote_tools == tools
 
     def create_agent(
         self,
@@ -35,7 +275,7 @@ class AgentFactory:
         name: str,
         description: str,
         instructions: str,
-        tools: list[dict] | None = None,
+        tools: list[Mapping] | None = None,
     ) -> str:
         """Create or Update a Mistral AI agent
 
@@ -51,23 +291,37 @@ class AgentFactory:
             name: Agent name
             description: Agent description
             instructions: Agent instructions
-            tools: Process list of tools
+            tools: Tool definitions (plain or frozen schema mappings)
 
         Returns:
             str: Agent ID
         """
-        import logging
-
         logger = logging.getLogger(__name__)
 
-        # 1. List existing agents to check for duplicates
-        existing_agents = self.client.beta.agents.list()
+        instruction_tokens = estimate_tokens(instructions)
+        if instruction_tokens > INSTRUCTIONS_TOKEN_BUDGET:
+            logger.warning(
+                f"Agent '{name}' instructions are ~{instruction_tokens} tokens, "
+                f"over the {INSTRUCTIONS_TOKEN_BUDGET} token budget"
+            )
+
+        fingerprint = _config_fingerprint(model, name, description, instructions, tools or [])
+        cached_agent_id = _agent_ids_by_config.get(fingerprint)
+        if cached_agent_id:
+            logger.info(f"Agent '{name}' already up to date in this process, reusing {cached_agent_id}")
+            return cached_agent_id
+
+        persisted = _read_persisted_agent_ids().get(name)
+        if persisted and persisted.get("fingerprint") == fingerprint:
+            logger.info(f"Agent '{name}' unchanged since last start, reusing {persisted['id']}")
+            _agent_ids_by_config[fingerprint] = persisted["id"]
+            return persisted["id"]
 
-        target_agent = None
-        for agent in existing_agents:
-            if agent.name == name:
-                target_agent = agent
-                break
+        # The SDK expects plain dicts; frozen schemas are copied per call
+        tools = [thaw_schema(tool) for tool in tools or []]
+
+        # 1. Look up existing agent by name to avoid duplicates
+        target_agent = self._find_agent(name)
 
         # Compute hash of new configuration
         new_hash = self._compute_hash(instructions, description, tools)
@@ -85,17 +339,29 @@ class AgentFactory:
             if existing_hash == new_hash:
                 # No changes, skip update to preserve version
                 logger.info(f"Agent '{name}' unchanged (hash={new_hash[:8]}...), skipping update")
+                _agent_ids_by_config[fingerprint] = target_agent.id
+                _persist_agent_id(name, target_agent.id, fingerprint)
+                return target_agent.id
+
+            if self._matches_remote(target_agent, description, instructions, tools):
+                # Missing or outdated hash, but the remote configuration is identical
+                logger.info(f"Agent '{name}' unchanged (remote configuration identical), skipping update")
+                _agent_ids_by_config[fingerprint] = target_agent.id
+                _persist_agent_id(name, target_agent.id, fingerprint)
                 return target_agent.id
 
             # 3. Update needed - embed hash in description
             logger.info(f"Agent '{name}' changed, updating (hash={new_hash[:8]}...)")
             description_with_hash = f"[{new_hash}] {description}"
-            self.client.beta.agents.update(
+            updated_agent = self.client.beta.agents.update(
                 agent_id=target_agent.id,
                 description=description_with_hash,
                 instructions=instructions,
-                tools=tools or [],
+                tools=tools,
             )
+            self._remember_agent(updated_agent)
+            _agent_ids_by_config[fingerprint] = target_agent.id
+            _persist_agent_id(name, target_agent.id, fingerprint)
             return target_agent.id
         else:
             # 3. Create new agent with hash in description
@@ -105,352 +371,61 @@ class AgentFactory:
                 name=name,
                 description=description_with_hash,
                 instructions=instructions,
-                tools=tools or [],
+                tools=tools,
             )
+            self._remember_agent(agent)
+            _agent_ids_by_config[fingerprint] = agent.id
+            _persist_agent_id(name, agent.id, fingerprint)
             return agent.id
 
 
-# Common instruction templates
-SUMII_CORE_DOS_DONTS = """
-<<<SUMII CORE PRINCIPLES - PROFESSIONAL LAWYER ASSISTANT>>>
-
-YOUR ROLE: You are an intelligent, professional lawyer assistant helping users understand their legal situations.
-You are NOT providing legal advice or making legal decisions - you are gathering facts, asking smart questions,
-and preparing information for actual lawyers to review.
-
-DO:
-- Be an intelligent, adaptive, and insightful interviewer
-- Ask ONE focused question at a time (never overwhelm users)
-- Briefly acknowledge the situation, then move to gathering facts
-- Listen actively and adapt based on responses
-- Build trust through professional, efficient communication
-- Guide conversations naturally without legal jargon
-- Use plain language - avoid legal terminology unless the user uses it first
-- Use information gathered to ask more informed follow-up questions
-- Be respectful and non-judgmental
-
-DON'T:
-- Don't provide legal advice or make legal judgments
-- Don't explain laws or legal theory unless explicitly asked
-- Don't dump multiple questions at once
-- Don't assume information - always confirm details
-- Don't make users feel judged about their situation
-- Don't use complex legal jargon or terminology
-- Don't rush through the conversation
-- Don't overwhelm users with legal technicalities
-- Don't be overly emotional or effusive in empathy
-- Don't act like a lawyer - act like a helpful assistant preparing information for lawyers
-
-<<<DOCUMENT ATTACHMENTS - CRITICAL (READ THIS FIRST)>>>
-
-**IMPORTANT**: When the user uploads a file (image, PDF), the system has ALREADY extracted
-the text using OCR. This extracted text is included ABOVE the user's request.
-
-Look for this marker: "--- BEGIN EXTRACTED CONTENT FROM 'filename' ---"
-
-THE EXTRACTED TEXT IS THE DOCUMENT CONTENT. You can "see" it. Analyze it.
-
-DO:
-- ANALYZE the extracted text as if you are looking at the actual document
-- ACKNOWLEDGE what you see (e.g., "I see your residence permit for Erika Mustermann")
-- USE the information to answer the user's question or pre-fill facts
-- TREAT the OCR text as complete document access
-
-NEVER:
-- NEVER say "I don't have tools to read files" - YOU HAVE THE TEXT RIGHT HERE
-- NEVER say "I can't analyze images" - THE TEXT HAS BEEN EXTRACTED FOR YOU
-- NEVER ask for information that is clearly visible in the extracted text
-
-<<<PRIVACY & DATA HANDLING - CRITICAL>>>
-
-You are a LEGAL ASSISTANT. Handling personal documents (contracts, licenses, letters) is your JOB.
-- The user has voluntarily uploaded these documents for your review.
-- It is safe and permitted to read names, dates, addresses, and personal details from these files.
-- DO NOT REFUSE to analyze a document because it contains personal info (PII).
-- Treat all data confidentially, but YOU MUST PROCESS IT to help the user.
-
-<<<TONE AND STYLE>>>
-- Professional and efficient
-- Brief acknowledgment (e.g., "Verstehe", "Okay") then focus on facts
-- Clear and concise (plain language, not legal language)
-- Adaptive to user's communication style
-- Non-judgmental and supportive
-
-<<<RESPONSE FORMAT - CRITICAL>>>
-- Maximum 3-4 sentences per response
-- Be precise and professional
-- No internal system explanations to user
-- No "connecting to specialist" messages
-- Focus on the user's immediate need
-"""
-
-GERMAN_LANGUAGE_INSTRUCTIONS = """
-<<<LANGUAGE ADAPTATION>>>
-
-AUTOMATIC LANGUAGE DETECTION:
-- Detect user language automatically (German or English)
-- Maintain consistent language throughout conversation
-
-GERMAN FORMALITY (du/Sie) AUTO-SWITCHING:
-- DEFAULT: Use informal "du" tone for approachability
-- DETECTION: If user uses "Sie" (formal), immediately switch to "Sie"
-- CONSISTENCY: Once formality level is set, maintain it throughout
-
-Examples of detection:
-User: "Können Sie mir helfen?" → Switch to Sie
-User: "Kannst du mir helfen?" → Stay with du
-User: "Ich brauche Hilfe" → Default to du (ambiguous)
-
-FORMALITY MARKERS:
-Sie indicators: "Sie", "Ihnen", "Ihr", "können Sie"
-du indicators: "du", "dir", "dein", "kannst du"
-
-Once detected, apply consistently:
-- Sie mode: "Können Sie mir mehr erzählen?"
-- du mode: "Kannst du mir mehr erzählen?"
-"""
-
-MISTRAL_STRUCTURE_GUIDELINES = """
-<<<STRUCTURED PROMPTING>>>
-
-Use clear delimiters for organization:
-<<< SECTION_NAME >>>
-Content here
-<<<>>>
-
-Benefits:
-- Improved readability for the model
-- Clear separation of concerns
-- Better instruction following
-- Easier to debug and maintain
-"""
-
-# DEPRECATED: BGB_REFERENCE_GUIDE removed - Sumii does not provide legal analysis
-# Legal analysis is done by lawyers. Sumii only collects facts.
-BGB_REFERENCE_GUIDE = """[DEPRECATED - Not used. Sumii only gathers facts, does not analyze law.]"""
+# Common instruction templates, shipped as text files in the prompts package
+SUMII_CORE_DOS_DONTS = read_prompt_resource("core_dos_donts.md")
+GERMAN_LANGUAGE_INSTRUCTIONS = read_prompt_resource("german_language.md")
+MISTRAL_STRUCTURE_GUIDELINES = read_prompt_resource("structure_guidelines.md")
 
 # Few-shot examples for different conversation scenarios
-INTAKE_FEW_SHOT_EXAMPLES = """
-<<<FEW-SHOT EXAMPLES: INTAKE CONVERSATIONS>>>
-
-EXAMPLE 1: Mietrecht (Informal du)
-User: "Meine Heizung ist kaputt und der Vermieter tut nichts"
-Agent: "Verstehe. Seit wann ist die Heizung denn kaputt?"
-User: "Seit zwei Wochen"
-Agent: "Okay. Hast du deinem Vermieter schon Bescheid gesagt?"
-User: "Ja, per E-Mail letzte Woche"
-Agent: "Gut, dass du es schriftlich gemacht hast. Hat er darauf reagiert?"
-
-EXAMPLE 2: Arbeitsrecht (Formal Sie)
-User: "Ich habe eine Kündigung erhalten und bin mir unsicher, ob diese rechtens ist"
-Agent: "Verstehe. Wann haben Sie die Kündigung erhalten?"
-User: "Gestern per Brief"
-Agent: "Okay. Welche Kündigungsfrist wurde Ihnen genannt?"
-User: "3 Monate zum Monatsende"
-Agent: "Und wie lange sind Sie bereits bei Ihrem Arbeitgeber beschäftigt?"
-
-EXAMPLE 3: Vertragsrecht (English)
-User: "I signed a contract but the company didn't deliver what they promised"
-Agent: "I understand. When did you sign the contract?"
-User: "Two months ago"
-Agent: "Okay. And when was the delivery supposed to happen?"
-User: "They promised delivery within 4 weeks"
-Agent: "Have you contacted them about the delay?"
-
-<<<KEY PATTERNS>>>
-- ONE question at a time
-- Brief acknowledgment ("Verstehe", "Okay", "I understand")
-- Build on previous answers
-- Confirm important details
-- Never lecture about laws during intake
-"""
+INTAKE_FEW_SHOT_EXAMPLES = read_prompt_resource("intake_few_shot_examples.md")
 
 # Fact Completion Examples - Focus on gathering complete information for lawyers
-FACT_COMPLETION_EXAMPLES = """
-<<<FEW-SHOT EXAMPLES: INTELLIGENT FACT-GATHERING>>>
-
-SCENARIO: Broken heating in rental apartment
-Facts collected so far:
-- Heating broken for 2 weeks
-- Landlord notified via email 1 week ago
-- No response from landlord
-- Winter season
-
-What's still missing that a lawyer would need:
-- Documentation: Do they have copies of emails sent?
-- Impact: How severely is the apartment affected? All rooms?
-- Action taken: Have they had to use alternative heating? Cost?
-- Property details: Rent amount? Address for jurisdiction?
-
-Good follow-up questions:
-1. "Hast du noch Kopien von den E-Mails, die du geschickt hast?"
-2. "Wie viele Räume sind davon betroffen? Die ganze Wohnung?"
-3. "Musstest du einen Heizlüfter kaufen oder andere Kosten gehabt?"
-
-SCENARIO: Employment termination
-Facts collected so far:
-- Termination received yesterday
-- 3 months notice period
-- Employee for 5 years
-- No reason given in letter
-
-What's still missing that a lawyer would need:
-- Document: Is the termination in writing? Signature?
-- Type: Does it say "ordentliche" or "außerordentliche" Kündigung?
-- Context: Were there recent conflicts or warnings?
-- Support: Is there a works council (Betriebsrat)?
-
-Good follow-up questions:
-1. "Hast du das Kündigungsschreiben noch? Ist es unterschrieben?"
-2. "Gab es in den letzten Monaten Konflikte oder Abmahnungen?"
-3. "Gibt es bei dir einen Betriebsrat?"
-
-<<<KEY PRINCIPLE>>>
-Collect ALL facts a lawyer needs to give proper advice.
-DON'T try to give that advice yourself - that's the lawyer's job.
-"""
-
-# DEPRECATED: Old name kept for backwards compatibility
-REASONING_FEW_SHOT_EXAMPLES = FACT_COMPLETION_EXAMPLES
-
-SUMMARY_FEW_SHOT_EXAMPLES = """
-<<<FEW-SHOT EXAMPLES: LEGAL SUMMARIES>>>
-
-EXAMPLE 1: Mietrecht - Broken Heating
-```markdown
-# Rechtliche Zusammenfassung
-## Fall-ID: 550e8400-e29b-41d4-a716-446655440000
-## Erstellt: 2025-01-24
-
-### 1. Sachverhalt (Facts)
-**Beteiligte Personen:**
-- **Mandant/in:** Max Mustermann
-- **Gegenseite:** Vermieter GmbH
-- **Zeugen:** Keine
-
-**Rechtsgebiet:** Mietrecht
-
-**Zeitablauf:**
-- 10.01.2025: Heizung fällt aus
-- 17.01.2025: Schriftliche Mängelanzeige per E-Mail
-- 24.01.2025: Noch keine Reaktion des Vermieters
-
-**Ort/Zuständigkeit:** Berlin
-
-### 2. Rechtliche Würdigung (Legal Assessment)
-
-**Anwendbare Gesetze:**
-- **§ 535 Abs. 1 BGB:** Vermieter ist verpflichtet, die Mietsache in einem
-    zum vertragsgemäßen Gebrauch geeigneten Zustand zu erhalten
-- **§ 536 BGB:** Bei einem Mangel ist die Miete kraft Gesetzes gemindert
-- **§ 536a BGB:** Schadensersatzanspruch bei schuldhafter Pflichtverletzung
-
-**Stärken des Falls:**
-- Schriftliche Mängelanzeige erfolgt (Beweissicherung)
-- Wesentlicher Mangel (Heizung im Winter)
-- 2 Wochen ohne Reaktion = Pflichtversäumnis
+FACT_COMPLETION_EXAMPLES = read_prompt_resource("fact_completion_examples.md")
 
-**Schwächen des Falls:**
-- Keine Fristsetzung in der Mängelanzeige erwähnt
-- Keine Dokumentation der Raumtemperaturen
+# DEPRECATED names, resolved on access by the module __getattr__ below (PEP 562) so they
+# are neither built at import nor used silently
+# - BGB_REFERENCE_GUIDE removed: Sumii does not provide legal analysis. Legal analysis is
+#   done by lawyers. Sumii only collects facts.
+# - REASONING_FEW_SHOT_EXAMPLES: old name of FACT_COMPLETION_EXAMPLES
+_DEPRECATED_NAMES = {
+    "BGB_REFERENCE_GUIDE": lambda: "[DEPRECATED - Not used. Sumii only gathers facts, does not analyze law.]",
+    "REASONING_FEW_SHOT_EXAMPLES": lambda: FACT_COMPLETION_EXAMPLES,
+}
 
-**Gesamtbewertung:** Strong
 
-### 3. Handlungsempfehlungen
+def __getattr__(name: str):
+    """Resolve deprecated module attributes with a DeprecationWarning"""
+    if name in _DEPRECATED_NAMES:
+        warnings.warn(f"{__name__}.{name} is deprecated", DeprecationWarning, stacklevel=2)
+        return _DEPRECATED_NAMES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-1. Nachweisliche Fristsetzung (z.B. 7 Tage) per Einschreiben
-2. Raumtemperaturen täglich dokumentieren
-3. Mietminderung berechnen (ca. 50-100% bei komplettem Heizungsausfall im Winter)
-4. Bei weiterer Untätigkeit: Ersatzvornahme (Reparatur auf Kosten des Vermieters)
 
-### 4. Nächste Schritte
-
-- [ ] Fristsetzung per Einschreiben verschicken
-- [ ] Temperaturdokumentation beginnen
-- [ ] Mietminderung ab Mangelanzeige berechnen
-- [ ] Ggf. Mieterschutzbund oder Anwalt konsultieren
-
----
-
-**Wichtiger Hinweis:** Diese Zusammenfassung stellt keine Rechtsberatung dar.
-Für verbindliche rechtliche Einschätzungen konsultieren Sie bitte einen Anwalt.
-```
-
-EXAMPLE 2: Arbeitsrecht - Termination
-```markdown
-# Rechtliche Zusammenfassung
-## Fall-ID: 660f9511-f3ac-52e5-b827-557766551111
-## Erstellt: 2025-01-24
-
-### 1. Sachverhalt (Facts)
-**Beteiligte Personen:**
-- **Mandant/in:** Anna Schmidt
-- **Gegenseite:** TechCorp AG
-- **Zeugen:** Keine angegeben
-
-**Rechtsgebiet:** Arbeitsrecht
-
-**Zeitablauf:**
-- 15.09.2020: Beginn des Arbeitsverhältnisses
-- 23.01.2025: Kündigung erhalten (3 Monate Frist)
-- Kündigungsdatum: 30.04.2025
-
-**Ort/Zuständigkeit:** Hamburg
-
-### 2. Rechtliche Würdigung (Legal Assessment)
-
-**Anwendbare Gesetze:**
-- **§ 622 Abs. 2 Nr. 2 BGB:** Kündigungsfrist nach 5 Jahren Betriebszugehörigkeit beträgt 2 Monate
-- **§ 623 BGB:** Schriftformerfordernis (erfüllt)
-- **§ 1 KSchG:** Kündigungsschutzgesetz bei >10 Mitarbeitern und >6 Monate Betriebszugehörigkeit
-
-**Stärken des Falls:**
-- Kündigungsfrist zu lang gewählt (3 statt 2 Monate) - zum Vorteil der Arbeitnehmerin
-- Schriftform eingehalten
-- Wahrscheinlich KSchG-Schutz (>5 Jahre beschäftigt)
-
-**Schwächen des Falls:**
-- Kündigungsgrund nicht bekannt (kann ordentlich oder außerordentlich sein)
-- Betriebsgröße unbekannt (relevant für KSchG)
-- Keine Information zu Betriebsrat-Anhörung
-
-**Gesamtbewertung:** Medium (mehr Informationen nötig)
-
-### 3. Handlungsempfehlungen
-
-1. **DRINGEND:** 3-Wochen-Frist für Kündigungsschutzklage beachten!
-2. Betriebsratsbeteiligung prüfen (falls vorhanden)
-3. Kündigungsgrund erfragen/dokumentieren
-4. Arbeitszeugnis anfordern
-5. Fachanwalt für Arbeitsrecht konsultieren
-
-### 4. Nächste Schritte
-
-- [ ] Fachanwalt innerhalb 1 Woche kontaktieren (Klagefrist!)
-- [ ] Unterlagen sammeln (Arbeitsvertrag, Kündigungsschreiben, Gehaltsabrechnungen)
-- [ ] Arbeitszeugnis schriftlich anfordern
-- [ ] Arbeitsagentur über Kündigung informieren
-
----
-
-**Wichtiger Hinweis:** Diese Zusammenfassung stellt keine Rechtsberatung dar.
-Für verbindliche rechtliche Einschätzungen konsultieren Sie bitte einen Anwalt.
-```
-
-<<<KEY PATTERNS>>>
-- Professional German legal terminology
-- Precise BGB references with descriptions
-- Clear timeline with dates
-- Honest assessment (strengths AND weaknesses)
-- Actionable recommendations with checkboxes
-- Always end with legal disclaimer
-"""
+# Global factory instance, shared so all agent operations reuse one Mistral client
+# (and its connection pool) and one cached agent listing
+_agent_factory: AgentFactory | None = None
+_agent_factory_lock = threading.Lock()
 
 
 def get_agent_factory() -> AgentFactory:
-    """Get a new AgentFactory instance
+    """Get or create the global AgentFactory instance
+
+    Agents are created from worker threads, so the first creation is guarded by a lock.
 
     Returns:
-        AgentFactory: Factory for creating agents
+        AgentFactory: Singleton factory for creating agents
     """
-    return AgentFactory()
+    global _agent_factory
+    if _agent_factory is None:
+        with _agent_factory_lock:
+            if _agent_factory is None:
+                _agent_factory = AgentFactory()
+    return _agent_factory
@@ -8,22 +8,16 @@ The Wrap-Up Agent:
 Language-aware: Responds in user's preferred language (DE/EN).
 """
 
+import re
+from functools import lru_cache
+
 from app.services.agents.utils import (
     GERMAN_LANGUAGE_INSTRUCTIONS,
     SUMII_CORE_DOS_DONTS,
     get_agent_factory,
 )
 
-
-def create_wrapup_agent() -> str:
-    """Create Wrap-Up Agent for confirmation before summary
-
-    Returns:
-        str: Agent ID
-    """
-    factory = get_agent_factory()
-
-    instructions = f"""You are Sumii's wrap-up specialist.
+_WRAPUP_INSTRUCTIONS = f"""You are Sumii's wrap-up specialist.
 
 {SUMII_CORE_DOS_DONTS}
 
@@ -162,8 +156,61 @@ English: "Thank you for the correction. I will update that."
 - Cover ALL 5Ws, evidence, attachments, and actions taken
 - Wait for explicit user response before proceeding
 - Never proceed to Summary without user confirmation
+- Hand off to exactly ONE agent per turn: Summary Agent OR Fact Completion Agent, never both
 """
 
+
+# Reply signals listed in the prompt above. Correction signals win, so "Das stimmt nicht"
+# is not read as "stimmt"; confirmations only count for short replies without a question.
+_CORRECTION_PATTERN = re.compile(
+    r"""
+    \b(?:nein|falsch|nicht|eigentlich|aber|vergessen|no|not|wrong|incorrect|actually|but|forgot)\b
+    | \b(?:bis\s+auf|au[ßs]er|nur|except|only)\b  # Partial corrections ("Passt, bis auf das Datum")
+    | \b(?:korrigier|[äa]nder|change)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_CONFIRMATION_PATTERN = re.compile(
+    r"\b(?:ja|stimmt|passt|ok(?:ay)?|richtig|genau|korrekt|yes|correct|right|looks\s+good)\b",
+    re.IGNORECASE,
+)
+_MAX_CONFIRMATION_LENGTH = 60
+
+
+@lru_cache(maxsize=256)
+def _classify_normalized_reply(normalized_reply: str) -> str | None:
+    """Classify a normalized reply (cached by exact normalized text)"""
+    if _CORRECTION_PATTERN.search(normalized_reply):
+        return "correction"
+    if (
+        len(normalized_reply) <= _MAX_CONFIRMATION_LENGTH
+        and "?" not in normalized_reply
+        and _CONFIRMATION_PATTERN.search(normalized_reply)
+    ):
+        return "confirmation"
+    return None
+
+
+def classify_wrapup_reply(message: str) -> str | None:
+    """Classify the user's answer to the wrap-up question without an LLM call
+
+    Args:
+        message: User message text (without the injected language instruction)
+
+    Returns:
+        str | None: "confirmation", "correction", or None if the reply is ambiguous
+    """
+    return _classify_normalized_reply(" ".join(message.casefold().split()))
+
+
+def create_wrapup_agent() -> str:
+    """Create Wrap-Up Agent for confirmation before summary
+
+    Returns:
+        str: Agent ID
+    """
+    factory = get_agent_factory()
+
     return factory.create_agent(
         model="mistral-medium-2505",
         name="Wrap-Up Agent",
@@ -172,5 +219,5 @@ Presents structured 5W summary in markdown format, detects user confirmation/cor
 On confirmation: handoff to Summary Agent.
 On correction: handoff back to Fact Completion Agent.
 Language-aware: responds in user's preferred language (DE/EN).""",
-        instructions=instructions,
+        instructions=_WRAPUP_INSTRUCTIONS,
     )
@@ -4,22 +4,123 @@ This service handles communication with the sumii-anwalt backend (lawyer-facing
 to search for lawyers and connect users with legal professionals.
 """
 
+import asyncio
+import json
 import logging
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# How long fetched lawyer profiles are reused before asking sumii-anwalt again
+PROFILE_CACHE_TTL_SECONDS = 60.0
+
+# How long identical lawyer searches are answered from memory, and how many are kept
+SEARCH_CACHE_TTL_SECONDS = 30.0
+SEARCH_CACHE_MAX_ENTRIES = 512
+
+# Fields of a lawyer profile (search results additionally carry the distance)
+PROFILE_FIELDS = ("id", "full_name", "bar_id", "specialization", "location", "languages")
+
+
+@dataclass(frozen=True, slots=True)
+class LawyerSearchParams:
+    """Normalized lawyer search parameters, used both as query and as cache key
+
+    Coordinates are rounded to three decimals (~100 m) so near-identical GPS fixes
+    produce the same search.
+    """
+
+    lang: str
+    legal_area: str | None = None
+    lat: float | None = None
+    lng: float | None = None
+    radius: float | None = None
+    fields: tuple[str, ...] | None = None
+
+    @classmethod
+    def create(
+        cls,
+        language: str,
+        legal_area: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius_km: float | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> "LawyerSearchParams":
+        """Build normalized parameters from search_lawyers() arguments"""
+        return cls(
+            lang=language,
+            legal_area=legal_area or None,
+            lat=round(latitude, 3) if latitude is not None else None,
+            lng=round(longitude, 3) if longitude is not None else None,
+            radius=radius_km or None,
+            fields=tuple(fields) if fields else None,
+        )
+
+    def to_query(self) -> dict[str, Any]:
+        """Query parameters for GET /anwalt/profiles (unset values omitted)"""
+        query: dict[str, Any] = {"lang": self.lang}
+        if self.legal_area:
+            query["legal_area"] = self.legal_area
+        if self.lat is not None:
+            query["lat"] = self.lat
+        if self.lng is not None:
+            query["lng"] = self.lng
+        if self.radius:
+            query["radius"] = self.radius
+        if self.fields:
+            query["fields"] = ",".join(self.fields)
+        return query
+
 
 class AnwaltService:
     """Service for interacting with sumii-anwalt backend API"""
 
     def __init__(self):
-        """Initialize Anwalt service with base URL from config"""
+        """Initialize Anwalt service with base URL from config
+
+        One HTTP client is kept per service so connections to sumii-anwalt are pooled
+        and kept alive across requests instead of reconnecting on every call. HTTP/2 is
+        negotiated via TLS ALPN; plain-HTTP backends keep using HTTP/1.1.
+        """
         self.base_url = settings.ANWALT_API_BASE_URL.rstrip("/")
+        self._profile_cache: dict[int, tuple[float, dict[str, Any] | None]] = {}
+        self._profile_endpoint_available = True
+        self._search_cache: dict[LawyerSearchParams, tuple[float, list[dict[str, Any]]]] = {}
+        self._search_inflight: dict[LawyerSearchParams, asyncio.Task[list[dict[str, Any]]]] = {}
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,  # Multiplex concurrent requests on one connection where the server supports it
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_connections=settings.ANWALT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.ANWALT_MAX_KEEPALIVE,
+            ),
+        )
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to sumii-anwalt ahead of the first user request
+
+        Resolves DNS and completes the TCP (and TLS) handshake at startup. The response
+        status does not matter, and failures only mean the first request pays the setup.
+        """
+        try:
+            await self._client.head("/health", timeout=2.0)
+        except httpx.HTTPError as e:
+            logger.warning("Could not pre-connect to sumii-anwalt: %s", e)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        await self._client.aclose()
 
     async def search_lawyers(
         self,
@@ -28,10 +129,13 @@ class AnwaltService:
         latitude: float | None = None,
         longitude: float | None = None,
         radius_km: float = 10.0,
+        fields: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Search for lawyers in sumii-anwalt directory
 
-        Calls the public /anwalt/profiles endpoint on sumii-anwalt backend.
+        Calls the public /anwalt/profiles endpoint on sumii-anwalt backend. Results are
+        cached for SEARCH_CACHE_TTL_SECONDS per set of search parameters, and concurrent
+        identical searches share one request.
 
         Args:
             language: Language code (required: "de" or "en")
@@ -39,6 +143,7 @@ class AnwaltService:
             latitude: Latitude for location-based search (optional)
             longitude: Longitude for location-based search (optional)
             radius_km: Search radius in kilometers (default: 10.0)
+            fields: Profile fields to return (optional; ignored by backends without field selection)
 
         Returns:
             List of lawyer profile dictionaries with fields:
@@ -58,33 +163,101 @@ class AnwaltService:
         if language not in ["de", "en"]:
             raise ValueError(f"Invalid language code: {language}. Must be 'de' or 'en'")
 
-        # Build query parameters
-        params: dict[str, Any] = {"lang": language}
-        if legal_area:
-            params["legal_area"] = legal_area
-        if latitude is not None:
-            params["lat"] = latitude
-        if longitude is not None:
-            params["lng"] = longitude
-        if radius_km:
-            params["radius"] = radius_km
+        # Identical searches within SEARCH_CACHE_TTL_SECONDS share one upstream call
+        search = LawyerSearchParams.create(language, legal_area, latitude, longitude, radius_km, fields)
+        cached = self._search_cache.get(search)
+        if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL_SECONDS:
+            return cached[1]
 
+        # Concurrent identical searches wait for the request already in flight. The request
+        # runs in its own task, so a cancelled caller does not cancel it for the others.
+        inflight = self._search_inflight.get(search)
+        if inflight is None:
+            inflight = asyncio.create_task(self._fetch_and_cache_lawyers(search))
+            self._search_inflight[search] = inflight
+            inflight.add_done_callback(lambda _: self._search_inflight.pop(search, None))
+        return await asyncio.shield(inflight)
+
+    async def _fetch_and_cache_lawyers(self, search: LawyerSearchParams) -> list[dict[str, Any]]:
+        """Request lawyers from sumii-anwalt and cache the result for SEARCH_CACHE_TTL_SECONDS"""
+        lawyers = await self._fetch_lawyers(search)
+        self._search_cache.pop(search, None)
+        if len(self._search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[search] = (time.monotonic(), lawyers)
+        return lawyers
+
+    async def _fetch_lawyers(self, search: LawyerSearchParams) -> list[dict[str, Any]]:
+        """Request lawyers from sumii-anwalt (uncached)"""
         # Make request to sumii-anwalt backend
-        url = f"{self.base_url}/anwalt/profiles"
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, params=params)
+            response = await self._client.get("/anwalt/profiles", params=search.to_query())
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error("Failed to search lawyers in sumii-anwalt: %s", e)
+            raise Exception(f"Failed to search lawyers: {str(e)}") from e
+
+    async def stream_lawyers(self, language: str, fields: Sequence[str] | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Yield lawyer profiles from the directory while the response is still arriving
+
+        Profiles are decoded one by one as the JSON array streams in, so a caller looking
+        for a single lawyer can stop early and the full body is never buffered. Close the
+        iterator (e.g. with contextlib.aclosing) when stopping early.
+
+        Args:
+            language: Language code ("de" or "en")
+            fields: Profile fields to return (optional)
+
+        Yields:
+            dict: Lawyer profile (see search_lawyers)
+
+        Raises:
+            Exception: If the API request fails
+        """
+        params = LawyerSearchParams.create(language, fields=fields).to_query()
+
+        decoder = json.JSONDecoder()
+        buffer = ""
+        in_array = False
+        try:
+            async with self._client.stream("GET", "/anwalt/profiles", params=params) as response:
                 response.raise_for_status()
-                return response.json()
+                async for text in response.aiter_text():
+                    buffer += text
+                    index = 0
+                    while True:
+                        # Skip separators between profiles
+                        while index < len(buffer) and buffer[index] in " \t\r\n,":
+                            index += 1
+                        if index == len(buffer):
+                            break
+                        if not in_array:
+                            if buffer[index] != "[":
+                                raise ValueError("Expected a JSON array of lawyer profiles")
+                            in_array = True
+                            index += 1
+                            continue
+                        if buffer[index] == "]":
+                            return
+                        try:
+                            lawyer, index = decoder.raw_decode(buffer, index)
+                        except json.JSONDecodeError:
+                            break  # Profile not complete yet
+                        yield lawyer
+                    buffer = buffer[index:]
         except httpx.HTTPError as e:
-            logger.error(f"Failed to search lawyers in sumii-anwalt: {e}")
+            logger.error("Failed to stream lawyers from sumii-anwalt: %s", e)
             raise Exception(f"Failed to search lawyers: {str(e)}") from e
 
     async def get_lawyer_profile(self, lawyer_id: int) -> dict[str, Any] | None:
         """Get lawyer profile by ID
 
-        Note: This endpoint may not exist in sumii-anwalt yet.
-        For now, we can search and filter by ID client-side.
+        Profiles, and IDs that were not found, are cached for PROFILE_CACHE_TTL_SECONDS.
+        On a miss the single profile is requested from GET /anwalt/profiles/{id}. If
+        sumii-anwalt does not provide that endpoint, the directory is streamed until the
+        lawyer is found, caching every profile read on the way.
 
         Args:
             lawyer_id: Lawyer ID from sumii-anwalt
@@ -95,16 +268,34 @@ class AnwaltService:
         Raises:
             httpx.HTTPError: If API request fails
         """
-        # Search all lawyers and filter by ID
-        # This is inefficient but works until sumii-anwalt adds GET /anwalt/profiles/{id}
+        cached = self._profile_cache.get(lawyer_id)
+        if cached and time.monotonic() - cached[0] < PROFILE_CACHE_TTL_SECONDS:
+            return cached[1]
+
         try:
-            lawyers = await self.search_lawyers(language="de")  # Default language
-            for lawyer in lawyers:
-                if lawyer.get("id") == lawyer_id:
-                    return lawyer
+            if self._profile_endpoint_available:
+                response = await self._client.get(f"/anwalt/profiles/{lawyer_id}")
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    profile = orjson.loads(response.content)
+                    self._profile_cache[lawyer_id] = (time.monotonic(), profile)
+                    return profile
+
+            # Stream the directory, indexing profiles by ID, until the lawyer shows up
+            # (fallback for sumii-anwalt versions without GET /anwalt/profiles/{id})
+            fetched_at = time.monotonic()
+            async with aclosing(self.stream_lawyers(language="de", fields=PROFILE_FIELDS)) as lawyers:
+                async for lawyer in lawyers:
+                    self._profile_cache[lawyer.get("id")] = (fetched_at, lawyer)
+                    if lawyer.get("id") == lawyer_id:
+                        # Found in the directory although the single-profile endpoint returned 404
+                        self._profile_endpoint_available = False
+                        return lawyer
+            # Remember unknown IDs so repeated lookups skip the 404 and the directory stream
+            self._profile_cache[lawyer_id] = (fetched_at, None)
             return None
         except Exception as e:
-            logger.error(f"Failed to get lawyer profile {lawyer_id}: {e}")
+            logger.error("Failed to get lawyer profile %s: %s", lawyer_id, e)
             raise
 
     async def handoff_case(
@@ -152,25 +343,38 @@ class AnwaltService:
             payload["user_location"] = user_location
 
         # Make request to sumii-anwalt backend
-        url = f"{self.base_url}/api/cases/handoff"
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                return response.json()
+            response = await self._client.post("/api/cases/handoff", json=payload, timeout=30.0)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except httpx.HTTPError as e:
-            logger.error(f"Failed to hand off case to sumii-anwalt: {e}")
+            logger.error("Failed to hand off case to sumii-anwalt: %s", e)
             if hasattr(e, "response") and e.response is not None:
                 error_detail = e.response.text
-                logger.error(f"Error response: {error_detail}")
+                logger.error("Error response: %s", error_detail)
             raise Exception(f"Failed to hand off case to lawyer: {str(e)}") from e
 
 
+# Singleton instance (shares one connection pool across requests)
+_anwalt_service: AnwaltService | None = None
+
+
 # Dependency injection
 def get_anwalt_service() -> AnwaltService:
     """FastAPI dependency for AnwaltService
 
     Returns:
-        AnwaltService instance
+        AnwaltService singleton instance
     """
-    return AnwaltService()
+    global _anwalt_service
+    if _anwalt_service is None:
+        _anwalt_service = AnwaltService()
+    return _anwalt_service
+
+
+async def close_anwalt_service() -> None:
+    """Close the singleton's HTTP client on application shutdown"""
+    global _anwalt_service
+    if _anwalt_service is not None:
+        await _anwalt_service.aclose()
+        _anwalt_service = None
@@ -4,13 +4,57 @@ Programmatic management of Mistral AI Document Libraries for RAG (Retrieval-Augm
 Provides interviewing skills, real-world examples, and summary templates to agents.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 
+import httpx
 from mistralai import Mistral
 from mistralai.models import File
 
 from app.config import settings
 
+# Upper bound for uploads in flight at once (keeps library setup below Mistral rate limits)
+MAX_CONCURRENT_UPLOADS = 4
+
+# How long library metadata from Mistral is reused before fetching it again
+LIBRARY_INFO_TTL_SECONDS = 60.0
+
+# Larger documents are streamed from disk instead of being held in the read cache
+MAX_CACHED_DOCUMENT_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _mistral_client() -> Mistral:
+    """Create the process-wide Mistral client for library management
+
+    Sharing one client keeps TCP/TLS connections warm across service instances.
+    The libraries API has no batch upload, so concurrent uploads are instead
+    multiplexed over one HTTP/2 connection.
+
+    Returns:
+        Mistral: Client using an HTTP/2 capable connection pool
+    """
+    return Mistral(api_key=settings.MISTRAL_API_KEY, client=httpx.Client(http2=True))
+
+
+@lru_cache(maxsize=32)
+def _read_doc(path: str, mtime_ns: int) -> bytes:
+    """Read a library document, cached per file version
+
+    The modification time is part of the cache key, so an edited file is read
+    again while repeated uploads (MVP then complete library, retries) skip the disk.
+
+    Args:
+        path: File path
+        mtime_ns: Modification time of the file in nanoseconds
+
+    Returns:
+        bytes: File content
+    """
+    return Path(path).read_bytes()
+
 
 class DocumentLibraryService:
     """Manage Mistral document libraries programmatically
@@ -19,15 +63,44 @@ class DocumentLibraryService:
     Libraries are shared with agents to provide them with interviewing skills, real-world examples,
     and templates for generating lawyer-ready summaries.
 
+    Uploads run on a worker pool owned by the service; use it as a context manager
+    (or call close()) to shut the pool down when done.
+
     Attributes:
         client: Mistral AI client instance
         library_id: ID of the created/managed library (set after creation)
     """
 
+    DOCUMENTS: dict[str, Path] = {
+        "interviewing_skills": Path("docs/library/interviewing_skills.md"),
+        "real_world_examples": Path("docs/library/real_world_examples.md"),
+        "lawyer_ready_summaries": Path("docs/library/lawyer_ready_summaries.md"),
+        "legal_template": Path("docs/library/templates/SumiiCaseReportTemplate.md"),
+    }
+    MVP_DOCUMENTS = ("interviewing_skills", "lawyer_ready_summaries", "legal_template")
+    COMPLETE_DOCUMENTS = ("interviewing_skills", "real_world_examples", "lawyer_ready_summaries", "legal_template")
+
     def __init__(self):
-        """Initialize the Document Library Service with Mistral client"""
-        self.client = Mistral(api_key=settings.MISTRAL_API_KEY)
+        """Initialize the Document Library Service"""
         self.library_id: str | None = None
+        self._library_info: tuple[float, dict] | None = None
+        # Threads are only started on the first upload
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_UPLOADS, thread_name_prefix="library-upload")
+
+    @cached_property
+    def client(self) -> Mistral:
+        """Shared Mistral client, resolved on first use"""
+        return _mistral_client()
+
+    def __enter__(self) -> "DocumentLibraryService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the upload worker pool"""
+        self._executor.shutdown(wait=True)
 
     def create_sumii_library(self) -> str:
         """Create Sumii legal knowledge library
@@ -52,29 +125,98 @@ class DocumentLibraryService:
         self.library_id = library.id
         return library.id
 
-    def upload_interviewing_skills(self) -> None:
-        """Upload interviewing skills guide to library
+    def _upload_path(self, path: Path) -> None:
+        """Upload a single file to the library
 
-        Uploads empathetic interviewing techniques and questioning frameworks for legal situations.
-        This provides agents with knowledge on how to gather facts without overwhelming users.
+        Small files come from the read cache; files above MAX_CACHED_DOCUMENT_BYTES
+        are passed to the SDK as an open file so the body is streamed from disk.
+        Files are sent uncompressed: the upload endpoint has no content encoding
+        option and indexes the bytes as received.
+
+        Args:
+            path: File to upload
 
         Raises:
-            FileNotFoundError: If interviewing skills file doesn't exist
+            ValueError: If no library has been created yet
+            FileNotFoundError: If the file doesn't exist
             Exception: If upload fails
         """
         if not self.library_id:
             raise ValueError("Library must be created before uploading documents")
 
-        skills_path = Path("docs/library/interviewing_skills.md")
+        stat = path.stat()
+        if stat.st_size > MAX_CACHED_DOCUMENT_BYTES:
+            with open(path, "rb") as f:
+                self.client.beta.libraries.documents.upload(
+                    library_id=self.library_id,
+                    file=File(file_name=path.name, content=f),
+                )
+            return
+
+        self.client.beta.libraries.documents.upload(
+            library_id=self.library_id,
+            file=File(file_name=path.name, content=_read_doc(str(path), stat.st_mtime_ns)),
+        )
 
-        if not skills_path.exists():
-            raise FileNotFoundError(f"Interviewing skills file not found: {skills_path}")
+    def _upload(self, key: str) -> None:
+        """Upload one of the library DOCUMENTS
 
-        with open(skills_path, "rb") as f:
-            self.client.beta.libraries.documents.upload(
-                library_id=self.library_id,
-                file=File(file_name=skills_path.name, content=f.read()),
-            )
+        Args:
+            key: Key in DOCUMENTS
+
+        Raises:
+            FileNotFoundError: If the document file doesn't exist
+            Exception: If upload fails
+        """
+        (path,) = self._document_paths((key,))
+        self._upload_path(path)
+
+    def _document_paths(self, keys: tuple[str, ...]) -> list[Path]:
+        """Resolve library DOCUMENTS and check that all of them exist
+
+        Called before the library is created, so a missing file fails setup
+        without leaving an empty library behind on Mistral.
+
+        Args:
+            keys: Keys in DOCUMENTS
+
+        Returns:
+            list[Path]: Paths of the documents
+
+        Raises:
+            FileNotFoundError: If any document file doesn't exist
+        """
+        paths = [self.DOCUMENTS[key] for key in keys]
+        missing = [str(path) for path in paths if not path.exists()]
+        if missing:
+            raise FileNotFoundError(f"Library documents not found: {', '.join(missing)}")
+        return paths
+
+    def _upload_all(self, paths: list[Path]) -> None:
+        """Upload independent files in parallel on the worker pool
+
+        Each upload is a blocking round trip to Mistral, so running them in worker
+        threads makes setup take as long as the slowest upload instead of the sum.
+
+        Args:
+            paths: Files to upload
+
+        Raises:
+            Exception: The first upload failure
+        """
+        list(self._executor.map(self._upload_path, paths))
+
+    def upload_interviewing_skills(self) -> None:
+        """Upload interviewing skills guide to library
+
+        Uploads empathetic interviewing techniques and questioning frameworks for legal situations.
+        This provides agents with knowledge on how to gather facts without overwhelming users.
+
+        Raises:
+            FileNotFoundError: If interviewing skills file doesn't exist
+            Exception: If upload fails
+        """
+        self._upload("interviewing_skills")
 
     def upload_lawyer_ready_summaries_guide(self) -> None:
         """Upload lawyer-ready summaries guide
@@ -86,19 +228,7 @@ class DocumentLibraryService:
             FileNotFoundError: If summaries guide file doesn't exist
             Exception: If upload fails
         """
-        if not self.library_id:
-            raise ValueError("Library must be created before uploading documents")
-
-        summaries_guide_path = Path("docs/library/lawyer_ready_summaries.md")
-
-        if not summaries_guide_path.exists():
-            raise FileNotFoundError(f"Lawyer-ready summaries guide file not found: {summaries_guide_path}")
-
-        with open(summaries_guide_path, "rb") as f:
-            self.client.beta.libraries.documents.upload(
-                library_id=self.library_id,
-                file=File(file_name=summaries_guide_path.name, content=f.read()),
-            )
+        self._upload("lawyer_ready_summaries")
 
     def upload_legal_template(self) -> None:
         """Upload Sumii case report template
@@ -110,19 +240,7 @@ class DocumentLibraryService:
             FileNotFoundError: If template file doesn't exist
             Exception: If upload fails
         """
-        if not self.library_id:
-            raise ValueError("Library must be created before uploading documents")
-
-        template_path = Path("docs/library/templates/SumiiCaseReportTemplate.md")
-
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template file not found: {template_path}")
-
-        with open(template_path, "rb") as f:
-            self.client.beta.libraries.documents.upload(
-                library_id=self.library_id,
-                file=File(file_name=template_path.name, content=f.read()),
-            )
+        self._upload("legal_template")
 
     def upload_real_world_examples(self) -> None:
         """Upload real-world interview examples
@@ -134,42 +252,30 @@ class DocumentLibraryService:
             FileNotFoundError: If real-world examples file doesn't exist
             Exception: If upload fails
         """
-        if not self.library_id:
-            raise ValueError("Library must be created before uploading documents")
-
-        examples_path = Path("docs/library/real_world_examples.md")
-
-        if not examples_path.exists():
-            raise FileNotFoundError(f"Real-world examples file not found: {examples_path}")
-
-        with open(examples_path, "rb") as f:
-            self.client.beta.libraries.documents.upload(
-                library_id=self.library_id,
-                file=File(file_name=examples_path.name, content=f.read()),
-            )
+        self._upload("real_world_examples")
 
     def setup_mvp_library(self) -> str:
         """Create MVP library with essential content
 
         Minimal viable library:
         1. Creates library
-        2. Uploads interviewing skills guide
-        3. Uploads lawyer-ready summaries guide
-        4. Uploads legal template
+        2. Uploads interviewing skills guide, lawyer-ready summaries guide
+           and legal template concurrently
 
         Returns:
             library_id: ID of the configured library
 
         Raises:
+            FileNotFoundError: If a document is missing (checked before creating the library)
             Exception: If any step fails
         """
+        paths = self._document_paths(self.MVP_DOCUMENTS)
+
         # Create library
         library_id = self.create_sumii_library()
 
         # Upload essential content
-        self.upload_interviewing_skills()
-        self.upload_lawyer_ready_summaries_guide()
-        self.upload_legal_template()
+        self._upload_all(paths)
 
         return library_id
 
@@ -178,31 +284,32 @@ class DocumentLibraryService:
 
         Complete library for production use:
         1. Creates a new Mistral document library
-        2. Uploads interviewing skills guide
-        3. Uploads real-world examples
-        4. Uploads lawyer-ready summaries guide
-        5. Uploads legal template
+        2. Uploads interviewing skills guide, real-world examples,
+           lawyer-ready summaries guide and legal template concurrently
 
         Returns:
             library_id: ID of the configured library
 
         Raises:
+            FileNotFoundError: If a document is missing (checked before creating the library)
             Exception: If any step fails
         """
+        paths = self._document_paths(self.COMPLETE_DOCUMENTS)
+
         # Create library
         library_id = self.create_sumii_library()
 
         # Upload all documents
-        self.upload_interviewing_skills()
-        self.upload_real_world_examples()
-        self.upload_lawyer_ready_summaries_guide()
-        self.upload_legal_template()
+        self._upload_all(paths)
 
         return library_id
 
     def get_library_info(self) -> dict:
         """Get information about the current library
 
+        The result is reused for LIBRARY_INFO_TTL_SECONDS, since library metadata
+        rarely changes.
+
         Returns:
             dict: Library information including name, description, document count
 
@@ -212,13 +319,21 @@ class DocumentLibraryService:
         if not self.library_id:
             raise ValueError("No library ID set. Create a library first.")
 
+        now = time.monotonic()
+        if self._library_info:
+            fetched_at, info = self._library_info
+            if info["id"] == self.library_id and now - fetched_at < LIBRARY_INFO_TTL_SECONDS:
+                return info
+
         library = self.client.beta.libraries.get(library_id=self.library_id)
-        return {
+        info = {
             "id": library.id,
             "name": library.name,
             "description": library.description,
-            "created_at": library.created_at if hasattr(library, "created_at") else None,
+            "created_at": getattr(library, "created_at", None),
         }
+        self._library_info = (now, info)
+        return info
 
 
 # Dependency injection
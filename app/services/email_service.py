@@ -8,80 +8,129 @@ This service handles sending emails via AWS SES for:
 
 # ruff: noqa: E501 - HTML email templates contain long lines due to inline CSS
 
+import asyncio
+import json
 import logging
+import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from string import Template
+from typing import Any
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-
-class EmailService:
-    """Service for sending emails via AWS SES"""
-
-    def __init__(self):
-        """Initialize AWS SES client
-
-        Uses explicit credentials if provided, otherwise falls back to
-        boto3 default credential chain (~/.aws/credentials or IAM role).
-        """
-        try:
-            if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-                # Explicit credentials provided
-                self.ses_client = boto3.client(
-                    "ses",
-                    region_name=settings.AWS_REGION,
-                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                )
-            else:
-                # Use default boto3 credential chain (~/.aws/credentials, IAM role, etc.)
-                self.ses_client = boto3.client(
-                    "ses",
-                    region_name=settings.AWS_REGION,
-                )
-            self.from_email = settings.SES_FROM_EMAIL
-            logger.info("Email service initialized successfully")
-        except Exception as e:
-            logger.warning(f"Failed to initialize email service: {e}")
-            self.ses_client = None
-            self.from_email = None
-
-    def _build_branded_email(
-        self,
-        title: str,
-        message: str,
-        cta_text: str,
-        cta_url: str,
-        fallback_text: str,
-        fallback_url: str,
-        expiry_text: str,
-        language: str = "de",
-    ) -> str:
-        """Build a branded email template with consistent Sumii styling.
-
-        Args:
-            title: Email heading
-            message: Main message text
-            cta_text: Call-to-action button text
-            cta_url: Call-to-action button URL
-            fallback_text: Text for fallback link
-            fallback_url: Fallback URL
-            expiry_text: Expiry/additional info text
-            language: Language code for footer
-
-        Returns:
-            HTML email content
+# SES accepts at most 50 destinations per SendBulkTemplatedEmail request
+SES_BULK_MAX_DESTINATIONS = 50
+
+# Language-specific email copy ("de", everything else gets "en")
+_BRANDING_COPY = {
+    "de": {
+        "tagline": "IHR INTELLIGENTER RECHTSASSISTENT",
+        "footer_greeting": "Mit freundlichen Grüßen,",
+        "footer_team": "Ihr sumii Team",
+    },
+    "en": {
+        "tagline": "YOUR INTELLIGENT LEGAL ASSISTANT",
+        "footer_greeting": "Best regards,",
+        "footer_team": "Your sumii Team",
+    },
+}
+_VERIFICATION_COPY = {
+    "de": {
+        "subject": "Bestätigen Sie Ihre sumii E-Mail-Adresse",
+        "title": "E-Mail bestätigen",
+        "message": "Bitte bestätigen Sie Ihre E-Mail-Adresse, um Ihr sumii-Konto zu aktivieren.",
+        "cta_text": "E-Mail bestätigen →",
+        "fallback_text": "Falls der Button nicht funktioniert, kopieren Sie diesen Link:",
+        "expiry_text": "Dieser Link ist 24 Stunden gültig.",
+    },
+    "en": {
+        "subject": "Verify your sumii email address",
+        "title": "Verify Email",
+        "message": "Please verify your email address to activate your sumii account.",
+        "cta_text": "Verify Email →",
+        "fallback_text": "If the button doesn't work, copy this link:",
+        "expiry_text": "This link expires in 24 hours.",
+    },
+}
+_PASSWORD_RESET_COPY = {
+    "de": {
+        "subject": "Passwort zurücksetzen - sumii",
+        "title": "Passwort zurücksetzen",
+        "message": "Sie haben angefordert, Ihr Passwort zurückzusetzen. Klicken Sie auf den Button unten, um ein neues Passwort zu wählen.",
+        "cta_text": "Passwort zurücksetzen →",
+        "fallback_text": "Falls der Button nicht funktioniert, kopieren Sie diesen Link:",
+        "expiry_text": "Dieser Link ist 1 Stunde gültig.",
+        "ignore_text": "Falls Sie dies nicht angefordert haben, können Sie diese E-Mail ignorieren.",
+    },
+    "en": {
+        "subject": "Reset Password - sumii",
+        "title": "Reset Password",
+        "message": "You requested to reset your password. Click the button below to choose a new password.",
+        "cta_text": "Reset Password →",
+        "fallback_text": "If the button doesn't work, copy this link:",
+        "expiry_text": "This link expires in 1 hour.",
+        "ignore_text": "If you didn't request this, you can ignore this email.",
+    },
+}
+_WELCOME_COPY = {
+    "de": {
+        "subject": "Willkommen bei sumii! 🎉",
+        "welcome_title": "Willkommen bei sumii! 🎉",
+        "welcome_text": "Vielen Dank für Ihre Registrierung! sumii ist Ihr intelligenter, einfühlsamer Rechtsassistent. Wir helfen Ihnen, Ihre rechtliche Situation zu verstehen und bereiten alle Informationen für einen Anwalt vor.",
+        "features": (
+            "Intelligente Fragen zu Ihrem Fall beantworten",
+            "Übersichtliche Zusammenfassung erstellen",
+            "Passenden Anwalt in Ihrer Nähe finden",
+        ),
+        "cta_text": "Jetzt starten →",
+    },
+    "en": {
+        "subject": "Welcome to sumii! 🎉",
+        "welcome_title": "Welcome to sumii! 🎉",
+        "welcome_text": (
+            "Thank you for registering! sumii is your intelligent, empathetic legal assistant. "
+            "We help you understand your legal situation and prepare all information for a lawyer."
+        ),
+        "features": (
+            "Answer intelligent questions about your case",
+            "Create a clear summary of your situation",
+            "Find a suitable lawyer near you",
+        ),
+        "cta_text": "Get Started →",
+    },
+}
+
+
+def _copy_language(language: str) -> str:
+    """Map a user's language to the key of the copy tables"""
+    return "de" if language == "de" else "en"
+
+
+def _minify_html(html: str) -> str:
+    """Strip comments and indentation from an HTML template
+
+    Every removed run of whitespace still leaves a newline, so the rendered
+    email looks the same while the SES request body gets much smaller.
+    """
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
+    return re.sub(r"\n\s+", "\n", html).strip()
+
+
+# Sumii-branded HTML shell for link emails (verification, password reset)
+# Colors: urban-a0=#34495e, urban-a10=#7b8d9f
+_BRANDED_EMAIL_HTML = Template(
+    _minify_html(
         """
-        tagline = "IHR INTELLIGENTER RECHTSASSISTENT" if language == "de" else "YOUR INTELLIGENT LEGAL ASSISTANT"
-        footer_greeting = "Mit freundlichen Grüßen," if language == "de" else "Best regards,"
-        footer_team = "Ihr sumii Team" if language == "de" else "Your sumii Team"
-
-        return f"""
         <!DOCTYPE html>
-        <html lang="{language}">
+        <html lang="$language">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
@@ -96,7 +145,7 @@ class EmailService:
                             <tr>
                                 <td style="background: linear-gradient(135deg, #34495e 0%, #7b8d9f 100%); padding: 40px 30px; text-align: center;">
                                     <img src="https://sumii-assets.s3.eu-central-1.amazonaws.com/logos/logo-dark.png" alt="sumii" style="width: 120px; height: auto; margin-bottom: 12px;" />
-                                    <p style="margin: 0; font-size: 14px; color: rgba(255,255,255,0.8); letter-spacing: 1px;">{tagline}</p>
+                                    <p style="margin: 0; font-size: 14px; color: rgba(255,255,255,0.8); letter-spacing: 1px;">$tagline</p>
                                 </td>
                             </tr>
 
@@ -104,18 +153,18 @@ class EmailService:
                             <tr>
                                 <td style="padding: 40px 30px;">
                                     <h2 style="margin: 0 0 16px 0; font-size: 24px; font-weight: 600; color: #34495e;">
-                                        {title}
+                                        $title
                                     </h2>
                                     <p style="margin: 0 0 24px 0; font-size: 16px; line-height: 1.6; color: #4a5568;">
-                                        {message}
+                                        $message
                                     </p>
 
                                     <!-- CTA Button -->
                                     <table role="presentation" style="width: 100%; margin: 24px 0;">
                                         <tr>
                                             <td align="center">
-                                                <a href="{cta_url}" style="display: inline-block; padding: 16px 40px; background: linear-gradient(135deg, #34495e 0%, #7b8d9f 100%); color: #ffffff; font-size: 16px; font-weight: 600; text-decoration: none; border-radius: 10px; box-shadow: 0 4px 14px rgba(52, 73, 94, 0.25);">
-                                                    {cta_text}
+                                                <a href="$cta_url" style="display: inline-block; padding: 16px 40px; background: linear-gradient(135deg, #34495e 0%, #7b8d9f 100%); color: #ffffff; font-size: 16px; font-weight: 600; text-decoration: none; border-radius: 10px; box-shadow: 0 4px 14px rgba(52, 73, 94, 0.25);">
+                                                    $cta_text
                                                 </a>
                                             </td>
                                         </tr>
@@ -123,15 +172,15 @@ class EmailService:
 
                                     <!-- Fallback link -->
                                     <p style="margin: 24px 0 8px 0; font-size: 13px; color: #7b8d9f;">
-                                        {fallback_text}
+                                        $fallback_text
                                     </p>
                                     <p style="margin: 0; font-size: 12px; color: #a0aec0; word-break: break-all;">
-                                        {fallback_url}
+                                        $fallback_url
                                     </p>
 
                                     <!-- Expiry info -->
                                     <p style="margin: 24px 0 0 0; font-size: 13px; color: #7b8d9f;">
-                                        {expiry_text}
+                                        $expiry_text
                                     </p>
                                 </td>
                             </tr>
@@ -140,8 +189,8 @@ class EmailService:
                             <tr>
                                 <td style="background-color: #f8fafc; padding: 24px 30px; border-top: 1px solid #e2e8f0;">
                                     <p style="margin: 0 0 8px 0; font-size: 12px; color: #7b8d9f; text-align: center;">
-                                        {footer_greeting}<br>
-                                        <strong style="color: #34495e;">{footer_team}</strong>
+                                        $footer_greeting<br>
+                                        <strong style="color: #34495e;">$footer_team</strong>
                                     </p>
                                     <p style="margin: 0; font-size: 11px; color: #a0aec0; text-align: center;">
                                         sumii • Hamburg, Germany<br>
@@ -158,215 +207,15 @@ class EmailService:
         </body>
         </html>
         """
+    )
+)
 
-    async def send_verification_email(self, user_email: str, token: str, language: str = "de") -> None:
-        """Send email verification link to user
-
-        Args:
-            user_email: User's email address
-            token: Verification token
-            language: User's preferred language ("de" or "en")
-        """
-        if not self.ses_client or not self.from_email:
-            logger.warning(f"Email service disabled - verification email not sent to {user_email}")
-            return
-
-        verification_url = f"{settings.FRONTEND_URL}/verify-email?token={token}"
-        is_german = language == "de"
-
-        if is_german:
-            subject = "Bestätigen Sie Ihre sumii E-Mail-Adresse"
-            title = "E-Mail bestätigen"
-            message = "Bitte bestätigen Sie Ihre E-Mail-Adresse, um Ihr sumii-Konto zu aktivieren."
-            cta_text = "E-Mail bestätigen →"
-            fallback = "Falls der Button nicht funktioniert, kopieren Sie diesen Link:"
-            expiry = "Dieser Link ist 24 Stunden gültig."
-        else:
-            subject = "Verify your sumii email address"
-            title = "Verify Email"
-            message = "Please verify your email address to activate your sumii account."
-            cta_text = "Verify Email →"
-            fallback = "If the button doesn't work, copy this link:"
-            expiry = "This link expires in 24 hours."
-
-        body_html = self._build_branded_email(
-            title=title,
-            message=message,
-            cta_text=cta_text,
-            cta_url=verification_url,
-            fallback_text=fallback,
-            fallback_url=verification_url,
-            expiry_text=expiry,
-            language=language,
-        )
-
-        body_text = f"""
-{title}
-
-{message}
-
-{cta_text}: {verification_url}
-
-{expiry}
-
----
-sumii • Hamburg, Germany
-https://sumii.de • info@sumii.de
+# Sumii-branded HTML for the welcome email (same colors)
+_WELCOME_EMAIL_HTML = Template(
+    _minify_html(
         """
-
-        await self._send_email(user_email, subject, body_text, body_html)
-
-    async def send_password_reset_email(self, user_email: str, token: str, language: str = "de") -> None:
-        """Send password reset link to user
-
-        Args:
-            user_email: User's email address
-            token: Password reset token
-            language: User's preferred language ("de" or "en")
-        """
-        if not self.ses_client or not self.from_email:
-            logger.warning(f"Email service disabled - password reset email not sent to {user_email}")
-            return
-
-        reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token}"
-        is_german = language == "de"
-
-        if is_german:
-            subject = "Passwort zurücksetzen - sumii"
-            title = "Passwort zurücksetzen"
-            message = "Sie haben angefordert, Ihr Passwort zurückzusetzen. Klicken Sie auf den Button unten, um ein neues Passwort zu wählen."
-            cta_text = "Passwort zurücksetzen →"
-            fallback = "Falls der Button nicht funktioniert, kopieren Sie diesen Link:"
-            expiry = "Dieser Link ist 1 Stunde gültig."
-            ignore = "Falls Sie dies nicht angefordert haben, können Sie diese E-Mail ignorieren."
-        else:
-            subject = "Reset Password - sumii"
-            title = "Reset Password"
-            message = "You requested to reset your password. Click the button below to choose a new password."
-            cta_text = "Reset Password →"
-            fallback = "If the button doesn't work, copy this link:"
-            expiry = "This link expires in 1 hour."
-            ignore = "If you didn't request this, you can ignore this email."
-
-        body_html = self._build_branded_email(
-            title=title,
-            message=message,
-            cta_text=cta_text,
-            cta_url=reset_url,
-            fallback_text=fallback,
-            fallback_url=reset_url,
-            expiry_text=f"{expiry} {ignore}",
-            language=language,
-        )
-
-        body_text = f"""
-{title}
-
-{message}
-
-{cta_text}: {reset_url}
-
-{expiry}
-{ignore}
-
----
-sumii • Hamburg, Germany
-https://sumii.de • info@sumii.de
-        """
-
-        await self._send_email(user_email, subject, body_text, body_html)
-
-    async def send_lawyer_response_email(self, user_email: str, lawyer_name: str, case_summary_url: str) -> None:
-        """Send email to user when lawyer responds to their case
-
-        Args:
-            user_email: User's email address
-            lawyer_name: Name of the lawyer who responded
-            case_summary_url: URL to view the case summary (frontend URL)
-        """
-        if not self.ses_client or not self.from_email:
-            logger.warning(f"Email service disabled - lawyer response email not sent to {user_email}")
-            return
-
-        subject = "Ihr Anwalt hat geantwortet"
-        body_html = f"""
-        <html>
-        <body>
-            <h2>Ihr Anwalt hat geantwortet</h2>
-            <p>Hallo,</p>
-            <p>{lawyer_name} hat auf Ihren Fall geantwortet.</p>
-            <p><a href="{case_summary_url}">Antwort ansehen</a></p>
-            <p>Wenn der Link nicht funktioniert, kopieren Sie diese URL in Ihren Browser:</p>
-            <p>{case_summary_url}</p>
-            <p>Mit freundlichen Grüßen,<br>Ihr Sumii Team</p>
-        </body>
-        </html>
-        """
-        body_text = f"""
-        Ihr Anwalt hat geantwortet
-
-        Hallo,
-
-        {lawyer_name} hat auf Ihren Fall geantwortet.
-
-        Antwort ansehen: {case_summary_url}
-
-        Mit freundlichen Grüßen,
-        Ihr Sumii Team
-        """
-
-        await self._send_email(user_email, subject, body_text, body_html)
-
-    async def send_welcome_email(self, user_email: str, language: str = "de") -> None:
-        """Send welcome email to newly registered user
-
-        Args:
-            user_email: User's email address
-            language: User's preferred language ("de" or "en"), defaults to German
-        """
-        if not self.ses_client or not self.from_email:
-            logger.warning(f"Email service disabled - welcome email not sent to {user_email}")
-            return
-
-        app_url = settings.FRONTEND_URL
-        is_german = language == "de"
-
-        # Language-specific content
-        if is_german:
-            subject = "Willkommen bei sumii! 🎉"
-            tagline = "IHR INTELLIGENTER RECHTSASSISTENT"
-            welcome_title = "Willkommen bei sumii! 🎉"
-            welcome_text = "Vielen Dank für Ihre Registrierung! sumii ist Ihr intelligenter, einfühlsamer Rechtsassistent. Wir helfen Ihnen, Ihre rechtliche Situation zu verstehen und bereiten alle Informationen für einen Anwalt vor."
-            features = [
-                "Intelligente Fragen zu Ihrem Fall beantworten",
-                "Übersichtliche Zusammenfassung erstellen",
-                "Passenden Anwalt in Ihrer Nähe finden",
-            ]
-            cta_text = "Jetzt starten →"
-            footer_greeting = "Mit freundlichen Grüßen,"
-            footer_team = "Ihr sumii Team"
-        else:
-            subject = "Welcome to sumii! 🎉"
-            tagline = "YOUR INTELLIGENT LEGAL ASSISTANT"
-            welcome_title = "Welcome to sumii! 🎉"
-            welcome_text = (
-                "Thank you for registering! sumii is your intelligent, empathetic legal assistant. "
-                "We help you understand your legal situation and prepare all information for a lawyer."
-            )
-            features = [
-                "Answer intelligent questions about your case",
-                "Create a clear summary of your situation",
-                "Find a suitable lawyer near you",
-            ]
-            cta_text = "Get Started →"
-            footer_greeting = "Best regards,"
-            footer_team = "Your sumii Team"
-
-        # Professional Sumii-branded HTML email template
-        # Colors: urban-a0=#34495e, urban-a10=#7b8d9f
-        body_html = f"""
         <!DOCTYPE html>
-        <html lang="{language}">
+        <html lang="$language">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
@@ -381,7 +230,7 @@ https://sumii.de • info@sumii.de
                             <tr>
                                 <td style="background: linear-gradient(135deg, #34495e 0%, #7b8d9f 100%); padding: 40px 30px; text-align: center;">
                                     <img src="https://sumii-assets.s3.eu-central-1.amazonaws.com/logos/logo-dark.png" alt="sumii" style="width: 120px; height: auto; margin-bottom: 12px;" />
-                                    <p style="margin: 0; font-size: 14px; color: rgba(255,255,255,0.8); letter-spacing: 1px;">{tagline}</p>
+                                    <p style="margin: 0; font-size: 14px; color: rgba(255,255,255,0.8); letter-spacing: 1px;">$tagline</p>
                                 </td>
                             </tr>
 
@@ -389,10 +238,10 @@ https://sumii.de • info@sumii.de
                             <tr>
                                 <td style="padding: 40px 30px;">
                                     <h2 style="margin: 0 0 16px 0; font-size: 24px; font-weight: 600; color: #34495e;">
-                                        {welcome_title}
+                                        $welcome_title
                                     </h2>
                                     <p style="margin: 0 0 24px 0; font-size: 16px; line-height: 1.6; color: #4a5568;">
-                                        {welcome_text}
+                                        $welcome_text
                                     </p>
 
                                     <!-- Features list -->
@@ -400,19 +249,19 @@ https://sumii.de • info@sumii.de
                                         <tr>
                                             <td style="padding: 12px 0; border-bottom: 1px solid #e2e8f0;">
                                                 <span style="display: inline-block; width: 24px; height: 24px; background-color: #34495e; border-radius: 50%; color: white; text-align: center; line-height: 24px; font-size: 12px; margin-right: 12px;">✓</span>
-                                                <span style="color: #4a5568; font-size: 15px;">{features[0]}</span>
+                                                <span style="color: #4a5568; font-size: 15px;">$feature_1</span>
                                             </td>
                                         </tr>
                                         <tr>
                                             <td style="padding: 12px 0; border-bottom: 1px solid #e2e8f0;">
                                                 <span style="display: inline-block; width: 24px; height: 24px; background-color: #34495e; border-radius: 50%; color: white; text-align: center; line-height: 24px; font-size: 12px; margin-right: 12px;">✓</span>
-                                                <span style="color: #4a5568; font-size: 15px;">{features[1]}</span>
+                                                <span style="color: #4a5568; font-size: 15px;">$feature_2</span>
                                             </td>
                                         </tr>
                                         <tr>
                                             <td style="padding: 12px 0;">
                                                 <span style="display: inline-block; width: 24px; height: 24px; background-color: #34495e; border-radius: 50%; color: white; text-align: center; line-height: 24px; font-size: 12px; margin-right: 12px;">✓</span>
-                                                <span style="color: #4a5568; font-size: 15px;">{features[2]}</span>
+                                                <span style="color: #4a5568; font-size: 15px;">$feature_3</span>
                                             </td>
                                         </tr>
                                     </table>
@@ -421,8 +270,8 @@ https://sumii.de • info@sumii.de
                                     <table role="presentation" style="width: 100%; margin: 32px 0;">
                                         <tr>
                                             <td align="center">
-                                                <a href="{app_url}" style="display: inline-block; padding: 16px 40px; background: linear-gradient(135deg, #34495e 0%, #7b8d9f 100%); color: #ffffff; font-size: 16px; font-weight: 600; text-decoration: none; border-radius: 10px; box-shadow: 0 4px 14px rgba(52, 73, 94, 0.25);">
-                                                    {cta_text}
+                                                <a href="$app_url" style="display: inline-block; padding: 16px 40px; background: linear-gradient(135deg, #34495e 0%, #7b8d9f 100%); color: #ffffff; font-size: 16px; font-weight: 600; text-decoration: none; border-radius: 10px; box-shadow: 0 4px 14px rgba(52, 73, 94, 0.25);">
+                                                    $cta_text
                                                 </a>
                                             </td>
                                         </tr>
@@ -434,8 +283,8 @@ https://sumii.de • info@sumii.de
                             <tr>
                                 <td style="background-color: #f8fafc; padding: 24px 30px; border-top: 1px solid #e2e8f0;">
                                     <p style="margin: 0 0 8px 0; font-size: 12px; color: #7b8d9f; text-align: center;">
-                                        {footer_greeting}<br>
-                                        <strong style="color: #34495e;">{footer_team}</strong>
+                                        $footer_greeting<br>
+                                        <strong style="color: #34495e;">$footer_team</strong>
                                     </p>
                                     <p style="margin: 0; font-size: 11px; color: #a0aec0; text-align: center;">
                                         sumii • Hamburg, Germany<br>
@@ -452,28 +301,447 @@ https://sumii.de • info@sumii.de
         </body>
         </html>
         """
+    )
+)
 
-        # Plain text version
-        features_text = "\n".join([f"✓ {f}" for f in features])
-        body_text = f"""
-{welcome_title}
+# Lawyer response email bodies ($lawyer_name, $case_summary_url)
+_LAWYER_RESPONSE_HTML = Template(
+    _minify_html(
+        """
+        <html>
+        <body>
+            <h2>Ihr Anwalt hat geantwortet</h2>
+            <p>Hallo,</p>
+            <p>$lawyer_name hat auf Ihren Fall geantwortet.</p>
+            <p><a href="$case_summary_url">Antwort ansehen</a></p>
+            <p>Wenn der Link nicht funktioniert, kopieren Sie diese URL in Ihren Browser:</p>
+            <p>$case_summary_url</p>
+            <p>Mit freundlichen Grüßen,<br>Ihr Sumii Team</p>
+        </body>
+        </html>
+        """
+    )
+)
+_LAWYER_RESPONSE_TEXT = Template(
+    "Ihr Anwalt hat geantwortet\n\n"
+    "Hallo,\n\n"
+    "$lawyer_name hat auf Ihren Fall geantwortet.\n\n"
+    "Antwort ansehen: $case_summary_url\n\n"
+    "Mit freundlichen Grüßen,\n"
+    "Ihr Sumii Team\n"
+)
+
+# Where the per-user link goes in pre-rendered verification and reset emails
+_URL_SLOT = "$url"
+
+# Plain text bodies (str.format_map with the copy tables above)
+_TEXT_FOOTER = "---\nsumii • Hamburg, Germany\nhttps://sumii.de • info@sumii.de\n"
+_VERIFICATION_TEXT = "{title}\n\n{message}\n\n{cta_text}: {url}\n\n{expiry_text}\n\n" + _TEXT_FOOTER
+_PASSWORD_RESET_TEXT = "{title}\n\n{message}\n\n{cta_text}: {url}\n\n{expiry_text}\n{ignore_text}\n\n" + _TEXT_FOOTER
+_WELCOME_TEXT = (
+    "{welcome_title}\n\n{welcome_text}\n\n{features_text}\n\n{cta_text}: {app_url}\n\n"
+    "---\n\n{footer_greeting}\n{footer_team}\n\nsumii • Hamburg, Germany\nhttps://sumii.de • info@sumii.de\n"
+)
+
+# Dedicated threads for blocking SES calls, so a burst of emails cannot starve
+# the default executor used by asyncio.to_thread elsewhere (and vice versa).
+# The pool size caps concurrent SES requests (keep it within the account's send
+# rate), and the client's connection pool has one connection per thread.
+_SES_EXECUTOR = ThreadPoolExecutor(max_workers=settings.SES_MAX_CONCURRENCY, thread_name_prefix="ses")
+_SES_CLIENT_CONFIG = Config(
+    max_pool_connections=settings.SES_MAX_CONCURRENCY,
+    retries={"max_attempts": 3, "mode": "adaptive"},  # Back off client-side when SES throttles
+    tcp_keepalive=True,
+)
+
+# Emails being sent in the background - referenced here so the tasks aren't garbage collected
+_pending_sends: set[asyncio.Task] = set()
+
+
+@lru_cache(maxsize=1)
+def _boto_session() -> boto3.session.Session:
+    """Create the boto3 session used for SES
+
+    Credentials are resolved and service models are loaded once per session, and
+    the session is not shared with boto3's module-level default session.
+
+    Uses explicit credentials if provided, otherwise falls back to
+    boto3 default credential chain (~/.aws/credentials or IAM role).
+
+    Returns:
+        boto3.session.Session: Session for the configured region
+    """
+    if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+        # Explicit credentials provided
+        return boto3.session.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+        )
+    # Use default boto3 credential chain (~/.aws/credentials, IAM role, etc.)
+    return boto3.session.Session(region_name=settings.AWS_REGION)
 
-{welcome_text}
 
-{features_text}
+@lru_cache(maxsize=1)
+def _ses_client() -> Any:
+    """Create the process-wide AWS SES client
 
-{cta_text}: {app_url}
+    boto3 clients are thread-safe and keep their own connection pool, so one
+    client is shared by all EmailService instances instead of paying client
+    and TLS setup per email. Failures raise and are therefore not cached, so
+    the next email tries again.
 
----
+    Returns:
+        SES client
+    """
+    client = _boto_session().client("ses", config=_SES_CLIENT_CONFIG)
+    logger.info("Email service initialized successfully")
+    return client
 
-{footer_greeting}
-{footer_team}
 
-sumii • Hamburg, Germany
-https://sumii.de • info@sumii.de
+class EmailService:
+    """Service for sending emails via AWS SES"""
+
+    def __init__(self):
+        """Initialize the email service (the SES client is created on first use)"""
+        self.from_email = settings.SES_FROM_EMAIL
+        self.ses_client: Any | None = None
+        self._ses_client_lock = asyncio.Lock()
+
+    async def _get_ses_client(self) -> Any | None:
+        """Get the shared AWS SES client, creating it on first use
+
+        Creating a boto3 client loads botocore service models and resolves
+        credentials (possibly via the instance metadata service), so it runs on
+        the SES thread pool instead of blocking the event loop.
+
+        Returns:
+            SES client, or None if email sending is unavailable
         """
+        if self.ses_client is None:
+            async with self._ses_client_lock:
+                if self.ses_client is None:
+                    try:
+                        self.ses_client = await asyncio.get_running_loop().run_in_executor(_SES_EXECUTOR, _ses_client)
+                    except Exception as e:
+                        logger.warning(f"Failed to initialize email service: {e}")
+        return self.ses_client
+
+    @staticmethod
+    def _build_branded_email(
+        title: str,
+        message: str,
+        cta_text: str,
+        cta_url: str,
+        fallback_text: str,
+        fallback_url: str,
+        expiry_text: str,
+        language: str = "de",
+    ) -> str:
+        """Build a branded email template with consistent Sumii styling.
 
-        await self._send_email(user_email, subject, body_text, body_html)
+        Args:
+            title: Email heading
+            message: Main message text
+            cta_text: Call-to-action button text
+            cta_url: Call-to-action button URL
+            fallback_text: Text for fallback link
+            fallback_url: Fallback URL
+            expiry_text: Expiry/additional info text
+            language: Language code for footer
+
+        Returns:
+            HTML email content
+        """
+        return _BRANDED_EMAIL_HTML.substitute(
+            _BRANDING_COPY[_copy_language(language)],
+            language=language,
+            title=title,
+            message=message,
+            cta_text=cta_text,
+            cta_url=cta_url,
+            fallback_text=fallback_text,
+            fallback_url=fallback_url,
+            expiry_text=expiry_text,
+        )
+
+    async def send_verification_email(self, user_email: str, token: str, language: str = "de") -> None:
+        """Send email verification link to user
+
+        Args:
+            user_email: User's email address
+            token: Verification token
+            language: User's preferred language ("de" or "en")
+        """
+        if not await self._get_ses_client() or not self.from_email:
+            logger.warning(f"Email service disabled - verification email not sent to {user_email}")
+            return
+
+        verification_url = f"{settings.FRONTEND_URL}/verify-email?token={token}"
+        subject, text_parts, html_parts = self._verification_email(language)
+
+        self._send_email_in_background(
+            user_email, subject, verification_url.join(text_parts), verification_url.join(html_parts)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _verification_email(language: str) -> tuple[str, tuple[str, ...], tuple[str, ...]]:
+        """Render the verification email once per language
+
+        Args:
+            language: User's preferred language ("de" or "en")
+
+        Returns:
+            tuple: Subject, and text and HTML bodies split at the link, so sending
+            only joins the parts with the user's URL
+        """
+        copy = _VERIFICATION_COPY[_copy_language(language)]
+
+        body_html = EmailService._build_branded_email(
+            title=copy["title"],
+            message=copy["message"],
+            cta_text=copy["cta_text"],
+            cta_url=_URL_SLOT,
+            fallback_text=copy["fallback_text"],
+            fallback_url=_URL_SLOT,
+            expiry_text=copy["expiry_text"],
+            language=language,
+        )
+
+        body_text = _VERIFICATION_TEXT.format_map({**copy, "url": _URL_SLOT})
+
+        return copy["subject"], tuple(body_text.split(_URL_SLOT)), tuple(body_html.split(_URL_SLOT))
+
+    async def send_password_reset_email(self, user_email: str, token: str, language: str = "de") -> None:
+        """Send password reset link to user
+
+        Args:
+            user_email: User's email address
+            token: Password reset token
+            language: User's preferred language ("de" or "en")
+        """
+        if not await self._get_ses_client() or not self.from_email:
+            logger.warning(f"Email service disabled - password reset email not sent to {user_email}")
+            return
+
+        reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token}"
+        subject, text_parts, html_parts = self._password_reset_email(language)
+
+        self._send_email_in_background(user_email, subject, reset_url.join(text_parts), reset_url.join(html_parts))
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _password_reset_email(language: str) -> tuple[str, tuple[str, ...], tuple[str, ...]]:
+        """Render the password reset email once per language
+
+        Args:
+            language: User's preferred language ("de" or "en")
+
+        Returns:
+            tuple: Subject, and text and HTML bodies split at the link, so sending
+            only joins the parts with the user's URL
+        """
+        copy = _PASSWORD_RESET_COPY[_copy_language(language)]
+
+        body_html = EmailService._build_branded_email(
+            title=copy["title"],
+            message=copy["message"],
+            cta_text=copy["cta_text"],
+            cta_url=_URL_SLOT,
+            fallback_text=copy["fallback_text"],
+            fallback_url=_URL_SLOT,
+            expiry_text=f"{copy['expiry_text']} {copy['ignore_text']}",
+            language=language,
+        )
+
+        body_text = _PASSWORD_RESET_TEXT.format_map({**copy, "url": _URL_SLOT})
+
+        return copy["subject"], tuple(body_text.split(_URL_SLOT)), tuple(body_html.split(_URL_SLOT))
+
+    async def send_lawyer_response_email(self, user_email: str, lawyer_name: str, case_summary_url: str) -> None:
+        """Send email to user when lawyer responds to their case
+
+        Args:
+            user_email: User's email address
+            lawyer_name: Name of the lawyer who responded
+            case_summary_url: URL to view the case summary (frontend URL)
+        """
+        if not await self._get_ses_client() or not self.from_email:
+            logger.warning(f"Email service disabled - lawyer response email not sent to {user_email}")
+            return
+
+        subject = "Ihr Anwalt hat geantwortet"
+        body_html = _LAWYER_RESPONSE_HTML.substitute(lawyer_name=lawyer_name, case_summary_url=case_summary_url)
+        body_text = _LAWYER_RESPONSE_TEXT.substitute(lawyer_name=lawyer_name, case_summary_url=case_summary_url)
+
+        self._send_email_in_background(user_email, subject, body_text, body_html)
+
+    async def send_bulk_lawyer_response_emails(self, recipients: Sequence[tuple[str, str, str]]) -> None:
+        """Send lawyer response emails to many users with batched SES requests
+
+        Uses SendBulkTemplatedEmail with the SES_LAWYER_RESPONSE_TEMPLATE template
+        (variables: lawyer_name, case_summary_url), up to 50 recipients per request.
+        Falls back to one email per recipient if no template is configured.
+
+        Args:
+            recipients: (user_email, lawyer_name, case_summary_url) per notification
+        """
+        if not await self._get_ses_client() or not self.from_email:
+            logger.warning(f"Email service disabled - {len(recipients)} lawyer response emails not sent")
+            return
+
+        if not settings.SES_LAWYER_RESPONSE_TEMPLATE:
+            for user_email, lawyer_name, case_summary_url in recipients:
+                await self.send_lawyer_response_email(user_email, lawyer_name, case_summary_url)
+            return
+
+        await self._send_bulk_templated(
+            settings.SES_LAWYER_RESPONSE_TEMPLATE,
+            {"lawyer_name": "", "case_summary_url": settings.FRONTEND_URL},
+            [
+                (user_email, {"lawyer_name": lawyer_name, "case_summary_url": case_summary_url})
+                for user_email, lawyer_name, case_summary_url in recipients
+            ],
+        )
+
+    async def send_bulk_verification_emails(self, targets: Sequence[tuple[str, str]], language: str = "de") -> None:
+        """Send verification links to many users with batched SES requests
+
+        Uses SendBulkTemplatedEmail with the SES_VERIFICATION_TEMPLATE template,
+        suffixed with the language ("_de" or "_en", variable: verify_url), up to
+        50 recipients per request. Falls back to one email per recipient if no
+        template is configured.
+
+        Args:
+            targets: (user_email, token) per user
+            language: Language of the emails ("de" or "en")
+        """
+        if not await self._get_ses_client() or not self.from_email:
+            logger.warning(f"Email service disabled - {len(targets)} verification emails not sent")
+            return
+
+        if not settings.SES_VERIFICATION_TEMPLATE:
+            for user_email, token in targets:
+                await self.send_verification_email(user_email, token, language)
+            return
+
+        await self._send_bulk_templated(
+            f"{settings.SES_VERIFICATION_TEMPLATE}_{_copy_language(language)}",
+            {"verify_url": settings.FRONTEND_URL},
+            [
+                (user_email, {"verify_url": f"{settings.FRONTEND_URL}/verify-email?token={token}"})
+                for user_email, token in targets
+            ],
+        )
+
+    async def _send_bulk_templated(
+        self, template: str, default_data: dict[str, str], recipients: Sequence[tuple[str, dict[str, str]]]
+    ) -> None:
+        """Send an SES template to many recipients, 50 destinations per request
+
+        Args:
+            template: Name of the SES template
+            default_data: Template data for variables missing in a recipient's data
+            recipients: (to_email, template data) per recipient
+        """
+        for start in range(0, len(recipients), SES_BULK_MAX_DESTINATIONS):
+            batch = recipients[start : start + SES_BULK_MAX_DESTINATIONS]
+            destinations = [
+                {"Destination": {"ToAddresses": [to_email]}, "ReplacementTemplateData": json.dumps(data)}
+                for to_email, data in batch
+            ]
+            try:
+                send_bulk = partial(
+                    self.ses_client.send_bulk_templated_email,
+                    Source=self.from_email,
+                    Template=template,
+                    DefaultTemplateData=json.dumps(default_data),
+                    Destinations=destinations,
+                )
+                response = await asyncio.get_running_loop().run_in_executor(_SES_EXECUTOR, send_bulk)
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                logger.error(f"Failed to send {len(batch)} emails with template {template}: {error_code} - {e}")
+                continue
+
+            for (to_email, _), status in zip(batch, response.get("Status", []), strict=False):
+                if status.get("Status") != "Success":
+                    logger.error(f"Failed to send email to {to_email}: {status.get('Status')} - {status.get('Error')}")
+            logger.info(f"Sent {len(batch)} emails with template {template}")
+
+    async def send_welcome_email(self, user_email: str, language: str = "de") -> None:
+        """Send welcome email to newly registered user
+
+        Args:
+            user_email: User's email address
+            language: User's preferred language ("de" or "en"), defaults to German
+        """
+        if not await self._get_ses_client() or not self.from_email:
+            logger.warning(f"Email service disabled - welcome email not sent to {user_email}")
+            return
+
+        subject, body_text, body_html = self._welcome_email(language, settings.FRONTEND_URL)
+
+        self._send_email_in_background(user_email, subject, body_text, body_html)
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _welcome_email(language: str, app_url: str) -> tuple[str, str, str]:
+        """Render the welcome email once per language
+
+        The welcome email contains no per-user content, so the rendered subject
+        and bodies are reused for every registration.
+
+        Args:
+            language: User's preferred language ("de" or "en")
+            app_url: Frontend URL for the call-to-action
+
+        Returns:
+            tuple: Subject, text body and HTML body
+        """
+        copy = _WELCOME_COPY[_copy_language(language)]
+        branding = _BRANDING_COPY[_copy_language(language)]
+        features = copy["features"]
+
+        body_html = _WELCOME_EMAIL_HTML.substitute(
+            branding,
+            language=language,
+            welcome_title=copy["welcome_title"],
+            welcome_text=copy["welcome_text"],
+            feature_1=features[0],
+            feature_2=features[1],
+            feature_3=features[2],
+            app_url=app_url,
+            cta_text=copy["cta_text"],
+        )
+
+        body_text = _WELCOME_TEXT.format_map(
+            {
+                **copy,
+                **branding,
+                "features_text": "\n".join(f"✓ {feature}" for feature in features),
+                "app_url": app_url,
+            }
+        )
+
+        return copy["subject"], body_text, body_html
+
+    def _send_email_in_background(self, to_email: str, subject: str, body_text: str, body_html: str) -> None:
+        """Send email via AWS SES without waiting for the result
+
+        Failures are only logged, so the triggering request (registration,
+        password reset, webhook) returns without waiting for the SES round trip.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body_text: Plain text email body
+            body_html: HTML email body
+        """
+        task = asyncio.create_task(self._send_email(to_email, subject, body_text, body_html))
+        _pending_sends.add(task)
+        task.add_done_callback(_on_send_done)
 
     async def _send_email(self, to_email: str, subject: str, body_text: str, body_html: str) -> None:
         """Send email via AWS SES
@@ -484,28 +752,25 @@ https://sumii.de • info@sumii.de
             body_text: Plain text email body
             body_html: HTML email body
         """
-        if not self.ses_client or not self.from_email:
+        if not await self._get_ses_client() or not self.from_email:
             logger.warning(f"Email service disabled - email not sent to {to_email}")
             return
 
+        send_email = partial(
+            self.ses_client.send_email,
+            Source=self.from_email,
+            Destination={"ToAddresses": [to_email]},
+            Message={
+                "Subject": {"Data": subject, "Charset": "UTF-8"},
+                "Body": {
+                    "Text": {"Data": body_text, "Charset": "UTF-8"},
+                    "Html": {"Data": body_html, "Charset": "UTF-8"},
+                },
+            },
+        )
         try:
-            # boto3 SES client is synchronous, so we run it in executor for async compatibility
-            import asyncio
-
-            def send_email():
-                return self.ses_client.send_email(
-                    Source=self.from_email,
-                    Destination={"ToAddresses": [to_email]},
-                    Message={
-                        "Subject": {"Data": subject, "Charset": "UTF-8"},
-                        "Body": {
-                            "Text": {"Data": body_text, "Charset": "UTF-8"},
-                            "Html": {"Data": body_html, "Charset": "UTF-8"},
-                        },
-                    },
-                )
-
-            response = await asyncio.to_thread(send_email)
+            # boto3 SES client is synchronous, so we run it on the SES thread pool
+            response = await asyncio.get_running_loop().run_in_executor(_SES_EXECUTOR, send_email)
             logger.info(f"Email sent successfully to {to_email}. MessageId: {response['MessageId']}")
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -514,7 +779,30 @@ https://sumii.de • info@sumii.de
             # Log error but continue execution
 
 
-# Dependency injection
+def _on_send_done(task: asyncio.Task) -> None:
+    """Forget a finished background send and log unexpected failures"""
+    _pending_sends.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Unexpected error while sending email: {task.exception()}")
+
+
+async def wait_for_pending_emails() -> None:
+    """Wait for background email sends to finish (called on application shutdown)"""
+    if _pending_sends:
+        await asyncio.gather(*_pending_sends, return_exceptions=True)
+
+
+# Global service instance
+_email_service: EmailService | None = None
+
+
 def get_email_service() -> EmailService:
-    """FastAPI dependency for Email service"""
-    return EmailService()
+    """Get or create global Email service instance (also used as FastAPI dependency)
+
+    Returns:
+        EmailService: Singleton service instance
+    """
+    global _email_service
+    if _email_service is None:
+        _email_service = EmailService()
+    return _email_service
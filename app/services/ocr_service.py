@@ -7,15 +7,181 @@ text from uploaded documents (PDFs, images). The extracted text is used for:
 3. Extracting dates and facts for chronological storytelling
 """
 
+import asyncio
 import base64
+import hashlib
+import json
 import logging
+import time
+import uuid
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
 
 from mistralai import Mistral
+from mistralai.utils import BackoffStrategy, RetryConfig
 
 from app.config import settings
+from app.utils.rate_limit import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+_IMAGE_OCR_PROMPT = """Extrahiere den gesamten Text aus diesem Dokument/Bild.
+Behalte die Struktur bei (Überschriften, Listen, Tabellen).
+Extrahiere auch alle wichtigen Daten wie:
+- Datumsangaben (z.B. "gültig bis 05.02.2020")
+- Namen und Adressen
+- Beträge und Zahlen
+- Unterschriften oder Stempel (notiere als [Unterschrift] oder [Stempel])
+
+Antworte NUR mit dem extrahierten Text, keine Erklärungen."""
+
+_PDF_VISION_PROMPT = """Extrahiere den gesamten Text aus diesen Seiten eines PDF-Dokuments.
+Behalte die Struktur bei (Überschriften, Listen, Tabellen).
+Extrahiere wichtige Daten wie Datumsangaben, Namen, Beträge.
+Antworte NUR mit dem extrahierten Text."""
+
+# Retry 429/5xx responses after 0.5s, 1s, 2s, ... for up to a minute
+_MISTRAL_RETRY_CONFIG = RetryConfig(
+    "backoff",
+    BackoffStrategy(initial_interval=500, max_interval=8000, exponent=2.0, max_elapsed_time=60000),
+    retry_connection_errors=True,
+)
+
+# Page rendering for the PDF vision fallback (Pixtral accepts up to 8 images per request)
+_VISION_PAGE_DPI = 150
+_VISION_IMAGES_PER_REQUEST = 8
+
+# Multiple of 3 so every chunk encodes to base64 without padding
+_BASE64_CHUNK_SIZE = 3 * 1024 * 1024
+
+
+def _data_uri(media_type: str, file_content: bytes) -> str:
+    """Build a base64 data URI for the Mistral API
+
+    The encoding is appended chunk by chunk to one buffer, so a large document is
+    not held as full-size base64 bytes, decoded string and formatted URI at once.
+
+    Args:
+        media_type: MIME type of the document
+        file_content: Raw bytes of the document
+
+    Returns:
+        str: "data:<media_type>;base64,..." URI
+    """
+    buffer = bytearray(f"data:{media_type};base64,".encode("ascii"))
+    view = memoryview(file_content)
+    for start in range(0, len(view), _BASE64_CHUNK_SIZE):
+        buffer += base64.b64encode(view[start : start + _BASE64_CHUNK_SIZE])
+    return buffer.decode("ascii")
+
+
+def _rasterize_pdf(file_content: bytes, max_pages: int) -> list[str]:
+    """Render the first pages of a PDF as JPEG data URIs for the vision model
+
+    Args:
+        file_content: PDF bytes
+        max_pages: Maximum number of pages to render
+
+    Returns:
+        list[str]: One "data:image/jpeg;base64,..." URI per page
+    """
+    # PyMuPDF is only needed when the OCR endpoint fails
+    import pymupdf
+
+    with pymupdf.open(stream=file_content, filetype="pdf") as document:
+        return [
+            _data_uri("image/jpeg", page.get_pixmap(dpi=_VISION_PAGE_DPI).tobytes("jpeg", jpg_quality=80))
+            for page in document.pages(0, min(max_pages, document.page_count))
+        ]
+
+
+def _vision_messages(prompt: str, *image_urls: str) -> list[dict]:
+    """Build a single user message with the instruction text followed by the images
+
+    The prompt comes first so requests share an identical prefix.
+    """
+    content: list[dict] = [{"type": "text", "text": prompt}]
+    content.extend({"type": "image_url", "image_url": image_url} for image_url in image_urls)
+    return [{"role": "user", "content": content}]
+
+
+# Optional on-disk cache of extracted text (settings.OCR_CACHE_DIR), keyed by the SHA-256 of
+# the document bytes so re-uploads hit regardless of filename: <digest>.json = {"text": ...}
+# The text is personal data: entries expire after OCR_CACHE_MAX_AGE_HOURS and are removed
+# when their document is deleted (see forget_cached_text).
+def _cache_file(cache_dir: str, content_sha256: str) -> Path:
+    """Cache file for a document digest"""
+    return Path(cache_dir) / f"{content_sha256}.json"
+
+
+def _is_expired(path: Path, now: float) -> bool:
+    """Whether a cache file is older than OCR_CACHE_MAX_AGE_HOURS"""
+    return now - path.stat().st_mtime > settings.OCR_CACHE_MAX_AGE_HOURS * 3600
+
+
+def _read_cached_text(path: Path) -> str | None:
+    """Read cached OCR text (None if missing, expired or unreadable)"""
+    try:
+        if _is_expired(path, time.time()):
+            path.unlink(missing_ok=True)
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))["text"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cached_text(path: Path, text: str) -> None:
+    """Atomically store OCR text in the cache and remove expired entries"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        temporary_path.write_text(json.dumps({"text": text}, ensure_ascii=False), encoding="utf-8")
+        temporary_path.replace(path)
+    except OSError as e:
+        logger.warning(f"[OCR] Could not write OCR cache {path}: {e}")
+        return
+    _remove_expired_cache_files(path.parent)
+
+
+def _remove_expired_cache_files(cache_dir: Path) -> None:
+    """Delete cache entries (and stale temporary files) older than OCR_CACHE_MAX_AGE_HOURS"""
+    now = time.time()
+    try:
+        for path in cache_dir.iterdir():
+            try:
+                if _is_expired(path, now):
+                    path.unlink(missing_ok=True)
+            except OSError:
+                continue
+    except OSError as e:
+        logger.warning(f"[OCR] Could not clean up OCR cache {cache_dir}: {e}")
+
+
+def _remove_cached_files(cache_dir: str, content_sha256s: list[str]) -> None:
+    """Delete the cache entries of the given document digests"""
+    for content_sha256 in content_sha256s:
+        try:
+            _cache_file(cache_dir, content_sha256).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"[OCR] Could not remove OCR cache entry {content_sha256}: {e}")
+
+
+def content_digest(file_content: bytes) -> str:
+    """SHA-256 hex digest of a document, the key of its OCR cache entry"""
+    return hashlib.sha256(file_content).hexdigest()
+
+
+async def forget_cached_text(content_sha256s: Iterable[str | None]) -> None:
+    """Remove cached OCR text of deleted documents (no-op if the OCR cache is disabled)
+
+    Args:
+        content_sha256s: Document.content_sha256 values (None entries are skipped)
+    """
+    digests = [content_sha256 for content_sha256 in content_sha256s if content_sha256]
+    if settings.OCR_CACHE_DIR and digests:
+        await asyncio.to_thread(_remove_cached_files, settings.OCR_CACHE_DIR, digests)
+
 
 class OCRService:
     """Service for extracting text from documents using Mistral OCR API
@@ -26,37 +192,61 @@ class OCRService:
 
     def __init__(self):
         """Initialize OCR service with Mistral client"""
-        self.client = Mistral(api_key=settings.MISTRAL_API_KEY)
+        # Rate limited (429) and unavailable (5xx) responses are retried with exponential backoff
+        self.client = Mistral(api_key=settings.MISTRAL_API_KEY, retry_config=_MISTRAL_RETRY_CONFIG)
         # Model for image OCR processing (vision model)
         # For PDF OCR, we use mistral-ocr-latest via the dedicated OCR endpoint
         self.model = "pixtral-large-latest"
+        # Caps Mistral requests in flight across all concurrent uploads (taken per API call)
+        self._semaphore = asyncio.Semaphore(settings.OCR_MAX_CONCURRENCY)
+        # Paces request starts so concurrent OCR stays within Mistral's rate limit
+        self._rate_limiter = AsyncRateLimiter(settings.OCR_REQUESTS_PER_SECOND)
 
     async def extract_text_from_bytes(
         self,
         file_content: bytes,
         file_type: str,
         filename: str,
+        use_cache: bool = True,
+        document_url: str | None = None,
+        content_sha256: str | None = None,
     ) -> str:
         """Extract text from document bytes using Mistral OCR
 
+        Results are cached by document content when OCR_CACHE_DIR is set.
+
         Args:
             file_content: Raw bytes of the document
             file_type: MIME type (e.g., "application/pdf", "image/jpeg")
             filename: Original filename for logging
+            use_cache: Whether to read and write the OCR cache (default: True)
+            document_url: URL Mistral can download the PDF from (e.g. pre-signed S3 URL);
+                sent instead of inlining the PDF as base64
+            content_sha256: Precomputed content_digest() of file_content (computed if omitted)
 
         Returns:
             str: Extracted text from document, or empty string on failure
         """
+        cache_path = None
+        if use_cache and settings.OCR_CACHE_DIR:
+            # Hashing a multi-MB upload would block the event loop, so it runs with the cache read
+            cache_path, cached_text = await asyncio.to_thread(
+                self._read_cache, settings.OCR_CACHE_DIR, file_content, content_sha256
+            )
+            if cached_text is not None:
+                logger.info(f"[OCR] Cache hit for {filename}")
+                return cached_text
+
         try:
             logger.info(f"[OCR] Processing {filename} ({file_type})")
 
             # For images, use Pixtral vision chat
             if file_type.startswith("image/"):
-                return await self._process_image(file_content, file_type, filename)
+                extracted_text = await self._process_image(file_content, file_type, filename)
 
             # For PDFs, use OCR endpoint
             elif file_type == "application/pdf":
-                return await self._process_pdf(file_content, filename)
+                extracted_text = await self._process_pdf(file_content, filename, document_url)
 
             else:
                 logger.warning(f"[OCR] Unsupported file type: {file_type}")
@@ -66,6 +256,25 @@ class OCRService:
             logger.error(f"[OCR] Failed to process {filename}: {e}")
             return ""
 
+        if cache_path and extracted_text:
+            await asyncio.to_thread(_write_cached_text, cache_path, extracted_text)
+        return extracted_text
+
+    @staticmethod
+    def _read_cache(cache_dir: str, file_content: bytes, content_sha256: str | None) -> tuple[Path, str | None]:
+        """Cache file for a document (keyed by its SHA-256) and its cached text, if any"""
+        path = _cache_file(cache_dir, content_sha256 or content_digest(file_content))
+        return path, _read_cached_text(path)
+
+    async def _complete(self, prompt: str, *image_urls: str):
+        """Send a vision chat request once a concurrency slot is free and the rate limiter allows it"""
+        async with self._semaphore:
+            await self._rate_limiter.acquire()
+            return await self.client.chat.complete_async(
+                model=self.model,
+                messages=_vision_messages(prompt, *image_urls),
+            )
+
     async def _process_image(
         self,
         file_content: bytes,
@@ -82,37 +291,10 @@ class OCRService:
         Returns:
             str: Extracted text from image
         """
-        # Convert bytes to base64 data URI
-        base64_data = base64.b64encode(file_content).decode("utf-8")
-        data_uri = f"data:{file_type};base64,{base64_data}"
+        data_uri = _data_uri(file_type, file_content)
 
         # Use Pixtral chat to extract text
-        response = self.client.chat.complete(
-            model=self.model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": """Extrahiere den gesamten Text aus diesem Dokument/Bild.
-Behalte die Struktur bei (Überschriften, Listen, Tabellen).
-Extrahiere auch alle wichtigen Daten wie:
-- Datumsangaben (z.B. "gültig bis 05.02.2020")
-- Namen und Adressen
-- Beträge und Zahlen
-- Unterschriften oder Stempel (notiere als [Unterschrift] oder [Stempel])
-
-Antworte NUR mit dem extrahierten Text, keine Erklärungen.""",
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": data_uri,
-                        },
-                    ],
-                }
-            ],
-        )
+        response = await self._complete(_IMAGE_OCR_PROMPT, data_uri)
 
         extracted_text = response.choices[0].message.content or ""
         logger.info(f"[OCR] Extracted {len(extracted_text)} chars from image {filename}")
@@ -122,29 +304,32 @@ Antworte NUR mit dem extrahierten Text, keine Erklärungen.""",
         self,
         file_content: bytes,
         filename: str,
+        document_url: str | None = None,
     ) -> str:
         """Process PDF using Mistral OCR endpoint
 
         Args:
             file_content: PDF bytes
             filename: Original filename
+            document_url: Optional URL of the stored PDF, used instead of a base64 data URI
 
         Returns:
             str: Extracted text from PDF
         """
-        # Convert bytes to base64 data URI for PDF
-        base64_data = base64.b64encode(file_content).decode("utf-8")
-        data_uri = f"data:application/pdf;base64,{base64_data}"
+        # Inline the PDF only if Mistral cannot fetch it itself
+        document_url = document_url or _data_uri("application/pdf", file_content)
 
         # Use OCR endpoint for PDFs
         try:
-            response = self.client.ocr.process(
-                model="mistral-ocr-latest",
-                document={
-                    "type": "document_url",
-                    "document_url": data_uri,
-                },
-            )
+            async with self._semaphore:
+                await self._rate_limiter.acquire()
+                response = await self.client.ocr.process_async(
+                    model="mistral-ocr-latest",
+                    document={
+                        "type": "document_url",
+                        "document_url": document_url,
+                    },
+                )
 
             # Combine all pages/sections into single text
             all_text = []
@@ -171,45 +356,28 @@ Antworte NUR mit dem extrahierten Text, keine Erklärungen.""",
     ) -> str:
         """Fallback: Process PDF using vision model if OCR endpoint fails
 
+        The vision model only accepts images, so the first OCR_VISION_MAX_PAGES pages
+        are rasterized to JPEG and sent in batches of up to _VISION_IMAGES_PER_REQUEST.
+
         Note: This is less accurate but provides a fallback option.
         """
-        base64_data = base64.b64encode(file_content).decode("utf-8")
-        data_uri = f"data:application/pdf;base64,{base64_data}"
-
-        response = self.client.chat.complete(
-            model=self.model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": """Extrahiere den gesamten Text aus diesem PDF-Dokument.
-Behalte die Struktur bei (Überschriften, Listen, Tabellen).
-Extrahiere wichtige Daten wie Datumsangaben, Namen, Beträge.
-Antworte NUR mit dem extrahierten Text.""",
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": data_uri,
-                        },
-                    ],
-                }
-            ],
+        page_images = await asyncio.to_thread(_rasterize_pdf, file_content, settings.OCR_VISION_MAX_PAGES)
+        batches = [
+            page_images[start : start + _VISION_IMAGES_PER_REQUEST]
+            for start in range(0, len(page_images), _VISION_IMAGES_PER_REQUEST)
+        ]
+
+        responses = await asyncio.gather(*(self._complete(_PDF_VISION_PROMPT, *batch) for batch in batches))
+
+        extracted_text = "\n\n".join(response.choices[0].message.content or "" for response in responses)
+        logger.info(
+            f"[OCR] Extracted {len(extracted_text)} chars from {len(page_images)} PDF pages "
+            f"(vision fallback) {filename}"
         )
-
-        extracted_text = response.choices[0].message.content or ""
-        logger.info(f"[OCR] Extracted {len(extracted_text)} chars from PDF (vision fallback) {filename}")
         return extracted_text
 
 
-# Singleton instance
-_ocr_service: OCRService | None = None
-
-
+@lru_cache(maxsize=1)
 def get_ocr_service() -> OCRService:
     """Get or create OCR service singleton"""
-    global _ocr_service
-    if _ocr_service is None:
-        _ocr_service = OCRService()
-    return _ocr_service
+    return OCRService()
@@ -14,12 +14,17 @@ This enables:
 """
 
 from app.models.conversation import Conversation
+from app.services.agents.tools.function_schemas import LEGAL_FACTS_REQUIRED
+
+# 5W facts as required by the extract_facts tool schema
+_FIVE_W_FACTS = LEGAL_FACTS_REQUIRED["parameters"]
+_FIVE_W_FACT_NAMES = frozenset(_FIVE_W_FACTS)
 
 
 class ConversationOrchestrator:
     """Determines which agent should handle the current message based on conversation state"""
 
-    async def determine_next_agent(self, conversation: Conversation) -> str:
+    def determine_next_agent(self, conversation: Conversation) -> str:
         """Decide which agent to use based on conversation state
 
         Decision Logic:
@@ -72,21 +77,14 @@ class ConversationOrchestrator:
         Returns:
             True if all 5W facts collected, False otherwise
         """
-        required_facts = ["who", "what", "when", "where", "why"]
-
-        for fact_name in required_facts:
-            # Get JSONB field value (e.g., conversation.who)
-            fact_value = getattr(conversation, fact_name, None)
-
-            # Check if fact exists and has "collected" flag set to True
-            if not fact_value or not fact_value.get("collected"):
-                return False
-
-        return True
-
-    async def update_conversation_state(
-        self, conversation: Conversation, agent_name: str, facts: dict | None = None
-    ) -> None:
+        # Each JSONB field (e.g., conversation.who) must exist and have "collected" set to True;
+        # all() stops at the first missing fact
+        return all(
+            (fact_value := getattr(conversation, fact_name, None)) and fact_value.get("collected")
+            for fact_name in _FIVE_W_FACTS
+        )
+
+    def update_conversation_state(self, conversation: Conversation, agent_name: str, facts: dict | None = None) -> None:
         """Update conversation metadata after agent response
 
         This method updates conversation state based on which agent just completed:
@@ -108,10 +106,14 @@ class ConversationOrchestrator:
         if agent_name == "intake" and facts:
             # Update 5W facts from Intake Agent
             # Facts format: {"who": {...}, "what": {...}, "when": {...}, "where": {...}, "why": {...}}
-            for fact_name, fact_data in facts.items():
-                if fact_name in ["who", "what", "when", "where", "why"]:
-                    # Set JSONB field with "collected" flag
-                    setattr(conversation, fact_name, {"collected": True, **fact_data})
+            # Set JSONB fields with "collected" flag; unknown keys are ignored
+            changes = {
+                fact_name: dict(fact_data, collected=True)
+                for fact_name, fact_data in facts.items()
+                if fact_name in _FIVE_W_FACT_NAMES
+            }
+            for fact_name, fact_value in changes.items():
+                setattr(conversation, fact_name, fact_value)
 
         elif agent_name == "reasoning":
             # Reasoning Agent completed legal analysis
@@ -134,6 +136,6 @@ def get_orchestrator() -> ConversationOrchestrator:
         async def websocket_chat(
             orchestrator: ConversationOrchestrator = Depends(get_orchestrator)
         ):
-            agent_name = await orchestrator.determine_next_agent(conversation)
+            agent_name = orchestrator.determine_next_agent(conversation)
     """
     return ConversationOrchestrator()
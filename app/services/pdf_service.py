@@ -8,14 +8,26 @@ It supports two methods:
 2. template_to_pdf: Render Jinja2 template with case data (professional output)
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import markdown as md
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from weasyprint import CSS, HTML
-from weasyprint.text.fonts import FontConfiguration
+
+from app.config import settings
+
+# WeasyPrint (Pango/Cairo via cffi) and Markdown are imported on first render, so
+# workers that never generate a PDF do not pay for loading them
+if TYPE_CHECKING:
+    import markdown as md
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -23,172 +35,274 @@ logger = logging.getLogger(__name__)
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
 
-class PDFService:
-    """Service for converting markdown/templates to PDF"""
+# Custom Jinja2 filters
+def _default_if_empty(value, default="k. A."):
+    """Return default if value is empty or None"""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return default
+    return value
 
-    def __init__(self):
-        """Initialize PDF service with Jinja2 environment"""
-        # Initialize Jinja2 environment for template rendering
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(TEMPLATES_DIR)),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
-
-        # Register custom Jinja2 filters
-        self.jinja_env.filters["default_if_empty"] = self._default_if_empty
-        self.jinja_env.filters["format_german_date"] = self._format_german_date
-        self.jinja_env.filters["truncate_words"] = self._truncate_words
-        self.jinja_env.filters["nl2br"] = self._nl2br
-
-        # Legal document CSS styling (for markdown method)
-        self.css_style = """
-        @page {
-            size: A4;
-            margin: 2.5cm 2cm;
-            @top-center {
-                content: "Sumii - Forensische Anamnese";
-                font-size: 10pt;
-                color: #666;
-            }
-            @bottom-center {
-                content: "Seite " counter(page) " von " counter(pages);
-                font-size: 10pt;
-                color: #666;
-            }
-        }
 
-        body {
-            font-family: 'Helvetica Neue', Arial, sans-serif;
-            font-size: 11pt;
-            line-height: 1.6;
-            color: #333;
-        }
+def _format_german_date(value):
+    """Format date in German format (DD.MM.YYYY)"""
+    if isinstance(value, datetime):
+        return value.strftime("%d.%m.%Y")
+    if isinstance(value, str):
+        return _format_iso_date(value)
+    return value or datetime.now().strftime("%d.%m.%Y")
 
-        h1 {
-            font-size: 20pt;
-            font-weight: bold;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-            color: #1a1a1a;
-            border-bottom: 2px solid #333;
-            padding-bottom: 0.3em;
-        }
 
-        h2 {
-            font-size: 16pt;
-            font-weight: bold;
-            margin-top: 1.2em;
-            margin-bottom: 0.4em;
-            color: #2a2a2a;
-        }
+@lru_cache(maxsize=256)
+def _format_iso_date(value: str) -> str:
+    """Format an ISO date string as DD.MM.YYYY, returning other strings unchanged
 
-        h3 {
-            font-size: 13pt;
-            font-weight: bold;
-            margin-top: 1em;
-            margin-bottom: 0.3em;
-            color: #3a3a3a;
-        }
+    Cached because reports repeat the same dates; plain YYYY-MM-DD strings take the
+    cheaper date.fromisoformat path.
+    """
+    try:
+        if len(value) == 10 and value[4] == "-" and value[7] == "-":
+            return date.fromisoformat(value).strftime("%d.%m.%Y")
+        return datetime.fromisoformat(value).strftime("%d.%m.%Y")
+    except ValueError:
+        return value
 
-        p {
-            margin: 0.8em 0;
-            text-align: justify;
-        }
 
-        ul, ol {
-            margin: 0.8em 0;
-            padding-left: 2em;
-        }
+def _truncate_words(value, num_words=3):
+    """Truncate text to specified number of words"""
+    if not value:
+        return ""
+    words = str(value).split()
+    if len(words) <= num_words:
+        return value
+    return " ".join(words[:num_words]) + "..."
+
+
+def _nl2br(value):
+    """Convert newlines to <br> tags"""
+    if not value:
+        return ""
+    return str(value).replace("\n", "<br>\n")
+
+
+def _create_jinja_env() -> Environment:
+    """Create the Jinja2 environment shared by all PDFService instances
+
+    Templates ship with the app, so they are parsed once here and never re-checked
+    on disk (auto_reload=False) or evicted (cache_size=-1).
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        cache_size=-1,
+    )
+    env.filters["default_if_empty"] = _default_if_empty
+    env.filters["format_german_date"] = _format_german_date
+    env.filters["truncate_words"] = _truncate_words
+    env.filters["nl2br"] = _nl2br
+
+    for template_name in env.list_templates(extensions=["html"]):
+        env.get_template(template_name)
+    return env
+
+
+_JINJA_ENV = _create_jinja_env()
+
+
+# Legal document CSS styling (for markdown method)
+_MARKDOWN_CSS = """
+@page {
+    size: A4;
+    margin: 2.5cm 2cm;
+    @top-center {
+        content: "Sumii - Forensische Anamnese";
+        font-size: 10pt;
+        color: #666;
+    }
+    @bottom-center {
+        content: "Seite " counter(page) " von " counter(pages);
+        font-size: 10pt;
+        color: #666;
+    }
+}
+
+body {
+    font-family: 'Helvetica Neue', Arial, sans-serif;
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #333;
+}
+
+h1 {
+    font-size: 20pt;
+    font-weight: bold;
+    margin-top: 1.5em;
+    margin-bottom: 0.5em;
+    color: #1a1a1a;
+    border-bottom: 2px solid #333;
+    padding-bottom: 0.3em;
+}
+
+h2 {
+    font-size: 16pt;
+    font-weight: bold;
+    margin-top: 1.2em;
+    margin-bottom: 0.4em;
+    color: #2a2a2a;
+}
+
+h3 {
+    font-size: 13pt;
+    font-weight: bold;
+    margin-top: 1em;
+    margin-bottom: 0.3em;
+    color: #3a3a3a;
+}
+
+p {
+    margin: 0.8em 0;
+    text-align: justify;
+}
+
+ul, ol {
+    margin: 0.8em 0;
+    padding-left: 2em;
+}
+
+li {
+    margin: 0.4em 0;
+}
+
+strong {
+    font-weight: bold;
+    color: #1a1a1a;
+}
+
+em {
+    font-style: italic;
+}
+
+code {
+    font-family: 'Courier New', monospace;
+    font-size: 10pt;
+    background-color: #f5f5f5;
+    padding: 0.2em 0.4em;
+    border-radius: 3px;
+}
+
+blockquote {
+    border-left: 4px solid #ccc;
+    padding-left: 1em;
+    margin: 1em 0;
+    color: #666;
+}
+
+hr {
+    border: none;
+    border-top: 1px solid #ccc;
+    margin: 2em 0;
+}
+
+/* Legal document specific */
+.reference-number {
+    font-size: 12pt;
+    font-weight: bold;
+    color: #1a1a1a;
+    margin-bottom: 1em;
+}
+
+.disclaimer {
+    font-size: 9pt;
+    color: #666;
+    font-style: italic;
+    margin-top: 2em;
+    padding-top: 1em;
+    border-top: 1px solid #ddd;
+}
+"""
 
-        li {
-            margin: 0.4em 0;
-        }
+# Rendering state reused per thread (WeasyPrint fonts and stylesheet, Markdown converter)
+# because renders run in worker threads and Pango font maps must not be shared between threads
+_render_local = threading.local()
 
-        strong {
-            font-weight: bold;
-            color: #1a1a1a;
-        }
 
-        em {
-            font-style: italic;
-        }
+def _weasyprint_resources() -> "tuple[FontConfiguration, CSS]":
+    """Return this thread's FontConfiguration and the parsed markdown stylesheet"""
+    resources = getattr(_render_local, "resources", None)
+    if resources is None:
+        from weasyprint import CSS
+        from weasyprint.text.fonts import FontConfiguration
 
-        code {
-            font-family: 'Courier New', monospace;
-            font-size: 10pt;
-            background-color: #f5f5f5;
-            padding: 0.2em 0.4em;
-            border-radius: 3px;
-        }
+        font_config = FontConfiguration()
+        resources = (font_config, CSS(string=_MARKDOWN_CSS, font_config=font_config))
+        _render_local.resources = resources
+    return resources
 
-        blockquote {
-            border-left: 4px solid #ccc;
-            padding-left: 1em;
-            margin: 1em 0;
-            color: #666;
-        }
 
-        hr {
-            border: none;
-            border-top: 1px solid #ccc;
-            margin: 2em 0;
-        }
+def _markdown_converter() -> "md.Markdown":
+    """Return this thread's Markdown converter, reset for a new document
 
-        /* Legal document specific */
-        .reference-number {
-            font-size: 12pt;
-            font-weight: bold;
-            color: #1a1a1a;
-            margin-bottom: 1em;
-        }
+    Markdown instances keep per-document state, so like the WeasyPrint resources
+    they are reused per thread instead of loading the extensions on every call.
+    """
+    converter = getattr(_render_local, "markdown", None)
+    if converter is None:
+        import markdown as md
 
-        .disclaimer {
-            font-size: 9pt;
-            color: #666;
-            font-style: italic;
-            margin-top: 2em;
-            padding-top: 1em;
-            border-top: 1px solid #ddd;
-        }
-        """
+        converter = md.Markdown(extensions=["extra", "codehilite", "tables"])
+        _render_local.markdown = converter
+    return converter.reset()
 
-    # Custom Jinja2 filters
-    @staticmethod
-    def _default_if_empty(value, default="k. A."):
-        """Return default if value is empty or None"""
-        if value is None or (isinstance(value, str) and not value.strip()):
-            return default
-        return value
 
-    @staticmethod
-    def _format_german_date(value):
-        """Format date in German format (DD.MM.YYYY)"""
-        if isinstance(value, datetime):
-            return value.strftime("%d.%m.%Y")
-        if isinstance(value, str):
-            try:
-                dt = datetime.fromisoformat(value)
-                return dt.strftime("%d.%m.%Y")
-            except (ValueError, TypeError):
-                return value
-        return value or datetime.now().strftime("%d.%m.%Y")
+def _write_pdf(html_content: str, markdown_styles: bool = False) -> bytes:
+    """Lay out an HTML document with WeasyPrint and return the PDF bytes
 
-    @staticmethod
-    def _truncate_words(value, num_words=3):
-        """Truncate text to specified number of words"""
-        if not value:
-            return ""
-        words = str(value).split()
-        if len(words) <= num_words:
-            return value
-        return " ".join(words[:num_words]) + "..."
+    Module-level so it can also run in the PDF process pool.
 
-    @staticmethod
-    def _nl2br(value):
-        """Convert newlines to <br> tags"""
-        if not value:
-            return ""
-        return str(value).replace("\n", "<br>\n")
+    Args:
+        html_content: Complete HTML document
+        markdown_styles: Apply the legal document stylesheet for converted markdown
+
+    Returns:
+        bytes: PDF file content
+    """
+    from weasyprint import HTML
+
+    font_config, stylesheet = _weasyprint_resources()
+    stylesheets = [stylesheet] if markdown_styles else None
+    return HTML(string=html_content).write_pdf(stylesheets=stylesheets, font_config=font_config)
+
+
+@lru_cache(maxsize=1)
+def _pdf_process_pool() -> ProcessPoolExecutor:
+    """Process pool for WeasyPrint layout, created on first async render
+
+    Layout is CPU-bound Python that holds the GIL, so worker threads cannot render
+    PDFs in parallel. Workers are spawned rather than forked so they do not inherit
+    the event loop's threads and locks.
+    """
+    return ProcessPoolExecutor(
+        max_workers=settings.PDF_MAX_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+async def close_pdf_pool() -> None:
+    """Shut down the PDF process pool on application shutdown, if it was started"""
+    if _pdf_process_pool.cache_info().currsize:
+        pool = _pdf_process_pool()
+        _pdf_process_pool.cache_clear()
+        # Waiting for running renders would block the event loop
+        await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+
+
+class PDFService:
+    """Service for converting markdown/templates to PDF"""
+
+    def __init__(self):
+        """Initialize PDF service with the shared Jinja2 environment"""
+        # Templates are parsed once at import, see _create_jinja_env()
+        self.jinja_env = _JINJA_ENV
 
     def template_to_pdf(
         self,
@@ -219,33 +333,44 @@ class PDFService:
             Exception: If PDF generation fails
         """
         try:
-            # Load template
-            template = self.jinja_env.get_template(template_name)
-
-            # Get logo path (WeasyPrint needs file:// URL or base64)
-            assets_dir = Path(__file__).parent.parent / "assets"
-            logo_path = assets_dir / "sumii_logo.png"
-            logo_url = f"file://{logo_path}" if logo_path.exists() else None
-
-            # Prepare template context
-            context = {
-                "case_data": case_data,
-                "summary_id": summary_id or "SUMII-DRAFT",
-                "session_id": summary_id,
-                "generation_date": datetime.now(),
-                "template_version": "2.0",
-                "language": "de",
-                "logo_path": logo_url,
-                "is_lawyer_view": is_lawyer_view,
-            }
-
-            # Render template to HTML
-            html_content = template.render(**context)
-
-            # Convert HTML to PDF
-            font_config = FontConfiguration()
-            html_doc = HTML(string=html_content)
-            pdf_bytes = html_doc.write_pdf(font_config=font_config)
+            html_content = self._render_template(case_data, summary_id, template_name, is_lawyer_view)
+            pdf_bytes = _write_pdf(html_content)
+
+            logger.info(f"Generated PDF from template: {len(pdf_bytes)} bytes (lawyer_view={is_lawyer_view})")
+            return pdf_bytes
+
+        except Exception as e:
+            logger.error(f"Failed to generate PDF from template: {e}", exc_info=True)
+            raise Exception(f"PDF generation from template failed: {str(e)}") from e
+
+    async def template_to_pdf_async(
+        self,
+        case_data: dict,
+        summary_id: str | None = None,
+        template_name: str = "legal_case_report.html",
+        is_lawyer_view: bool = False,
+    ) -> bytes:
+        """Render Jinja2 template with case data and convert to PDF in a worker process
+
+        Same as template_to_pdf, but the WeasyPrint layout runs in the PDF process pool
+        so concurrent renders use several cores and the event loop is never blocked.
+
+        Args:
+            case_data: Dictionary with case information (see template_to_pdf)
+            summary_id: Summary UUID for reference number
+            template_name: Name of template file (default: legal_case_report.html)
+            is_lawyer_view: If True, anonymizes user personal data (name, contact)
+
+        Returns:
+            bytes: PDF file content
+
+        Raises:
+            Exception: If PDF generation fails
+        """
+        try:
+            html_content = self._render_template(case_data, summary_id, template_name, is_lawyer_view)
+            loop = asyncio.get_running_loop()
+            pdf_bytes = await loop.run_in_executor(_pdf_process_pool(), _write_pdf, html_content)
 
             logger.info(f"Generated PDF from template: {len(pdf_bytes)} bytes (lawyer_view={is_lawyer_view})")
             return pdf_bytes
@@ -254,6 +379,37 @@ class PDFService:
             logger.error(f"Failed to generate PDF from template: {e}", exc_info=True)
             raise Exception(f"PDF generation from template failed: {str(e)}") from e
 
+    def _render_template(
+        self,
+        case_data: dict,
+        summary_id: str | None,
+        template_name: str,
+        is_lawyer_view: bool,
+    ) -> str:
+        """Render the Jinja2 template to an HTML document"""
+        # Load template
+        template = self.jinja_env.get_template(template_name)
+
+        # Get logo path (WeasyPrint needs file:// URL or base64)
+        assets_dir = Path(__file__).parent.parent / "assets"
+        logo_path = assets_dir / "sumii_logo.png"
+        logo_url = f"file://{logo_path}" if logo_path.exists() else None
+
+        # Prepare template context
+        context = {
+            "case_data": case_data,
+            "summary_id": summary_id or "SUMII-DRAFT",
+            "session_id": summary_id,
+            "generation_date": datetime.now(),
+            "template_version": "2.0",
+            "language": "de",
+            "logo_path": logo_url,
+            "is_lawyer_view": is_lawyer_view,
+        }
+
+        # Render template to HTML
+        return template.render(**context)
+
     def markdown_to_pdf(self, markdown_content: str, reference_number: str | None = None) -> bytes:
         """Convert markdown to PDF bytes (legacy method)
 
@@ -268,19 +424,25 @@ class PDFService:
             Exception: If PDF generation fails
         """
         try:
-            # Convert markdown to HTML
-            html_content = md.markdown(
-                markdown_content,
-                extensions=["extra", "codehilite", "tables"],
-            )
-
-            # Add reference number if provided
-            if reference_number:
-                reference_html = f'<div class="reference-number">Aktenzeichen: {reference_number}</div>'
-                html_content = reference_html + "\n\n" + html_content
-
-            # Wrap in full HTML document
-            full_html = f"""
+            return _write_pdf(self._markdown_html(markdown_content, reference_number), markdown_styles=True)
+
+        except Exception as e:
+            logger.error(f"Failed to generate PDF: {e}", exc_info=True)
+            raise Exception(f"PDF generation failed: {str(e)}") from e
+
+    @staticmethod
+    def _markdown_html(markdown_content: str, reference_number: str | None) -> str:
+        """Convert markdown to a complete HTML document"""
+        # Convert markdown to HTML
+        html_content = _markdown_converter().convert(markdown_content)
+
+        # Add reference number if provided
+        if reference_number:
+            reference_html = f'<div class="reference-number">Aktenzeichen: {reference_number}</div>'
+            html_content = reference_html + "\n\n" + html_content
+
+        # Wrap in full HTML document
+        return f"""
             <!DOCTYPE html>
             <html>
             <head>
@@ -292,17 +454,3 @@ class PDFService:
             </body>
             </html>
             """
-
-            # Convert HTML to PDF
-            font_config = FontConfiguration()
-            html_doc = HTML(string=full_html)
-            pdf_bytes = html_doc.write_pdf(
-                stylesheets=[CSS(string=self.css_style)],
-                font_config=font_config,
-            )
-
-            return pdf_bytes
-
-        except Exception as e:
-            logger.error(f"Failed to generate PDF: {e}", exc_info=True)
-            raise Exception(f"PDF generation failed: {str(e)}") from e
@@ -30,6 +30,31 @@ EXPO_PUSH_URL = "https://exp.host/--/api/v2/push/send"
 class PushService:
     """Send push notifications via Expo Push API"""
 
+    def __init__(self):
+        """Initialize push service; the HTTP client is created on first send"""
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for the Expo Push API, shared by all notifications
+
+        Pooled keep-alive connections (multiplexed over HTTP/2) spare each notification
+        the TCP and TLS handshake with exp.host.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (a new one is created if sending again)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def send_notification(
         self,
         push_token: str,
@@ -70,40 +95,36 @@ class PushService:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    EXPO_PUSH_URL,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10.0,
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    data_result = result.get("data", {})
-
-                    # Check if Expo reported success
-                    if data_result.get("status") == "ok":
-                        logger.info(f"Push notification sent: {title}")
-                        return True
-
-                    # Handle known error types gracefully
-                    error_type = data_result.get("details", {}).get("error", "")
-                    if error_type == "DeviceNotRegistered":
-                        logger.info(
-                            f"Push token not registered (device may have uninstalled app): {push_token[:30]}..."
-                        )
-                        # Don't log as error - this is normal when devices uninstall
-                        return False
-                    elif error_type == "InvalidCredentials":
-                        logger.error("Expo push credentials are invalid")
-                        return False
-                    else:
-                        logger.warning(f"Expo push returned error: {data_result.get('message', result)}")
-                        return False
+            response = await self.client.post(
+                EXPO_PUSH_URL,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                data_result = result.get("data", {})
+
+                # Check if Expo reported success
+                if data_result.get("status") == "ok":
+                    logger.info(f"Push notification sent: {title}")
+                    return True
+
+                # Handle known error types gracefully
+                error_type = data_result.get("details", {}).get("error", "")
+                if error_type == "DeviceNotRegistered":
+                    logger.info(f"Push token not registered (device may have uninstalled app): {push_token[:30]}...")
+                    # Don't log as error - this is normal when devices uninstall
+                    return False
+                elif error_type == "InvalidCredentials":
+                    logger.error("Expo push credentials are invalid")
+                    return False
                 else:
-                    logger.error(f"Expo push failed: {response.status_code} - {response.text}")
+                    logger.warning(f"Expo push returned error: {data_result.get('message', result)}")
                     return False
+            else:
+                logger.error(f"Expo push failed: {response.status_code} - {response.text}")
+                return False
 
         except httpx.TimeoutException:
             logger.error("Expo push timed out")
@@ -144,3 +165,8 @@ class PushService:
 
 # Singleton instance
 push_service = PushService()
+
+
+async def close_push_service() -> None:
+    """Close the singleton's HTTP client on application shutdown"""
+    await push_service.aclose()
@@ -1,12 +1,22 @@
 """Storage Service - Handle file uploads and downloads to object/blob storage (AWS S3)"""
 
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta
 from uuid import UUID
 
 import boto3
 from botocore.exceptions import ClientError
 
+# Pre-signed URLs shared by all StorageService instances, keyed by (bucket, key, expiration_days).
+# A URL is only reused within an hour of signing, so callers always get (nearly) the full lifetime.
+PRESIGNED_URL_REUSE_WINDOW = timedelta(hours=1)
+MAX_CACHED_PRESIGNED_URLS = 4096
+_presigned_urls: OrderedDict[tuple[str, str, int], tuple[str, float]] = OrderedDict()
+_presigned_urls_lock = threading.Lock()
+
 
 class StorageService:
     """Service for handling object/blob storage operations (AWS S3)
@@ -118,18 +128,39 @@ class StorageService:
             expiration_days: URL expiration in days (default: 7)
 
         Returns:
-            Pre-signed URL string
+            Pre-signed URL string (reused for up to PRESIGNED_URL_REUSE_WINDOW after signing)
         """
+        cache_key = (self.bucket_name, s3_key, expiration_days)
+        now = time.monotonic()
+        with _presigned_urls_lock:
+            cached = _presigned_urls.get(cache_key)
+            if cached and cached[1] > now:
+                _presigned_urls.move_to_end(cache_key)
+                return cached[0]
+
+        expiration = timedelta(days=expiration_days)
         try:
             url = self.s3_client.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": self.bucket_name, "Key": s3_key},
-                ExpiresIn=int(timedelta(days=expiration_days).total_seconds()),
+                ExpiresIn=int(expiration.total_seconds()),
             )
-            return url
         except ClientError as e:
             raise Exception(f"Failed to generate pre-signed URL: {e}")
 
+        with _presigned_urls_lock:
+            _presigned_urls[cache_key] = (url, now + min(PRESIGNED_URL_REUSE_WINDOW, expiration).total_seconds())
+            _presigned_urls.move_to_end(cache_key)
+            if len(_presigned_urls) > MAX_CACHED_PRESIGNED_URLS:
+                _presigned_urls.popitem(last=False)
+        return url
+
+    def _forget_presigned_urls(self, s3_keys: set[str]) -> None:
+        """Drop cached pre-signed URLs of deleted objects"""
+        with _presigned_urls_lock:
+            for cache_key in [key for key in _presigned_urls if key[0] == self.bucket_name and key[1] in s3_keys]:
+                del _presigned_urls[cache_key]
+
     def delete_object(self, s3_key: str) -> None:
         """Delete object from S3
 
@@ -140,6 +171,7 @@ class StorageService:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
         except ClientError as e:
             raise Exception(f"Failed to delete S3 object: {e}")
+        self._forget_presigned_urls({s3_key})
 
     def delete_user_data(self, user_id: UUID) -> None:
         """Delete all user data from S3 (GDPR compliance)
@@ -161,6 +193,7 @@ class StorageService:
                 # Delete all objects
                 objects_to_delete = [{"Key": obj["Key"]} for obj in response["Contents"]]
                 self.s3_client.delete_objects(Bucket=self.bucket_name, Delete={"Objects": objects_to_delete})
+                self._forget_presigned_urls({obj["Key"] for obj in objects_to_delete})
         except ClientError as e:
             raise Exception(f"Failed to delete user data from S3: {e}")
 
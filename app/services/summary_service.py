@@ -11,10 +11,22 @@ from mistralai import Mistral
 
 from app.config import settings
 from app.models import Conversation, Message, MessageRole
+from app.schemas.summary import SummaryFunctionArguments
 from app.services.agents import MistralAgentsService
+from app.services.agents.tools.function_schemas import SUMMARY_GENERATION_ENUMS
 
 logger = logging.getLogger(__name__)
 
+# Earlier assistant turns are cut to this many characters in the summary agent's input
+ASSISTANT_TURN_CONTEXT_CHARS = 300
+
+
+def _shorten(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, marking the cut with an ellipsis"""
+    if len(text) <= limit:
+        return text
+    return text[: limit - 1].rstrip() + "…"
+
 
 class SummaryService:
     """Service for generating legal summaries"""
@@ -101,6 +113,9 @@ class SummaryService:
     def _build_conversation_context(self, conversation: Conversation) -> str:
         """Build conversation context string from messages
 
+        The transcript is compacted before the handoff to the Summary Agent (see below),
+        which keeps its prefill small without dropping any user-provided facts.
+
         Args:
             conversation: Conversation model with messages
 
@@ -114,10 +129,21 @@ class SummaryService:
             "Konversationsverlauf:",
         ]
 
-        # Add all messages
-        for message in conversation.messages:
-            role_label = "Benutzer" if message.role == MessageRole.USER else "Assistent"
-            context_parts.append(f"{role_label}: {message.content}")
+        # Add messages compacted for the summary handoff: the user's turns carry the facts and
+        # are kept verbatim, as is the final assistant turn (the wrap-up recap the user
+        # confirmed). Earlier assistant turns are mostly questions and interim recaps, so
+        # they are shortened to keep the question/answer pairing without re-sending recaps.
+        messages = [m for m in conversation.messages if m.agent_name != "summary"]
+        last_assistant_index = max(
+            (index for index, message in enumerate(messages) if message.role != MessageRole.USER), default=-1
+        )
+        for index, message in enumerate(messages):
+            if message.role == MessageRole.USER:
+                context_parts.append(f"Benutzer: {message.content}")
+            elif index == last_assistant_index:
+                context_parts.append(f"Assistent: {message.content}")
+            else:
+                context_parts.append(f"Assistent: {_shorten(message.content, ASSISTANT_TURN_CONTEXT_CHARS)}")
 
         # Add 5W facts if available
         if conversation.who or conversation.what or conversation.when or conversation.where or conversation.why:
@@ -143,6 +169,23 @@ class SummaryService:
 
         return "\n".join(context_parts)
 
+    @staticmethod
+    def _parse_summary_arguments(arguments: str | dict) -> SummaryFunctionArguments:
+        """Validate generate_summary arguments
+
+        Args:
+            arguments: Raw JSON string from the function call (or an already decoded dict)
+
+        Returns:
+            SummaryFunctionArguments: Parsed arguments
+
+        Raises:
+            pydantic.ValidationError: If the arguments are not valid JSON or have wrong types
+        """
+        if isinstance(arguments, str | bytes):
+            return SummaryFunctionArguments.model_validate_json(arguments)
+        return SummaryFunctionArguments.model_validate(arguments)
+
     def _extract_summary_from_response(self, response) -> tuple[str, dict, dict]:
         """Extract markdown, metadata, and structured data from Mistral agent response
 
@@ -178,19 +221,11 @@ class SummaryService:
                     if output.type == "function.call" or str(output.type) == "function.call":
                         if hasattr(output, "name") and output.name == "generate_summary":
                             if hasattr(output, "arguments"):
-                                args = output.arguments
-                                if isinstance(args, str):
-                                    args = json.loads(args)
-                                markdown_content = args.get("markdown_content", "")
-                                metadata = args.get("metadata", {})
+                                args = self._parse_summary_arguments(output.arguments)
+                                markdown_content = args.markdown_content
+                                metadata = args.metadata
                                 # Extract structured data for PDF template
-                                structured_data = {
-                                    "claimant": args.get("claimant", {}),
-                                    "respondent": args.get("respondent", {}),
-                                    "factual_narrative": args.get("factual_narrative", {}),
-                                    "evidence": args.get("evidence", {}),
-                                    "financial_info": args.get("financial_info", {}),
-                                }
+                                structured_data = args.structured_case_data()
                                 logger.info(f"Extracted summary from function call: {len(markdown_content)} chars")
 
                 # Check for message output with content
@@ -206,18 +241,10 @@ class SummaryService:
                 if hasattr(entry, "type") and entry.type == "function.call":
                     if hasattr(entry, "name") and entry.name == "generate_summary":
                         if hasattr(entry, "arguments"):
-                            args = entry.arguments
-                            if isinstance(args, str):
-                                args = json.loads(args)
-                            markdown_content = args.get("markdown_content", "")
-                            metadata = args.get("metadata", {})
-                            structured_data = {
-                                "claimant": args.get("claimant", {}),
-                                "respondent": args.get("respondent", {}),
-                                "factual_narrative": args.get("factual_narrative", {}),
-                                "evidence": args.get("evidence", {}),
-                                "financial_info": args.get("financial_info", {}),
-                            }
+                            args = self._parse_summary_arguments(entry.arguments)
+                            markdown_content = args.markdown_content
+                            metadata = args.metadata
+                            structured_data = args.structured_case_data()
 
         # Method 3: Try output_as_text property
         if not markdown_content and hasattr(response, "output_as_text"):
@@ -264,6 +291,12 @@ class SummaryService:
         # Remove case_strength if present (deprecated)
         metadata.pop("case_strength", None)
 
+        # Drop values outside the schema's enums so callers fall back to their defaults
+        for field, allowed_values in SUMMARY_GENERATION_ENUMS.items():
+            if field in metadata and metadata[field] not in allowed_values:
+                logger.warning(f"Ignoring invalid summary metadata {field}={metadata[field]!r}")
+                del metadata[field]
+
         return markdown_content, metadata, structured_data
 
 
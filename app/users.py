@@ -55,24 +55,24 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
 
     async def on_after_register(self, user: User, request: Request | None = None):
         """Called after user registration - sends welcome email"""
-        from app.services.email_service import EmailService
+        from app.services.email_service import get_email_service
 
-        email_service = EmailService()
+        email_service = get_email_service()
         # Pass user's preferred language for localized email
         await email_service.send_welcome_email(user.email, language=user.language or "de")
 
     async def on_after_forgot_password(self, user: User, token: str, request: Request | None = None):
         """Send password reset email via AWS SES"""
-        from app.services.email_service import EmailService
+        from app.services.email_service import get_email_service
 
-        email_service = EmailService()
+        email_service = get_email_service()
         await email_service.send_password_reset_email(user.email, token)
 
     async def on_after_request_verify(self, user: User, token: str, request: Request | None = None):
         """Send email verification link via AWS SES"""
-        from app.services.email_service import EmailService
+        from app.services.email_service import get_email_service
 
-        email_service = EmailService()
+        email_service = get_email_service()
         await email_service.send_verification_email(user.email, token)
 
 
@@ -0,0 +1,99 @@
+"""Partial JSON decoding - Read a string field while its JSON is still streaming
+
+Mistral streams function call arguments as raw JSON fragments. For large string
+fields (e.g. the summary's markdown_content) we want to forward text to the client
+as it arrives instead of waiting for the complete, parseable argument object.
+"""
+
+import json
+import re
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+class StreamingStringField:
+    """Incrementally decode one string field from streamed JSON fragments
+
+    Only the first occurrence of the key is tracked, which is sufficient for
+    top-level fields with unique names.
+
+    Example:
+        >>> field = StreamingStringField("markdown_content")
+        >>> field.feed('{"markdown_content": "# Fall')
+        '# Fall'
+        >>> field.feed('zusammenfassung", "metadata": {}}')
+        'zusammenfassung'
+    """
+
+    def __init__(self, field_name: str):
+        """Initialize extractor for a single field
+
+        Args:
+            field_name: JSON key whose string value should be streamed
+        """
+        self._key_pattern = re.compile(re.escape(json.dumps(field_name)) + r'\s*:\s*"')
+        self._buffer = ""
+        self._position: int | None = None
+        self.done = False
+
+    def feed(self, fragment: str) -> str:
+        """Add a fragment and return newly decoded text of the field
+
+        Args:
+            fragment: Next chunk of the JSON document
+
+        Returns:
+            str: Decoded text that became available with this fragment (may be empty)
+        """
+        if self.done or not fragment:
+            return ""
+
+        self._buffer += fragment
+
+        if self._position is None:
+            match = self._key_pattern.search(self._buffer)
+            if not match:
+                return ""
+            self._position = match.end()
+
+        start = self._position
+        end = self._scan(start)
+        self._position = end
+        if end == start:
+            return ""
+        return json.loads(f'"{self._buffer[start:end]}"')
+
+    def _scan(self, index: int) -> int:
+        """Advance over complete characters of the string value
+
+        Stops before an incomplete escape sequence (including a split surrogate
+        pair) and marks the field done at the closing quote.
+        """
+        buffer = self._buffer
+        length = len(buffer)
+        while index < length:
+            char = buffer[index]
+            if char == '"':
+                self.done = True
+                return index
+            if char != "\\":
+                index += 1
+                continue
+
+            if index + 1 >= length:
+                return index
+            if buffer[index + 1] != "u":
+                index += 2
+                continue
+
+            escape = buffer[index + 2 : index + 6]
+            if len(escape) < 4 or not _HEX_DIGITS.issuperset(escape):
+                return index
+            # A high surrogate must be decoded together with its low surrogate
+            if 0xD800 <= int(escape, 16) <= 0xDBFF:
+                if index + 12 > length:
+                    return index
+                index += 12
+            else:
+                index += 6
+        return index
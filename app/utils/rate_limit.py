@@ -0,0 +1,44 @@
+"""Rate limiting - Keep concurrent API calls within a provider's request rate
+
+Concurrent callers (e.g. OCR of several documents at once) would otherwise burst
+past Mistral's requests-per-second limit and spend their time on 429 retries.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket that limits how many requests start per second
+
+    Waiting callers are served in arrival order.
+
+    Example:
+        >>> limiter = AsyncRateLimiter(requests_per_second=5)
+        >>> await limiter.acquire()  # returns once a request may be sent
+    """
+
+    def __init__(self, requests_per_second: float, burst: int | None = None):
+        """Initialize limiter with a full bucket
+
+        Args:
+            requests_per_second: Sustained request rate
+            burst: Requests that may start at once (default: one second's worth, at least 1)
+        """
+        self.rate = requests_per_second
+        self.capacity = burst or max(1, int(requests_per_second))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and take its token"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -24,8 +24,8 @@ echo "✅ Migrations complete!"
 PORT="${PORT:-8000}"
 if [ "$ENVIRONMENT" = "dev" ] || [ "$ENVIRONMENT" = "development" ]; then
     echo "🎯 Starting uvicorn server (development with hot-reload)..."
-    exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT" --reload
+    exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT" --loop uvloop --reload
 else
     echo "🎯 Starting uvicorn server (production)..."
-    exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT"
+    exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT" --loop uvloop
 fi
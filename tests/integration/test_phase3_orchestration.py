@@ -84,7 +84,7 @@ async def test_orchestrator_routing():
         current_agent="router",
         # All metadata fields are None/False by default
     )
-    agent = await orchestrator.determine_next_agent(conversation)
+    agent = orchestrator.determine_next_agent(conversation)
     assert agent == "intake", f"Expected 'intake', got '{agent}'"
     print_success(f"Routed to: {agent}")
     print_info("Reason: No facts collected yet")
@@ -97,7 +97,7 @@ async def test_orchestrator_routing():
     conversation.where = {"collected": True, "location": "Berlin", "jurisdiction": "Berlin"}
     conversation.why = {"collected": True, "desired_outcome": "Rent reduction"}
     conversation.analysis_done = False
-    agent = await orchestrator.determine_next_agent(conversation)
+    agent = orchestrator.determine_next_agent(conversation)
     assert agent == "reasoning", f"Expected 'reasoning', got '{agent}'"
     print_success(f"Routed to: {agent}")
     print_info("Reason: All 5W facts collected, analysis not done")
@@ -106,7 +106,7 @@ async def test_orchestrator_routing():
     print_test(3, "Analysis complete → Should route to Summary Agent")
     conversation.analysis_done = True
     conversation.summary_generated = False
-    agent = await orchestrator.determine_next_agent(conversation)
+    agent = orchestrator.determine_next_agent(conversation)
     assert agent == "summary", f"Expected 'summary', got '{agent}'"
     print_success(f"Routed to: {agent}")
     print_info("Reason: Legal analysis complete, summary not generated")
@@ -114,7 +114,7 @@ async def test_orchestrator_routing():
     # Test 4: Summary generated
     print_test(4, "Summary generated → Should route to Router Agent")
     conversation.summary_generated = True
-    agent = await orchestrator.determine_next_agent(conversation)
+    agent = orchestrator.determine_next_agent(conversation)
     assert agent == "router", f"Expected 'router', got '{agent}'"
     print_success(f"Routed to: {agent}")
     print_info("Reason: Conversation complete, handle follow-up questions")
@@ -134,7 +134,7 @@ async def test_orchestrator_routing():
         analysis_done=False,
         summary_generated=False,
     )
-    agent = await orchestrator.determine_next_agent(conversation2)
+    agent = orchestrator.determine_next_agent(conversation2)
     assert agent == "intake", f"Expected 'intake', got '{agent}'"
     print_success(f"Routed to: {agent}")
     print_info("Reason: Missing 'why' fact (desired outcome)")
@@ -193,7 +193,7 @@ async def test_conversation_state_updates():
         "why": {"desired_outcome": "Rent reduction"},
     }
 
-    await orchestrator.update_conversation_state(conversation, "intake", facts)
+    orchestrator.update_conversation_state(conversation, "intake", facts)
 
     # Verify facts were set with "collected": True
     assert conversation.who.get("collected") is True, "WHO fact not marked as collected"
@@ -209,14 +209,14 @@ async def test_conversation_state_updates():
     # Test 2: Reasoning Agent sets analysis_done
     print_test(2, "Reasoning Agent → Should set analysis_done = True")
     conversation.analysis_done = False
-    await orchestrator.update_conversation_state(conversation, "reasoning", None)
+    orchestrator.update_conversation_state(conversation, "reasoning", None)
     assert conversation.analysis_done is True, "analysis_done not set"
     print_success("analysis_done = True")
 
     # Test 3: Summary Agent sets summary_generated
     print_test(3, "Summary Agent → Should set summary_generated = True")
     conversation.summary_generated = False
-    await orchestrator.update_conversation_state(conversation, "summary", None)
+    orchestrator.update_conversation_state(conversation, "summary", None)
     assert conversation.summary_generated is True, "summary_generated not set"
     print_success("summary_generated = True")
 
@@ -285,7 +285,7 @@ async def test_integration_with_backend():
         conversation = result.scalar_one()
 
         orchestrator = ConversationOrchestrator()
-        agent = await orchestrator.determine_next_agent(conversation)
+        agent = orchestrator.determine_next_agent(conversation)
 
         assert agent == "intake", f"Expected 'intake', got '{agent}'"
         print_success(f"Orchestrator correctly routes to: {agent}")
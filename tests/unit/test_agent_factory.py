@@ -0,0 +1,158 @@
+"""Unit Tests for AgentFactory
+
+Tests agent lookup and create/update decisions against a mocked Mistral client.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.agents import utils
+from app.services.agents.utils import AgentFactory
+
+pytestmark = pytest.mark.unit
+
+
+def _agent(agent_id: str, name: str, description: str = "") -> SimpleNamespace:
+    return SimpleNamespace(id=agent_id, name=name, description=description)
+
+
+@pytest.fixture(autouse=True)
+def _empty_agent_id_cache(monkeypatch):
+    monkeypatch.setattr(utils, "_agent_ids_by_config", {})
+
+
+@pytest.fixture
+def factory():
+    factory = AgentFactory()
+    factory.__dict__["client"] = MagicMock()
+    return factory
+
+
+class TestAgentListingCache:
+    """Test that the agent listing is fetched once per factory"""
+
+    def test_existing_agents_share_one_listing(self, factory):
+        """Test that consecutive lookups reuse the cached listing"""
+        factory.client.beta.agents.list.return_value = [_agent("ag-1", "Intake Agent"), _agent("ag-2", "Summary Agent")]
+        factory.client.beta.agents.update.side_effect = lambda agent_id, **kwargs: _agent(agent_id, "unused")
+
+        assert factory.create_agent("m", "Intake Agent", "d", "i") == "ag-1"
+        assert factory.create_agent("m", "Summary Agent", "d", "i") == "ag-2"
+
+        factory.client.beta.agents.list.assert_called_once()
+
+    def test_created_agent_is_added_to_listing(self, factory):
+        """Test that a new agent is found without another listing"""
+        factory.client.beta.agents.list.return_value = []
+        factory.client.beta.agents.create.return_value = _agent("ag-new", "Wrap-Up Agent")
+
+        assert factory.create_agent("m", "Wrap-Up Agent", "d", "i") == "ag-new"
+        assert factory._find_agent("Wrap-Up Agent").id == "ag-new"
+
+        factory.client.beta.agents.list.assert_called_once()
+
+    def test_unchanged_agent_is_not_updated(self, factory):
+        """Test that a matching configuration hash skips the update"""
+        config_hash = factory._compute_hash("i", "d", [])
+        factory.client.beta.agents.list.return_value = [_agent("ag-1", "Intake Agent", f"[{config_hash}] d")]
+
+        assert factory.create_agent("m", "Intake Agent", "d", "i") == "ag-1"
+
+        factory.client.beta.agents.update.assert_not_called()
+        factory.client.beta.agents.create.assert_not_called()
+
+    def test_identical_remote_configuration_is_not_updated(self, factory):
+        """Test that an agent without hash prefix but identical fields is left alone"""
+        remote = _agent("ag-1", "Wrap-Up Agent", "d")
+        remote.instructions = "i"
+        remote.tools = []
+        factory.client.beta.agents.list.return_value = [remote]
+
+        assert factory.create_agent("m", "Wrap-Up Agent", "d", "i") == "ag-1"
+
+        factory.client.beta.agents.update.assert_not_called()
+
+    def test_duplicate_names_resolve_to_first_agent(self, factory):
+        """Test that the name index keeps the first listed agent, like the former scan"""
+        factory.client.beta.agents.list.return_value = [
+            _agent("ag-1", "Intake Agent"),
+            _agent("ag-2", "Intake Agent"),
+            _agent("ag-3", "Summary Agent"),
+        ]
+
+        assert factory._find_agent("Intake Agent").id == "ag-1"
+        assert factory._find_agent("Summary Agent").id == "ag-3"
+        factory.client.beta.agents.list.assert_called_once()
+
+    def test_invalidate_refetches_listing(self, factory):
+        """Test that invalidate() drops the cached listing"""
+        factory.client.beta.agents.list.return_value = [_agent("ag-1", "Intake Agent")]
+
+        factory._find_agent("Intake Agent")
+        factory.invalidate()
+        factory._find_agent("Intake Agent")
+
+        assert factory.client.beta.agents.list.call_count == 2
+
+
+class TestPersistedAgentIds:
+    """Test reuse of agent IDs recorded by an earlier process"""
+
+    def test_warm_start_skips_mistral(self, factory, monkeypatch, tmp_path):
+        """Test that an unchanged agent is resolved from the ID file without API calls"""
+        monkeypatch.setattr(utils.settings, "AGENT_ID_CACHE_PATH", str(tmp_path / "agents.json"))
+        factory.client.beta.agents.list.return_value = []
+        factory.client.beta.agents.create.return_value = _agent("ag-new", "Intake Agent")
+        factory.create_agent("m", "Intake Agent", "d", "i")
+
+        monkeypatch.setattr(utils, "_agent_ids_by_config", {})
+        restarted = AgentFactory()
+        restarted.__dict__["client"] = MagicMock()
+
+        assert restarted.create_agent("m", "Intake Agent", "d", "i") == "ag-new"
+        restarted.client.beta.agents.list.assert_not_called()
+
+    def test_changed_configuration_ignores_recorded_id(self, factory, monkeypatch, tmp_path):
+        """Test that a prompt change falls through to the Mistral lookup"""
+        monkeypatch.setattr(utils.settings, "AGENT_ID_CACHE_PATH", str(tmp_path / "agents.json"))
+        factory.client.beta.agents.list.return_value = []
+        factory.client.beta.agents.create.return_value = _agent("ag-new", "Intake Agent")
+        factory.create_agent("m", "Intake Agent", "d", "i")
+
+        factory.client.beta.agents.update.return_value = _agent("ag-new", "Intake Agent")
+
+        assert factory.create_agent("m", "Intake Agent", "d", "changed instructions") == "ag-new"
+        factory.client.beta.agents.update.assert_called_once()
+
+    def test_other_workspace_ignores_recorded_id(self, factory, monkeypatch, tmp_path):
+        """Test that an ID recorded with another API key is not reused"""
+        monkeypatch.setattr(utils.settings, "AGENT_ID_CACHE_PATH", str(tmp_path / "agents.json"))
+        factory.client.beta.agents.list.return_value = []
+        factory.client.beta.agents.create.return_value = _agent("ag-staging", "Intake Agent")
+        factory.create_agent("m", "Intake Agent", "d", "i")
+
+        monkeypatch.setattr(utils.settings, "MISTRAL_API_KEY", "other-key")
+        monkeypatch.setattr(utils, "_agent_ids_by_config", {})
+        other = AgentFactory()
+        other.__dict__["client"] = MagicMock()
+        other.client.beta.agents.list.return_value = []
+        other.client.beta.agents.create.return_value = _agent("ag-prod", "Intake Agent")
+
+        assert other.create_agent("m", "Intake Agent", "d", "i") == "ag-prod"
+        other.client.beta.agents.create.assert_called_once()
+
+    def test_forget_agent_ids_falls_through_to_lookup(self, factory, monkeypatch, tmp_path):
+        """Test that forgotten IDs are looked up in Mistral again"""
+        monkeypatch.setattr(utils.settings, "AGENT_ID_CACHE_PATH", str(tmp_path / "agents.json"))
+        factory.client.beta.agents.list.return_value = []
+        factory.client.beta.agents.create.return_value = _agent("ag-deleted", "Intake Agent")
+        factory.create_agent("m", "Intake Agent", "d", "i")
+
+        utils.forget_agent_ids()
+        factory.invalidate()
+        factory.client.beta.agents.create.return_value = _agent("ag-new", "Intake Agent")
+
+        assert factory.create_agent("m", "Intake Agent", "d", "i") == "ag-new"
+        assert utils._read_persisted_agent_ids()["Intake Agent"]["id"] == "ag-new"
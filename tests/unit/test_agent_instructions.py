@@ -0,0 +1,67 @@
+"""Unit Tests for Agent Instructions
+
+Tests that the static agent prompts stay byte-stable so agent updates and
+provider-side prompt caching are not invalidated by accidental per-run content.
+"""
+
+import hashlib
+import importlib
+import re
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+# Matches values that would change between processes (uuid4, ISO timestamps with time)
+VOLATILE_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}|\d{4}-\d{2}-\d{2}T\d{2}:\d{2}"
+)
+
+
+class TestSummaryInstructions:
+    """Test the Summary Agent instruction prefix"""
+
+    def test_instructions_identical_across_imports(self):
+        """Test that re-importing the module produces byte-identical instructions"""
+        from app.services.agents import summary
+
+        first = hashlib.sha256(summary._SUMMARY_INSTRUCTIONS.encode("utf-8")).hexdigest()
+        reloaded = importlib.reload(summary)
+        second = hashlib.sha256(reloaded._SUMMARY_INSTRUCTIONS.encode("utf-8")).hexdigest()
+
+        assert first == second
+
+    def test_instructions_contain_no_volatile_values(self):
+        """Test that no uuids or timestamps leak into the cached prefix"""
+        from app.services.agents.summary import _SUMMARY_INSTRUCTIONS
+
+        assert VOLATILE_PATTERN.search(_SUMMARY_INSTRUCTIONS) is None
+
+
+class TestInstructionBudget:
+    """Test that agent instructions stay within the prefill budget"""
+
+    @pytest.mark.parametrize(
+        ("module_name", "constant"),
+        [
+            ("router", "_ROUTER_INSTRUCTIONS"),
+            ("intake", "_INTAKE_INSTRUCTIONS"),
+            ("reasoning", "_REASONING_INSTRUCTIONS"),
+            ("summary", "_SUMMARY_INSTRUCTIONS"),
+            ("wrapup", "_WRAPUP_INSTRUCTIONS"),
+        ],
+    )
+    def test_instructions_within_token_budget(self, module_name, constant):
+        """Test that no agent prompt grows past INSTRUCTIONS_TOKEN_BUDGET"""
+        from app.services.agents.utils import INSTRUCTIONS_TOKEN_BUDGET, estimate_tokens
+
+        module = importlib.import_module(f"app.services.agents.{module_name}")
+
+        assert estimate_tokens(getattr(module, constant)) <= INSTRUCTIONS_TOKEN_BUDGET
+
+    def test_estimate_rounds_up(self):
+        """Test that partial tokens count as a full token"""
+        from app.services.agents.utils import estimate_tokens
+
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 2
@@ -0,0 +1,97 @@
+"""Unit Tests for Local Agent Routing
+
+Tests the router shortcuts that pick the entry agent without calling the
+router agent's LLM.
+"""
+
+import pytest
+
+from app.services.agents.router import classify_first_message
+
+pytestmark = pytest.mark.unit
+
+
+class TestClassifyFirstMessage:
+    """Test first-message intent classification"""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Hallo",
+            "Guten Tag, ich brauche Hilfe",
+            "Meine Heizung ist kaputt",
+            "Mir wurde gekündigt",
+            "My landlord won't fix the heating",
+            "--- BEGIN EXTRACTED CONTENT FROM 'mietvertrag.pdf' ---",
+        ],
+    )
+    def test_new_case_routes_to_intake(self, message):
+        """Test greetings, legal topics and uploads go straight to intake"""
+        assert classify_first_message(message) == "intake"
+
+    @pytest.mark.parametrize("message", ["Was kostet ein Anwalt?", "Wie funktioniert Sumii?"])
+    def test_other_messages_use_router_agent(self, message):
+        """Test that unclear messages are left to the router agent"""
+        assert classify_first_message(message) is None
+
+    def test_equivalent_openers_share_cache_entry(self):
+        """Test that case and whitespace variants hit the same cached decision"""
+        from app.services.agents.router import _classify_normalized
+
+        _classify_normalized.cache_clear()
+        classify_first_message("Hallo  Sumii")
+        classify_first_message("HALLO sumii ")
+
+        assert _classify_normalized.cache_info().hits == 1
+
+
+class TestRouteNewConversation:
+    """Test the state table for new Mistral conversations"""
+
+    def test_new_case_starts_on_intake(self):
+        """Test that an unsummarized conversation with a legal opener skips the router"""
+        from app.services.agents.router import route_new_conversation
+
+        assert route_new_conversation(False, "Meine Heizung ist kaputt") == "intake"
+
+    def test_summarized_conversation_uses_router(self):
+        """Test that follow-ups after a summary always go to the router agent"""
+        from app.services.agents.router import route_new_conversation
+
+        assert route_new_conversation(True, "Meine Heizung ist kaputt") is None
+
+
+class TestClassifyWrapupReply:
+    """Test classification of answers to the wrap-up confirmation question"""
+
+    @pytest.mark.parametrize("message", ["Ja", "Ja, stimmt alles!", "Passt so", "OK", "Looks good, thanks"])
+    def test_short_affirmations_confirm(self, message):
+        """Test that the prompt's positive signals are recognized"""
+        from app.services.agents.wrapup import classify_wrapup_reply
+
+        assert classify_wrapup_reply(message) == "confirmation"
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Das stimmt nicht",
+            "Nein, das Datum war der 3. Mai",
+            "That's not right",
+            "Ich habe noch vergessen zu erwähnen",
+            "Passt, bis auf das Datum",
+            "Ja genau, nur die Miete war 900 €",
+            "Looks good except the address",
+        ],
+    )
+    def test_corrections_win_over_affirmations(self, message):
+        """Test that correction signals are detected even next to 'stimmt' or 'right'"""
+        from app.services.agents.wrapup import classify_wrapup_reply
+
+        assert classify_wrapup_reply(message) == "correction"
+
+    @pytest.mark.parametrize("message", ["ok, und was passiert jetzt?", "Hm"])
+    def test_ambiguous_replies_are_left_to_the_agent(self, message):
+        """Test that questions and unclear replies are not classified"""
+        from app.services.agents.wrapup import classify_wrapup_reply
+
+        assert classify_wrapup_reply(message) is None
@@ -0,0 +1,190 @@
+"""Unit Tests for AnwaltService
+
+Tests lawyer profile lookups against a mocked sumii-anwalt backend.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.anwalt_service import PROFILE_FIELDS, AnwaltService, LawyerSearchParams
+
+pytestmark = pytest.mark.unit
+
+LAWYERS = [
+    {"id": 1, "full_name": "Dr. Anna Schmidt", "specialization": "Mietrecht"},
+    {"id": 2, "full_name": "Jonas Weber", "specialization": "Arbeitsrecht"},
+]
+
+
+class ChunkStream(httpx.AsyncByteStream):
+    """Response body delivered in fixed chunks"""
+
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _service(handler) -> tuple[AnwaltService, list[str]]:
+    """Create a service whose HTTP client records request paths and answers via handler"""
+    paths: list[str] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return handler(request)
+
+    service = AnwaltService()
+    service._client = httpx.AsyncClient(base_url=service.base_url, transport=httpx.MockTransport(record))
+    return service, paths
+
+
+class TestGetLawyerProfile:
+    """Test single profile lookup and caching"""
+
+    @pytest.mark.asyncio
+    async def test_uses_single_profile_endpoint_and_caches(self):
+        """Test that a profile is fetched by ID once and then served from cache"""
+        service, paths = _service(lambda request: httpx.Response(200, json=LAWYERS[0]))
+
+        assert await service.get_lawyer_profile(1) == LAWYERS[0]
+        assert await service.get_lawyer_profile(1) == LAWYERS[0]
+
+        assert paths == ["/anwalt/profiles/1"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_directory_when_endpoint_missing(self):
+        """Test that the directory is streamed once and profiles read on the way are cached"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/anwalt/profiles":
+                assert request.url.params["fields"] == ",".join(PROFILE_FIELDS)
+                return httpx.Response(200, json=LAWYERS)
+            return httpx.Response(404)
+
+        service, paths = _service(handler)
+
+        assert await service.get_lawyer_profile(2) == LAWYERS[1]
+        assert await service.get_lawyer_profile(1) == LAWYERS[0]
+
+        assert paths == ["/anwalt/profiles/2", "/anwalt/profiles"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_lawyer_returns_none(self):
+        """Test that a lawyer missing from the directory is not found, and the miss is cached"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/anwalt/profiles":
+                return httpx.Response(200, json=LAWYERS)
+            return httpx.Response(404)
+
+        service, paths = _service(handler)
+
+        assert await service.get_lawyer_profile(999) is None
+        assert await service.get_lawyer_profile(999) is None
+
+        assert paths == ["/anwalt/profiles/999", "/anwalt/profiles"]
+
+
+class TestSearchLawyers:
+    """Test lawyer search caching"""
+
+    @pytest.mark.asyncio
+    async def test_identical_searches_share_one_request(self):
+        """Test that repeated searches with nearby coordinates hit the cache"""
+        service, paths = _service(lambda request: httpx.Response(200, json=LAWYERS))
+
+        first = await service.search_lawyers("de", legal_area="Mietrecht", latitude=52.52001, longitude=13.40499)
+        second = await service.search_lawyers("de", legal_area="Mietrecht", latitude=52.52004, longitude=13.40501)
+
+        assert first == second == LAWYERS
+        assert paths == ["/anwalt/profiles"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_one_request(self):
+        """Test that identical searches in flight at the same time are coalesced"""
+        requests: list[httpx.Request] = []
+
+        async def slow_handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=LAWYERS)
+
+        service = AnwaltService()
+        service._client = httpx.AsyncClient(base_url=service.base_url, transport=httpx.MockTransport(slow_handler))
+
+        results = await asyncio.gather(*(service.search_lawyers("de", legal_area="Mietrecht") for _ in range(5)))
+
+        assert all(result == LAWYERS for result in results)
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        """Test that cancelling the first search leaves the other waiters with the result"""
+        requests: list[httpx.Request] = []
+
+        async def slow_handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=LAWYERS)
+
+        service = AnwaltService()
+        service._client = httpx.AsyncClient(base_url=service.base_url, transport=httpx.MockTransport(slow_handler))
+
+        searches = [asyncio.create_task(service.search_lawyers("de", legal_area="Mietrecht")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        searches[0].cancel()
+
+        results = await asyncio.gather(*searches, return_exceptions=True)
+
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1:] == [LAWYERS, LAWYERS]
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_filters_are_cached_separately(self):
+        """Test that other search parameters trigger a new request"""
+        service, paths = _service(lambda request: httpx.Response(200, json=LAWYERS))
+
+        await service.search_lawyers("de", legal_area="Mietrecht")
+        await service.search_lawyers("de", legal_area="Arbeitsrecht")
+
+        assert len(paths) == 2
+
+
+class TestStreamLawyers:
+    """Test incremental decoding of the lawyer directory"""
+
+    @pytest.mark.asyncio
+    async def test_yields_profiles_split_across_chunks(self):
+        """Test that profiles are decoded regardless of chunk boundaries"""
+        body = b'[{"id": 1, "full_name": "Dr. Anna Schmidt"}, {"id": 2, "full_name": "J\\u00f6rg Weber"}]'
+
+        for split in range(1, len(body)):
+            chunks = [body[:split], body[split:]]
+            service, _ = _service(lambda request, chunks=chunks: httpx.Response(200, stream=ChunkStream(chunks)))
+
+            lawyers = [lawyer async for lawyer in service.stream_lawyers("de")]
+
+            assert lawyers == [{"id": 1, "full_name": "Dr. Anna Schmidt"}, {"id": 2, "full_name": "Jörg Weber"}]
+
+
+class TestLawyerSearchParams:
+    """Test normalization of search parameters"""
+
+    def test_nearby_coordinates_are_equal(self):
+        """Test that rounded coordinates make near-identical searches one cache key"""
+        first = LawyerSearchParams.create("de", "Mietrecht", 52.52001, 13.40499, 10.0)
+        second = LawyerSearchParams.create("de", "Mietrecht", 52.52004, 13.40501, 10.0)
+
+        assert first == second
+        assert hash(first) == hash(second)
+
+    def test_query_omits_unset_values(self):
+        """Test that only given parameters are sent to sumii-anwalt"""
+        search = LawyerSearchParams.create("en", latitude=48.1372, longitude=11.5756, fields=["id", "full_name"])
+
+        assert search.to_query() == {"lang": "en", "lat": 48.137, "lng": 11.576, "fields": "id,full_name"}
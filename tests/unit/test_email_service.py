@@ -3,6 +3,8 @@
 Tests the EmailService class methods including lawyer response email.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
 pytestmark = pytest.mark.unit
@@ -47,3 +49,76 @@ class TestEmailService:
         email_service = EmailService()
         assert hasattr(email_service, "send_password_reset_email")
         assert callable(email_service.send_password_reset_email)
+
+    @pytest.mark.asyncio
+    async def test_send_does_not_wait_for_ses(self):
+        """Test that emails are handed to SES in the background"""
+        from app.services.email_service import EmailService, wait_for_pending_emails
+
+        email_service = EmailService()
+        email_service.ses_client = MagicMock()
+        email_service.ses_client.send_email.return_value = {"MessageId": "msg-1"}
+        email_service.from_email = "noreply@sumii.de"
+
+        await email_service.send_verification_email("test@example.com", "token-123")
+        email_service.ses_client.send_email.assert_not_called()
+
+        await wait_for_pending_emails()
+        email_service.ses_client.send_email.assert_called_once()
+        assert email_service.ses_client.send_email.call_args.kwargs["Destination"] == {
+            "ToAddresses": ["test@example.com"]
+        }
+
+    @pytest.mark.asyncio
+    async def test_bulk_lawyer_responses_are_batched(self, monkeypatch):
+        """Test that bulk lawyer response emails use one SES request per 50 recipients"""
+        from app.services import email_service as email_module
+        from app.services.email_service import EmailService
+
+        monkeypatch.setattr(email_module.settings, "SES_LAWYER_RESPONSE_TEMPLATE", "SumiiLawyerResponse")
+        email_service = EmailService()
+        email_service.ses_client = MagicMock()
+        email_service.ses_client.send_bulk_templated_email.return_value = {"Status": []}
+        email_service.from_email = "noreply@sumii.de"
+
+        recipients = [(f"user{i}@example.com", "Dr. Test", f"https://app.sumii.de/cases/{i}") for i in range(120)]
+        await email_service.send_bulk_lawyer_response_emails(recipients)
+
+        calls = email_service.ses_client.send_bulk_templated_email.call_args_list
+        assert [len(call.kwargs["Destinations"]) for call in calls] == [50, 50, 20]
+        email_service.ses_client.send_email.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_verification_uses_language_template(self, monkeypatch):
+        """Test that bulk verification emails use the per-language SES template"""
+        from app.services import email_service as email_module
+        from app.services.email_service import EmailService
+
+        monkeypatch.setattr(email_module.settings, "SES_VERIFICATION_TEMPLATE", "SumiiVerify")
+        email_service = EmailService()
+        email_service.ses_client = MagicMock()
+        email_service.ses_client.send_bulk_templated_email.return_value = {"Status": []}
+        email_service.from_email = "noreply@sumii.de"
+
+        await email_service.send_bulk_verification_emails([("test@example.com", "token-123")], language="en")
+
+        kwargs = email_service.ses_client.send_bulk_templated_email.call_args.kwargs
+        assert kwargs["Template"] == "SumiiVerify_en"
+        assert "token-123" in kwargs["Destinations"][0]["ReplacementTemplateData"]
+
+    @pytest.mark.asyncio
+    async def test_failed_client_creation_is_retried(self, monkeypatch):
+        """Test that a transient SES client error does not disable email for the process"""
+        from app.services import email_service as email_module
+        from app.services.email_service import EmailService
+
+        session = MagicMock()
+        session.client.side_effect = [RuntimeError("credentials unavailable"), MagicMock()]
+        monkeypatch.setattr(email_module, "_boto_session", lambda: session)
+        email_module._ses_client.cache_clear()
+
+        try:
+            assert await EmailService()._get_ses_client() is None
+            assert await EmailService()._get_ses_client() is not None
+        finally:
+            email_module._ses_client.cache_clear()
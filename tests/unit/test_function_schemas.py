@@ -0,0 +1,75 @@
+"""Unit Tests for Agent Function Schemas
+
+Tests that the shared tool schemas are read-only and convert back to the
+plain structures the Mistral SDK expects.
+"""
+
+import pytest
+
+from app.services.agents.tools.function_schemas import (
+    LEGAL_FACTS_SCHEMA,
+    SUMMARY_GENERATION_SCHEMA,
+    thaw_schema,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestFrozenSchemas:
+    """Test frozen schema views"""
+
+    def test_schema_cannot_be_mutated(self):
+        """Test that nested mappings and lists are read-only"""
+        with pytest.raises(TypeError):
+            SUMMARY_GENERATION_SCHEMA["type"] = "other"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            SUMMARY_GENERATION_SCHEMA["function"]["parameters"]["required"][0] = "other"  # type: ignore[index]
+
+    def test_thaw_returns_plain_copy(self):
+        """Test that thawing yields dicts and lists with unchanged content"""
+        schema = thaw_schema(LEGAL_FACTS_SCHEMA)
+
+        assert isinstance(schema, dict)
+        assert schema["function"]["name"] == "extract_facts"
+        witnesses = schema["function"]["parameters"]["properties"]["who"]["properties"]["witnesses"]
+        assert isinstance(witnesses["items"], dict)
+
+        schema["function"]["name"] = "changed"
+        assert LEGAL_FACTS_SCHEMA["function"]["name"] == "extract_facts"
+
+    def test_thaw_preserves_list_values(self):
+        """Test that enum and required lists come back as lists"""
+        parameters = thaw_schema(SUMMARY_GENERATION_SCHEMA)["function"]["parameters"]
+
+        assert isinstance(parameters["required"], list)
+        assert parameters["properties"]["metadata"]["properties"]["urgency"]["enum"] == ["immediate", "weeks", "months"]
+
+    def test_schema_json_is_precomputed(self):
+        """Test that module schemas return the bytes encoded at import"""
+        import json
+
+        from app.services.agents.tools.function_schemas import SUMMARY_GENERATION_SCHEMA_JSON, schema_json
+
+        assert schema_json(SUMMARY_GENERATION_SCHEMA) is SUMMARY_GENERATION_SCHEMA_JSON
+        assert json.loads(SUMMARY_GENERATION_SCHEMA_JSON) == thaw_schema(SUMMARY_GENERATION_SCHEMA)
+
+    def test_schema_json_encodes_other_tools(self):
+        """Test that tools defined elsewhere are encoded on demand"""
+        from app.services.agents.tools.function_schemas import schema_json
+
+        tool = {"type": "document_library", "library_ids": ["lib-1"]}
+
+        assert schema_json(tool) == b'{"type":"document_library","library_ids":["lib-1"]}'
+
+    def test_enum_and_required_indexes(self):
+        """Test that enum values and required fields are indexed at import"""
+        from app.services.agents.tools.function_schemas import (
+            LEGAL_FACTS_ENUMS,
+            LEGAL_FACTS_REQUIRED,
+            SUMMARY_GENERATION_ENUMS,
+        )
+
+        assert LEGAL_FACTS_REQUIRED["parameters"] == ("who", "what", "when", "where", "why")
+        assert LEGAL_FACTS_ENUMS["urgency"] == frozenset({"immediate", "weeks", "months"})
+        assert "Mietrecht" in LEGAL_FACTS_ENUMS["legal_area"]
+        assert SUMMARY_GENERATION_ENUMS["urgency"] == LEGAL_FACTS_ENUMS["urgency"]
@@ -0,0 +1,181 @@
+"""Unit Tests for OCRService
+
+Tests document text extraction against a mocked Mistral client.
+"""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import ocr_service
+from app.services.ocr_service import OCRService
+
+pytestmark = pytest.mark.unit
+
+
+class TestConcurrencyLimit:
+    """Test that concurrent uploads share the Mistral concurrency limit"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_extractions_respect_limit(self, monkeypatch):
+        """Test that at most OCR_MAX_CONCURRENCY requests are sent to Mistral at once"""
+        monkeypatch.setattr(ocr_service.settings, "OCR_MAX_CONCURRENCY", 2)
+        service = OCRService()
+        service.client = MagicMock()
+        in_flight = 0
+        peak = 0
+
+        async def fake_complete(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Text"))])
+
+        service.client.chat.complete_async = fake_complete
+
+        results = await asyncio.gather(
+            *(service.extract_text_from_bytes(b"image", "image/png", f"{i}.png") for i in range(5))
+        )
+
+        assert results == ["Text"] * 5
+        assert peak == 2
+
+
+class TestAsyncClient:
+    """Test that Mistral is called through the non-blocking SDK methods"""
+
+    @pytest.mark.asyncio
+    async def test_image_uses_async_chat(self):
+        """Test that image OCR awaits chat.complete_async"""
+        service = OCRService()
+        service.client = MagicMock()
+        choice = SimpleNamespace(message=SimpleNamespace(content="Mietvertrag"))
+        service.client.chat.complete_async = AsyncMock(return_value=SimpleNamespace(choices=[choice]))
+
+        assert await service.extract_text_from_bytes(b"image", "image/png", "scan.png") == "Mietvertrag"
+        service.client.chat.complete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pdf_uses_async_ocr(self):
+        """Test that PDF OCR awaits ocr.process_async and joins the pages"""
+        service = OCRService()
+        service.client = MagicMock()
+        pages = [SimpleNamespace(markdown="Seite 1"), SimpleNamespace(markdown="Seite 2")]
+        service.client.ocr.process_async = AsyncMock(return_value=SimpleNamespace(pages=pages))
+
+        assert await service.extract_text_from_bytes(b"%PDF", "application/pdf", "brief.pdf") == "Seite 1\n\nSeite 2"
+        service.client.ocr.process.assert_not_called()
+
+
+class TestOCRCache:
+    """Test the content-addressed cache of extracted text"""
+
+    @pytest.mark.asyncio
+    async def test_same_content_is_extracted_once(self, monkeypatch, tmp_path):
+        """Test that a re-upload under another name is served from the cache"""
+        monkeypatch.setattr(ocr_service.settings, "OCR_CACHE_DIR", str(tmp_path))
+        service = OCRService()
+        service.client = MagicMock()
+        service.client.ocr.process_async = AsyncMock(
+            return_value=SimpleNamespace(pages=[SimpleNamespace(markdown="Kündigung")])
+        )
+
+        assert await service.extract_text_from_bytes(b"%PDF", "application/pdf", "a.pdf") == "Kündigung"
+        assert await service.extract_text_from_bytes(b"%PDF", "application/pdf", "b.pdf") == "Kündigung"
+
+        service.client.ocr.process_async.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_calls_mistral(self, monkeypatch, tmp_path):
+        """Test that use_cache=False bypasses a cached result"""
+        monkeypatch.setattr(ocr_service.settings, "OCR_CACHE_DIR", str(tmp_path))
+        service = OCRService()
+        service.client = MagicMock()
+        service.client.ocr.process_async = AsyncMock(
+            return_value=SimpleNamespace(pages=[SimpleNamespace(markdown="Kündigung")])
+        )
+
+        await service.extract_text_from_bytes(b"%PDF", "application/pdf", "a.pdf")
+        await service.extract_text_from_bytes(b"%PDF", "application/pdf", "a.pdf", use_cache=False)
+
+        assert service.client.ocr.process_async.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_removed(self, monkeypatch, tmp_path):
+        """Test that text older than OCR_CACHE_MAX_AGE_HOURS is deleted instead of reused"""
+        monkeypatch.setattr(ocr_service.settings, "OCR_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(ocr_service.settings, "OCR_CACHE_MAX_AGE_HOURS", 24.0)
+        service = OCRService()
+        service.client = MagicMock()
+        service.client.ocr.process_async = AsyncMock(
+            return_value=SimpleNamespace(pages=[SimpleNamespace(markdown="Kündigung")])
+        )
+
+        await service.extract_text_from_bytes(b"%PDF", "application/pdf", "a.pdf")
+        cache_file = tmp_path / f"{ocr_service.content_digest(b'%PDF')}.json"
+        two_days_ago = time.time() - 48 * 3600
+        os.utime(cache_file, (two_days_ago, two_days_ago))
+
+        assert ocr_service._read_cached_text(cache_file) is None
+        assert not cache_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_forget_removes_entry(self, monkeypatch, tmp_path):
+        """Test that deleting a document removes its cached text"""
+        monkeypatch.setattr(ocr_service.settings, "OCR_CACHE_DIR", str(tmp_path))
+        service = OCRService()
+        service.client = MagicMock()
+        service.client.ocr.process_async = AsyncMock(
+            return_value=SimpleNamespace(pages=[SimpleNamespace(markdown="Kündigung")])
+        )
+        content_sha256 = ocr_service.content_digest(b"%PDF")
+
+        await service.extract_text_from_bytes(b"%PDF", "application/pdf", "a.pdf", content_sha256=content_sha256)
+        await ocr_service.forget_cached_text([content_sha256, None])
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestVisionFallback:
+    """Test the vision fallback for PDFs the OCR endpoint rejects"""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_sent_as_image_batches(self, monkeypatch):
+        """Test that rasterized pages are sent to the vision model at most 8 per request"""
+        monkeypatch.setattr(ocr_service, "_rasterize_pdf", lambda content, max_pages: [f"page-{i}" for i in range(10)])
+        service = OCRService()
+        service.client = MagicMock()
+        service.client.ocr.process_async = AsyncMock(side_effect=RuntimeError("unsupported"))
+        choice = SimpleNamespace(message=SimpleNamespace(content="Text"))
+        service.client.chat.complete_async = AsyncMock(return_value=SimpleNamespace(choices=[choice]))
+
+        assert await service.extract_text_from_bytes(b"%PDF", "application/pdf", "scan.pdf") == "Text\n\nText"
+
+        image_counts = [
+            sum(part["type"] == "image_url" for part in call.kwargs["messages"][0]["content"])
+            for call in service.client.chat.complete_async.await_args_list
+        ]
+        assert image_counts == [8, 2]
+
+
+class TestDocumentUrl:
+    """Test OCR of PDFs that are already stored in S3"""
+
+    @pytest.mark.asyncio
+    async def test_pdf_with_document_url_is_not_inlined(self):
+        """Test that a stored PDF is passed to Mistral by URL instead of as base64"""
+        service = OCRService()
+        service.client = MagicMock()
+        service.client.ocr.process_async = AsyncMock(return_value=SimpleNamespace(pages=[]))
+        url = "https://s3.example.com/presigned"
+
+        await service.extract_text_from_bytes(b"%PDF", "application/pdf", "brief.pdf", document_url=url)
+
+        document = service.client.ocr.process_async.await_args.kwargs["document"]
+        assert document == {"type": "document_url", "document_url": url}
@@ -0,0 +1,56 @@
+"""Unit Tests for Partial JSON Decoding
+
+Tests StreamingStringField, used to forward summary markdown while
+generate_summary arguments are still streaming.
+"""
+
+import json
+
+import pytest
+
+from app.utils.partial_json import StreamingStringField
+
+pytestmark = pytest.mark.unit
+
+
+def _feed_all(field: StreamingStringField, fragments: list[str]) -> str:
+    return "".join(field.feed(fragment) for fragment in fragments)
+
+
+class TestStreamingStringField:
+    """Test incremental extraction of a string field"""
+
+    def test_extracts_value_split_across_fragments(self):
+        """Test that text is returned as soon as each fragment arrives"""
+        field = StreamingStringField("markdown_content")
+
+        assert field.feed('{"markdown_') == ""
+        assert field.feed('content": "# Fall') == "# Fall"
+        assert field.feed("zusammenfassung") == "zusammenfassung"
+        assert field.feed('", "metadata": {"urgency": "weeks"}}') == ""
+        assert field.done
+
+    def test_matches_full_json_decode_for_every_split(self):
+        """Test escapes and non-ASCII text survive arbitrary fragment boundaries"""
+        value = 'Zeile 1\nZeile 2\t"Zitat" \\ Straße 😀 €'
+        document = json.dumps({"claimant": {"name": "Max"}, "markdown_content": value, "metadata": {}})
+
+        for split in range(1, len(document)):
+            field = StreamingStringField("markdown_content")
+            assert _feed_all(field, [document[:split], document[split:]]) == value
+
+    def test_character_by_character_stream(self):
+        """Test a stream delivering one character per fragment"""
+        value = "Mängelanzeige vom 01.12.2025 😀"
+        document = json.dumps({"markdown_content": value})
+
+        field = StreamingStringField("markdown_content")
+
+        assert _feed_all(field, list(document)) == value
+
+    def test_missing_field_returns_nothing(self):
+        """Test that other fields are ignored"""
+        field = StreamingStringField("markdown_content")
+
+        assert field.feed('{"metadata": {"legal_area": "Mietrecht"}}') == ""
+        assert not field.done
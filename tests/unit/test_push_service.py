@@ -0,0 +1,44 @@
+"""Unit Tests for PushService
+
+Tests Expo push delivery against a mocked Expo Push API.
+"""
+
+import httpx
+import pytest
+
+from app.services.push_service import PushService
+
+pytestmark = pytest.mark.unit
+
+TOKEN = "ExponentPushToken[abc123]"
+
+
+class TestPooledClient:
+    """Test that notifications share one HTTP client"""
+
+    @pytest.mark.asyncio
+    async def test_notifications_reuse_client(self):
+        """Test that consecutive notifications go through the same client"""
+        clients: set[int] = set()
+        service = PushService()
+        service._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"data": {"status": "ok"}}))
+        )
+
+        for _ in range(3):
+            assert await service.send_notification(TOKEN, "Titel", "Text")
+            clients.add(id(service.client))
+
+        assert len(clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_client(self):
+        """Test that a closed service creates a fresh client on next use"""
+        service = PushService()
+        first = service.client
+
+        await service.aclose()
+
+        assert first.is_closed
+        assert service.client is not first
+        await service.aclose()
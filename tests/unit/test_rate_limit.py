@@ -0,0 +1,39 @@
+"""Unit Tests for Rate Limiting
+
+Tests AsyncRateLimiter, used to pace concurrent Mistral OCR requests.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.utils.rate_limit import AsyncRateLimiter
+
+pytestmark = pytest.mark.unit
+
+
+class TestAsyncRateLimiter:
+    """Test token bucket pacing"""
+
+    @pytest.mark.asyncio
+    async def test_burst_starts_immediately(self):
+        """Test that requests within the burst size do not wait"""
+        limiter = AsyncRateLimiter(requests_per_second=10, burst=3)
+
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert time.monotonic() - started < 0.05
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_burst_are_paced(self):
+        """Test that concurrent callers are spread out at the configured rate"""
+        limiter = AsyncRateLimiter(requests_per_second=50, burst=1)
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        # First request uses the burst token, the other three wait 1/50 s each
+        assert time.monotonic() - started >= 0.055
@@ -0,0 +1,71 @@
+"""Unit Tests for StorageService
+
+Tests pre-signed URL caching against a mocked S3 client.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import storage_service
+from app.services.storage_service import StorageService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _empty_presigned_url_cache(monkeypatch):
+    monkeypatch.setattr(storage_service, "_presigned_urls", storage_service.OrderedDict())
+
+
+@pytest.fixture
+def service():
+    service = StorageService()
+    service.s3_client = MagicMock()
+    service.s3_client.generate_presigned_url.return_value = "https://s3.example.com/presigned"
+    return service
+
+
+class TestPresignedUrlCache:
+    """Test reuse of pre-signed URLs across requests"""
+
+    def test_same_key_is_signed_once(self, service):
+        """Test that a second instance gets the cached URL"""
+        other = StorageService()
+        other.s3_client = service.s3_client
+
+        assert service.generate_presigned_url("summaries/SUM-1.pdf") == "https://s3.example.com/presigned"
+        assert other.generate_presigned_url("summaries/SUM-1.pdf") == "https://s3.example.com/presigned"
+
+        service.s3_client.generate_presigned_url.assert_called_once()
+
+    def test_url_is_signed_again_after_reuse_window(self, service, monkeypatch):
+        """Test that a URL is not handed out once the reuse window has passed"""
+        clock = [1000.0]
+        monkeypatch.setattr(storage_service, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+        window = storage_service.PRESIGNED_URL_REUSE_WINDOW.total_seconds()
+
+        service.generate_presigned_url("summaries/SUM-1.pdf")
+        clock[0] += window - 1
+        service.generate_presigned_url("summaries/SUM-1.pdf")
+        assert service.s3_client.generate_presigned_url.call_count == 1
+
+        clock[0] += 2
+        service.generate_presigned_url("summaries/SUM-1.pdf")
+        assert service.s3_client.generate_presigned_url.call_count == 2
+
+    def test_short_expiration_is_not_reused(self, service):
+        """Test that URLs without lifetime to spare are signed every time"""
+        service.generate_presigned_url("summaries/SUM-1.pdf", expiration_days=0)
+        service.generate_presigned_url("summaries/SUM-1.pdf", expiration_days=0)
+
+        assert service.s3_client.generate_presigned_url.call_count == 2
+
+    def test_deleted_object_is_signed_again(self, service):
+        """Test that deleting an object drops its cached URL"""
+        service.generate_presigned_url("summaries/SUM-1.pdf")
+        service.delete_object("summaries/SUM-1.pdf")
+        service.generate_presigned_url("summaries/SUM-1.pdf")
+
+        assert service.s3_client.generate_presigned_url.call_count == 2
@@ -77,6 +77,7 @@ class TestSummaryGeneration:
         mock_summary_service_instance.generate_summary.return_value = (
             "# Rechtliche Zusammenfassung\n\n## 1. Sachverhalt\nTest content",
             {"legal_area": "Mietrecht", "case_strength": "strong", "urgency": "weeks"},
+            {},
         )
 
         app.dependency_overrides[get_mistral_agents_service] = override_get_mistral_agents_service
@@ -94,7 +95,7 @@ class TestSummaryGeneration:
                 def __init__(self):
                     pass
 
-                def markdown_to_pdf(self, content: str, reference_number: str = None) -> bytes:
+                async def template_to_pdf_async(self, case_data: dict, summary_id: str = None) -> bytes:
                     return b"%PDF-1.4 fake pdf"
 
             # Create a mock pdf_service module if it doesn't exist
@@ -553,3 +554,67 @@ class TestSummaryAuthorization:
             assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
         app.dependency_overrides.clear()
+
+
+class TestSummaryFunctionArguments:
+    """Test parsing of generate_summary function call arguments"""
+
+    def test_parse_from_raw_json(self):
+        """Test that raw argument JSON is validated in one pass"""
+        from app.schemas.summary import SummaryFunctionArguments
+
+        args = SummaryFunctionArguments.model_validate_json(
+            '{"markdown_content": "# Fallzusammenfassung", "claimant": {"name": "Max"}, '
+            '"metadata": {"legal_area": "Mietrecht", "urgency": "weeks"}}'
+        )
+
+        assert args.markdown_content == "# Fallzusammenfassung"
+        assert args.metadata == {"legal_area": "Mietrecht", "urgency": "weeks"}
+        assert args.structured_case_data()["claimant"] == {"name": "Max"}
+        assert args.structured_case_data()["evidence"] == {}
+
+    def test_invalid_json_raises_value_error(self):
+        """Test that malformed arguments surface as ValueError (400 in the API)"""
+        from app.schemas.summary import SummaryFunctionArguments
+
+        with pytest.raises(ValueError):
+            SummaryFunctionArguments.model_validate_json('{"markdown_content": ')
+
+
+class TestSummaryContextCompaction:
+    """Test the conversation context handed to the Summary Agent"""
+
+    def test_earlier_assistant_turns_are_shortened(self):
+        """Test that user turns and the final recap stay verbatim while earlier replies are cut"""
+        from types import SimpleNamespace
+
+        from app.services.summary_service import ASSISTANT_TURN_CONTEXT_CHARS, SummaryService
+
+        long_recap = "Zwischenstand: " + "Details " * 100
+        final_recap = "Zusammenfassung der Fakten: " + "Fakt " * 100
+        conversation = SimpleNamespace(
+            title="Heizung",
+            legal_area=LegalArea.MIETRECHT,
+            who=None,
+            what=None,
+            when=None,
+            where=None,
+            why=None,
+            messages=[
+                SimpleNamespace(role=MessageRole.USER, content="Meine Heizung ist kaputt", agent_name=None),
+                SimpleNamespace(role=MessageRole.ASSISTANT, content=long_recap, agent_name="intake_agent"),
+                SimpleNamespace(role=MessageRole.USER, content="Seit dem 30.11.2025", agent_name=None),
+                SimpleNamespace(role=MessageRole.ASSISTANT, content=final_recap, agent_name="wrap-up_agent"),
+                SimpleNamespace(role=MessageRole.ASSISTANT, content="Zusammenfassung generiert", agent_name="summary"),
+            ],
+        )
+
+        service = object.__new__(SummaryService)
+        context = service._build_conversation_context(conversation)
+
+        assert "Benutzer: Meine Heizung ist kaputt" in context
+        assert "Benutzer: Seit dem 30.11.2025" in context
+        assert f"Assistent: {final_recap}" in context
+        assert long_recap not in context
+        assert f"Assistent: {long_recap[: ASSISTANT_TURN_CONTEXT_CHARS - 1].rstrip()}…" in context
+        assert "Zusammenfassung generiert" not in context